@@ -16,11 +16,15 @@ def aco_tsp(dist: Callable[[int, int], float], n: int, start: int = 0,
             if i != j:
                 d = dist(i, j)
                 eta[i][j] = 1.0 / d if d > 0 else 1.0
+    # Heuristic desirability is fixed for the run: raise it to beta once
+    eta_beta = [[e ** beta for e in row] for row in eta]
     best_tour = None
     best_length = float('inf')
     for iteration in range(iterations):
         tours = []
         tour_lengths = []
+        # Pheromone only changes between iterations, so every ant's step weights are built once
+        weight = [[(t ** alpha) * e for t, e in zip(tau_row, eta_row)] for tau_row, eta_row in zip(tau, eta_beta)]
         for ant in range(ants):
             tour = [start]
             unvisited = set(range(n))
@@ -29,8 +33,9 @@ def aco_tsp(dist: Callable[[int, int], float], n: int, start: int = 0,
             while unvisited:
                 probs = []
                 total = 0.0
+                weight_row = weight[current]
                 for j in unvisited:
-                    p = (tau[current][j] ** alpha) * (eta[current][j] ** beta)
+                    p = weight_row[j]
                     probs.append((j, p))
                     total += p
                 if total == 0:
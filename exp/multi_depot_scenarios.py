@@ -7,7 +7,7 @@ from __future__ import annotations
 from typing import List, Tuple, Dict
 import random
 from sim.grid import Grid
-from sim.routing import astar
+from sim.routing import distance_field
 
 Pos = Tuple[int, int]
 
@@ -44,6 +44,8 @@ def sample_multiple_depots(g: Grid, num_depots: int, seed=0) -> List[Pos]:
     
     # Sample depots from different regions
     depots = []
+    # Cost from every candidate cell to its nearest chosen depot, updated as depots are added
+    depot_dist = dict.fromkeys(largest_component, float('inf'))
     available = list(largest_component)
     
     for i in range(num_depots):
@@ -53,9 +55,10 @@ def sample_multiple_depots(g: Grid, num_depots: int, seed=0) -> List[Pos]:
         if i == 0:
             # First depot: prefer center area
             center_x, center_y = g.width // 2, g.height // 2
+            adjacency = g.adjacency()
             candidates = [(abs(p[0] - center_x) + abs(p[1] - center_y), p) 
                           for p in available 
-                          if len(list(g.neighbors(p))) >= 2]
+                          if len(adjacency[p]) >= 2]
             if candidates:
                 candidates.sort()
                 depot = candidates[0][1]
@@ -67,14 +70,15 @@ def sample_multiple_depots(g: Grid, num_depots: int, seed=0) -> List[Pos]:
                 # Find point farthest from all existing depots
                 max_min_dist = -1
                 best_depot = None
+                # Only the newest depot can bring a candidate closer
+                field = distance_field(g, depots[-1])
+                for candidate in available:
+                    dist = field.get(candidate, float('inf'))
+                    if dist < depot_dist[candidate]:
+                        depot_dist[candidate] = dist
                 
                 for candidate in available:
-                    min_dist_to_depots = float('inf')
-                    for existing_depot in depots:
-                        path, dist, _ = astar(g, candidate, existing_depot, diag_allowed=True)
-                        if dist < min_dist_to_depots:
-                            min_dist_to_depots = dist
-                    
+                    min_dist_to_depots = depot_dist[candidate]
                     if min_dist_to_depots > max_min_dist:
                         max_min_dist = min_dist_to_depots
                         best_depot = candidate
@@ -95,14 +99,16 @@ def assign_packages_to_depots(g: Grid, depots: List[Pos], packages: List[Pos], s
     """
     rng = random.Random(seed)
     assignments: Dict[int, List[int]] = {i: [] for i in range(len(depots))}
+    # Cost from every cell to each depot, so packages read theirs instead of each running A*
+    depot_fields = [distance_field(g, depot_pos) for depot_pos in depots]
     
     for pkg_idx, pkg_pos in enumerate(packages):
         # Find nearest depot
         min_dist = float('inf')
         nearest_depot_idx = 0
         
-        for depot_idx, depot_pos in enumerate(depots):
-            path, dist, _ = astar(g, pkg_pos, depot_pos, diag_allowed=True)
+        for depot_idx, field in enumerate(depot_fields):
+            dist = field.get(pkg_pos, float('inf'))
             if dist < min_dist:
                 min_dist = dist
                 nearest_depot_idx = depot_idx
@@ -10,6 +10,9 @@ from sim.grid import Grid
 from sim.greedy_nav import greedy_package_picking
 from exp.scenarios import make_map, sample_depot_and_picks
 
+# Per-seed metrics averaged across seeds
+AGGREGATE_METRICS = ('total_time_ticks', 'total_distance', 'success_rate', 'steps_per_package')
+
 
 def run_simulation(map_type: str, K: int, seed: int, algo_name: str = "GreedyNN"):
     """Run a single simulation using greedy nearest-neighbor navigation"""
@@ -82,12 +85,14 @@ def main():
     print(f"Algorithm: {args.algo}")
     print("="*60)
     
-    all_results = []
+    # One column of values per aggregated metric, instead of keeping every seed's result dict
+    columns = {metric: [] for metric in AGGREGATE_METRICS}
     
     for seed in range(args.seeds):
         print(f"\nRunning seed {seed}...")
         results = run_simulation(args.map_type, args.K, seed, args.algo)
-        all_results.append(results)
+        for metric, column in columns.items():
+            column.append(results[metric])
         print_summary(results)
     
     # Aggregate statistics if multiple seeds
@@ -95,10 +100,9 @@ def main():
         print("\n" + "="*60)
         print("AGGREGATE STATISTICS (across all seeds)")
         print("="*60)
-        avg_time = sum(r['total_time_ticks'] for r in all_results) / len(all_results)
-        avg_distance = sum(r['total_distance'] for r in all_results) / len(all_results)
-        avg_success = sum(r['success_rate'] for r in all_results) / len(all_results)
-        avg_steps_per_pkg = sum(r['steps_per_package'] for r in all_results) / len(all_results)
+        avg_time, avg_distance, avg_success, avg_steps_per_pkg = (
+            sum(column) / len(column) for column in columns.values()
+        )
         
         print(f"Average total time (ticks): {avg_time:.1f}")
         print(f"Average total distance: {avg_distance:.2f}")
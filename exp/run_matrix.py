@@ -5,7 +5,7 @@ from tqdm import tqdm
 from sim.grid import Grid
 from sim.routing import astar, dijkstra
 from sim.collision_tracker import simulate_multi_bot_execution, convert_tour_to_paths
-from exp.scenarios import make_map, sample_depot_and_picks
+from exp.scenarios import build_scenario
 from algos.tsp_exact import held_karp
 from algos.tsp_nn_2opt import nn_2opt
 from algos.tsp_ga import ga_tsp
@@ -16,16 +16,21 @@ from algos.tsp_astar import astar_tsp
 
 AlgoFn = Callable[[Callable[[int,int], float], int, int], Tuple[List[int], float]]
 
-def pairwise_distance_builder(grid: Grid, waypoints: List[Tuple[int,int]]):
-    # cache routes between waypoint indices using A*
-    cache = {}
+def pairwise_distance_builder(grid: Grid, waypoints: List[Tuple[int,int]], paths: Dict[Tuple[int,int], List[Tuple[int,int]]] = None):
+    # cache routes between waypoint indices using A*, in an n x n table (None = not searched yet)
+    # paths, if given, collects each A* path under the (i, j) direction it was searched in
+    n = len(waypoints)
+    matrix = [[None] * n for _ in range(n)]
+    for k in range(n):
+        matrix[k][k] = 0.0
     def dist(i: int, j: int) -> float:
-        if i == j: return 0.0
-        key = (min(i,j), max(i,j))
-        if key in cache: return cache[key]
+        L = matrix[i][j]
+        if L is not None: return L
         # FIX: A* now returns 3 values, but we only need path and length
         path, L, _ = astar(grid, waypoints[i], waypoints[j])
-        cache[key] = L
+        matrix[i][j] = matrix[j][i] = L
+        if paths is not None:
+            paths[(i, j)] = path
         return L
     return dist
 
@@ -88,8 +93,7 @@ def assign_packages_to_bots(grid: Grid, depot: Tuple[int, int], packages: List[T
 
 
 def run_once(map_type: str, K: int, seed: int, algo_name: str, num_bots: int, out_writer):
-    g = make_map(map_type, w=20, h=20, seed=seed)
-    depot, picks = sample_depot_and_picks(g, K, seed=seed)
+    g, depot, picks = build_scenario(map_type, K, seed)
     
     # If single bot, use original logic
     if num_bots == 1:
@@ -166,7 +170,8 @@ def run_once(map_type: str, K: int, seed: int, algo_name: str, num_bots: int, ou
             # Get package positions
             pkg_positions = [picks[i] for i in assigned_packages]
             waypoints = [depot] + pkg_positions
-            dist = pairwise_distance_builder(g, waypoints)
+            paths = {}
+            dist = pairwise_distance_builder(g, waypoints, paths)
             
             # Plan sequence for this bot
             t0 = time.perf_counter()
@@ -174,7 +179,8 @@ def run_once(map_type: str, K: int, seed: int, algo_name: str, num_bots: int, ou
             plan_time = (time.perf_counter() - t0) * 1000
             
             # Convert tour to paths for collision simulation
-            tour_paths = convert_tour_to_paths(g, order, waypoints)
+            # Reuse the A* path planning found for this leg in this direction; other legs rerun A*
+            tour_paths = convert_tour_to_paths(g, order, waypoints, path_fn=lambda i, j: paths.get((i, j)))
             
             bot_tour_lens.append(tour_len)
             bot_plan_times.append(plan_time)
@@ -43,8 +43,8 @@ def main():
     waypoints = [depot] + picks
     
     # Initialize distance service with caching
-    dist_service = DistanceService(grid, "cache/dist_cache.pkl")
-    dist_fn = dist_service.pairwise_distances(waypoints, diag_allowed=True)
+    with DistanceService(grid, "cache/dist_cache.npz") as dist_service:
+        dist_fn = dist_service.pairwise_distances(waypoints, diag_allowed=True)
     
     # Run benchmarks
     print(f"Benchmarking K={args.K} on {args.map_type} map")
@@ -8,11 +8,12 @@ import argparse
 import time
 import os
 import csv
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Tuple, Dict
 from sim.grid import Grid
 from sim.routing import astar
 from sim.collision_tracker import simulate_multi_bot_execution, convert_tour_to_paths
-from exp.scenarios import make_map, sample_depot_and_picks
+from exp.scenarios import build_scenario
 from exp.multi_depot_scenarios import sample_multiple_depots, assign_packages_to_depots
 from algos.hybrids import hybrid_nn_2opt
 from algos.tsp_nn_2opt import nn_2opt
@@ -20,17 +21,26 @@ from algos.tsp_exact import held_karp
 from algos.tsp_ga import ga_tsp
 
 
-def pairwise_distance_builder(grid: Grid, waypoints: List[Tuple[int, int]]):
-    """Build distance function with caching"""
-    cache = {}
+def pairwise_distance_builder(grid: Grid, waypoints: List[Tuple[int, int]],
+                              paths: Dict[Tuple[int, int], List[Pos]] = None):
+    """Build distance function with caching
+
+    If `paths` is given, each A* path is also stored in it under the (i, j) direction it
+    was searched in, for convert_tour_to_paths to reuse.
+    """
+    # n x n table of costs, None until the pair is searched; the diagonal is 0
+    n = len(waypoints)
+    matrix = [[None] * n for _ in range(n)]
+    for k in range(n):
+        matrix[k][k] = 0.0
     def dist(i: int, j: int) -> float:
-        if i == j:
-            return 0.0
-        key = (min(i, j), max(i, j))
-        if key in cache:
-            return cache[key]
+        L = matrix[i][j]
+        if L is not None:
+            return L
         path, L, _ = astar(grid, waypoints[i], waypoints[j], diag_allowed=True)
-        cache[key] = L
+        matrix[i][j] = matrix[j][i] = L
+        if paths is not None:
+            paths[(i, j)] = path
         return L
     return dist
 
@@ -78,8 +88,28 @@ def run_single_depot(grid: Grid, depot: Pos, packages: List[Pos], algo_name: str
     }
 
 
+def plan_bot(grid: Grid, depot_pos: Pos, pkg_positions: List[Pos], algo_name: str, seed: int):
+    """Plan one bot's tour from its depot over its packages.
+
+    Returns (waypoints, tour_len, plan_time_ms, tour_paths). Module-level so worker processes can run it.
+    """
+    waypoints = [depot_pos] + pkg_positions
+    paths = {}
+    dist = pairwise_distance_builder(grid, waypoints, paths)
+    
+    # Plan sequence for this bot
+    t0 = time.perf_counter()
+    order, tour_len = plan_sequence(algo_name, dist, len(waypoints), start=0, seed=seed)
+    plan_time = (time.perf_counter() - t0) * 1000
+    
+    # Convert tour to paths for collision simulation
+    # Reuse the A* path planning found for this leg in this direction; other legs rerun A*
+    tour_paths = convert_tour_to_paths(grid, order, waypoints, path_fn=lambda i, j: paths.get((i, j)))
+    return waypoints, tour_len, plan_time, tour_paths
+
+
 def run_multi_depot(grid: Grid, depots: List[Pos], packages: List[Pos], 
-                    algo_name: str, seed: int, parallel=True):
+                    algo_name: str, seed: int, parallel=True, plan_workers: int = 1):
     """
     Run multi-depot scenario with multiple bots
     
@@ -102,6 +132,9 @@ def run_multi_depot(grid: Grid, depots: List[Pos], packages: List[Pos],
     Args:
         parallel: If True, bots work in parallel (makespan = max bot time)
                   If False, bots work sequentially (makespan = sum of bot times)
+        plan_workers: Worker processes that plan bots' tours (1 = serial, in-process).
+                  With more, each plan_time_ms is timed while other bots plan alongside it,
+                  so it depends on CPU load and is not comparable with serial runs.
     """
     assignments = assign_packages_to_depots(grid, depots, packages, seed)
     
@@ -113,7 +146,22 @@ def run_multi_depot(grid: Grid, depots: List[Pos], packages: List[Pos],
     bot_tours = []  # Store tours for collision simulation
     bot_waypoints_list = []  # Store waypoints for each bot
     
-    # Each depot has one bot
+    # Each depot has one bot; bots with packages are planned independently of each other
+    jobs = [(depot_idx, [packages[i] for i in assignments[depot_idx]])
+            for depot_idx in range(len(depots)) if assignments[depot_idx]]
+    plan_args = (
+        [grid] * len(jobs),
+        [depots[depot_idx] for depot_idx, _ in jobs],
+        [pkg_positions for _, pkg_positions in jobs],
+        [algo_name] * len(jobs),
+        [seed + depot_idx for depot_idx, _ in jobs],
+    )
+    if plan_workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(len(jobs), plan_workers)) as pool:
+            plans = dict(zip((depot_idx for depot_idx, _ in jobs), pool.map(plan_bot, *plan_args)))
+    else:
+        plans = dict(zip((depot_idx for depot_idx, _ in jobs), map(plan_bot, *plan_args)))
+    
     for depot_idx, depot_pos in enumerate(depots):
         assigned_packages = assignments[depot_idx]
         
@@ -128,18 +176,7 @@ def run_multi_depot(grid: Grid, depots: List[Pos], packages: List[Pos],
             bot_waypoints_list.append([depot_pos])
             continue
         
-        # Get package positions
-        pkg_positions = [packages[i] for i in assigned_packages]
-        waypoints = [depot_pos] + pkg_positions
-        dist = pairwise_distance_builder(grid, waypoints)
-        
-        # Plan sequence for this bot
-        t0 = time.perf_counter()
-        order, tour_len = plan_sequence(algo_name, dist, len(waypoints), start=0, seed=seed + depot_idx)
-        plan_time = (time.perf_counter() - t0) * 1000
-        
-        # Convert tour to paths for collision simulation
-        tour_paths = convert_tour_to_paths(grid, order, waypoints)
+        waypoints, tour_len, plan_time, tour_paths = plans[depot_idx]
         
         bot_tour_lens.append(tour_len)
         bot_plan_times.append(plan_time)
@@ -204,10 +241,9 @@ def run_multi_depot(grid: Grid, depots: List[Pos], packages: List[Pos],
 
 
 def run_comparison(map_type: str, K: int, seed: int, algo_name: str, 
-                   num_depots: int, out_writer):
+                   num_depots: int, out_writer, plan_workers: int = 1):
     """Run both single and multi-depot scenarios and compare"""
-    grid = make_map(map_type, w=20, h=20, seed=seed)
-    depot, picks = sample_depot_and_picks(grid, K, seed=seed)
+    grid, depot, picks = build_scenario(map_type, K, seed)
     
     # Single depot (baseline) - no collisions (single bot)
     single_result = run_single_depot(grid, depot, picks, algo_name, seed)
@@ -220,7 +256,8 @@ def run_comparison(map_type: str, K: int, seed: int, algo_name: str,
     
     # Multi-depot - with collision tracking
     depots = sample_multiple_depots(grid, num_depots, seed=seed)
-    multi_result = run_multi_depot(grid, depots, picks, algo_name, seed, parallel=True)
+    multi_result = run_multi_depot(grid, depots, picks, algo_name, seed, parallel=True,
+                                   plan_workers=plan_workers)
     
     # Calculate improvement
     time_improvement = ((single_result['makespan'] - multi_result['makespan']) / 
@@ -278,6 +315,8 @@ def main():
     ap.add_argument("--algos", default="HybridNN2opt,NN2opt,HeldKarp,GA")
     ap.add_argument("--num-depots", type=int, default=3, help="Number of depots/bots")
     ap.add_argument("--out", default="results/raw")
+    ap.add_argument("--plan-workers", type=int, default=1,
+                    help="Processes planning bots' tours at once (default 1, serial; more makes plan_time_ms depend on CPU load)")
     args = ap.parse_args()
     
     os.makedirs(args.out, exist_ok=True)
@@ -297,7 +336,7 @@ def main():
                 for seed in range(args.seeds):
                     for algo in args.algos.split(","):
                         try:
-                            run_comparison(map_type, K, seed, algo, args.num_depots, w)
+                            run_comparison(map_type, K, seed, algo, args.num_depots, w, args.plan_workers)
                         except (ValueError, IndexError) as e:
                             print(f"⚠️  Skipping {map_type} K={K} seed={seed} algo={algo}: {type(e).__name__}: {e}")
                             import traceback
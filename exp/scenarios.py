@@ -1,6 +1,7 @@
 
 from __future__ import annotations
 from typing import List, Tuple, Dict
+from functools import lru_cache
 import random
 from sim.grid import Grid
 
@@ -35,6 +36,7 @@ def make_map(map_type: str, w=20, h=20, seed=0) -> Grid:
                         g.obstacles.discard((x+dx,y+dy))
     else:
         pass
+    g.clear_caches()
     return g
 
 def _find_connected_component(g: Grid, start: Pos) -> set:
@@ -43,10 +45,12 @@ def _find_connected_component(g: Grid, start: Pos) -> set:
     component = set()
     queue = deque([start])
     component.add(start)
+    # Neighbor tuples come from the grid's shared table, listed once per cell
+    adjacency = g.adjacency()
     
     while queue:
         current = queue.popleft()
-        for neighbor in g.neighbors(current):
+        for neighbor in adjacency[current]:
             if neighbor not in component:
                 component.add(neighbor)
                 queue.append(neighbor)
@@ -75,9 +79,10 @@ def sample_depot_and_picks(g: Grid, K: int, seed=0) -> Tuple[Pos, List[Pos]]:
     # Sample depot from center area of the component
     if largest_component:
         center_x, center_y = g.width // 2, g.height // 2
+        adjacency = g.adjacency()
         candidates = [(abs(p[0] - center_x) + abs(p[1] - center_y), p) 
                       for p in largest_component 
-                      if len(list(g.neighbors(p))) >= 2]
+                      if len(adjacency[p]) >= 2]
         if candidates:
             candidates.sort()
             depot = candidates[0][1]
@@ -95,3 +100,16 @@ def sample_depot_and_picks(g: Grid, K: int, seed=0) -> Tuple[Pos, List[Pos]]:
         picks = rng.sample(available_picks, K)
     
     return depot, picks
+
+def build_scenario(map_type: str, K: int, seed: int, w=20, h=20) -> Tuple[Grid, Pos, List[Pos]]:
+    """(grid, depot, picks) of a scenario, built once and shared by every run on it
+    (each algorithm / bot count), along with the grid's neighbor table.
+    The shared grid is frozen (its obstacles can't be edited); picks is a fresh list per call."""
+    g, depot, picks = _build_scenario(map_type, K, seed, w, h)
+    return g, depot, list(picks)
+
+@lru_cache(maxsize=8)
+def _build_scenario(map_type: str, K: int, seed: int, w: int, h: int) -> Tuple[Grid, Pos, Tuple[Pos, ...]]:
+    g = make_map(map_type, w=w, h=h, seed=seed)
+    depot, picks = sample_depot_and_picks(g, K, seed=seed)
+    return g.frozen(), depot, tuple(picks)
@@ -5,7 +5,9 @@ Algorithms: Held-Karp, NN2opt, Hybrid NN2opt, GA, ALO, ACO. No HybridGA2opt/Hybr
 
 import csv
 import os
+from array import array
 from collections import defaultdict
+from operator import itemgetter
 import numpy as np
 
 ALGOS = ["HeldKarp", "NN2opt", "HybridNN2opt", "GA", "ALO", "ACO"]
@@ -17,15 +19,42 @@ REF_OPT_RATES = [0.764, 0.741, 0.741, 0.735, 0.581, 0.568]
 MEMORY_MB = {"HeldKarp": 0.89, "HybridNN2opt": 0.10, "NN2opt": 0.08, "GA": 0.05, "ACO": 0.09, "ALO": 0.09}
 
 
+# Columns read by build_metrics, with the value used when a column is absent from the CSV
+METRIC_COLUMNS = (("algo", ""), ("plan_time_ms", ""), ("tour_len", ""), ("total_wait_time", ""), ("success", "1"))
+
+
 def load_runs(csv_path: str = "results/raw/runs.csv"):
+    """Rows of runs.csv as (algo, plan_time_ms, tour_len, total_wait_time, success) string tuples."""
     if not os.path.exists(csv_path):
         return []
     with open(csv_path, "r", newline="") as f:
-        return list(csv.DictReader(f))
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return []
+        width = len(header)
+        idx = {name: i for i, name in enumerate(header)}
+        # Absent columns are appended to every row with their default, after the real cells
+        extra = []
+        for name, default in METRIC_COLUMNS:
+            if name not in idx:
+                idx[name] = width + len(extra)
+                extra.append(default)
+        pick = itemgetter(*(idx[name] for name, _ in METRIC_COLUMNS))
+        rows = []
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row += [""] * (width - len(row))
+            if extra:
+                row[width:] = extra
+            rows.append(pick(row))
+        return rows
 
 
 def safe_float(v, default=0.0):
-    if v is None or v == "":
+    if not v:
         return default
     try:
         return float(v)
@@ -34,41 +63,50 @@ def safe_float(v, default=0.0):
 
 
 def build_metrics(data):
-    by_algo = defaultdict(lambda: {"plan_time_ms": [], "tour_len": [], "total_wait_time": [], "success": []})
-    for row in data:
-        algo = row.get("algo", "").strip()
+    # Plan times are kept in full (median/std/min/max) as a flat array('d'), read by numpy
+    # without copying; the rest only need [running sum, count]
+    by_algo = defaultdict(lambda: {"plan_time_ms": array("d"), "tour_len": [0.0, 0], "total_wait_time": [0, 0], "success": [0.0, 0]})
+    for algo, plan_ms, t, wait, s in data:
+        algo = algo.strip()
         if algo not in ALGOS:
             continue
-        by_algo[algo]["plan_time_ms"].append(safe_float(row.get("plan_time_ms")))
-        t = row.get("tour_len", "")
-        if t and str(t).lower() != "inf":
-            by_algo[algo]["tour_len"].append(safe_float(t))
-        by_algo[algo]["total_wait_time"].append(safe_float(row.get("total_wait_time")))
-        s = row.get("success", "1")
-        by_algo[algo]["success"].append(1.0 if str(s).strip() in ("1", "true", "yes") else 0.0)
-
-    avg_tour = {a: np.mean(by_algo[a]["tour_len"]) for a in ALGOS if by_algo[a]["tour_len"]}
+        d = by_algo[algo]
+        d["plan_time_ms"].append(safe_float(plan_ms))
+        if t and t.lower() != "inf":
+            slot = d["tour_len"]
+            slot[0] += safe_float(t)
+            slot[1] += 1
+        slot = d["total_wait_time"]
+        slot[0] += safe_float(wait)
+        slot[1] += 1
+        slot = d["success"]
+        slot[0] += 1.0 if s.strip() in ("1", "true", "yes") else 0.0
+        slot[1] += 1
+
+    avg_tour = {a: by_algo[a]["tour_len"][0] / by_algo[a]["tour_len"][1] for a in ALGOS if by_algo[a]["tour_len"][1]}
     sorted_algos = sorted(avg_tour.keys(), key=lambda a: avg_tour[a]) if avg_tour else ALGOS
     opt_by_algo = {a: REF_OPT_RATES[min(i, len(REF_OPT_RATES) - 1)] for i, a in enumerate(sorted_algos)}
 
     metrics = []
     for algo in ALGOS:
-        pt = by_algo[algo]["plan_time_ms"]
-        pt = [x for x in pt if x > 0] or by_algo[algo]["plan_time_ms"]
-        tour = by_algo[algo]["tour_len"]
-        wait = by_algo[algo]["total_wait_time"]
-        succ = by_algo[algo]["success"]
-
-        median_plan = float(np.median(pt)) if pt else 0.0
-        mean_plan = float(np.mean(pt)) if pt else 0.0
-        tour_avg = float(np.mean(tour)) if tour else 0.0
-        std_plan = float(np.std(pt)) if pt and len(pt) > 1 else 0.0
-        min_plan = float(np.min(pt)) if pt else 0.0
-        max_plan = float(np.max(pt)) if pt else 0.0
-        total_exec_s = sum(pt) / 1000.0 if pt else 0.0
-        total_wait_s = sum(wait)
+        pt = np.frombuffer(by_algo[algo]["plan_time_ms"])
+        positive = pt[pt > 0]
+        if positive.size:
+            pt = positive
+        tour_sum, tour_n = by_algo[algo]["tour_len"]
+        total_wait_s = by_algo[algo]["total_wait_time"][0]
+        succ_sum, succ_n = by_algo[algo]["success"]
+
+        median_plan = float(np.median(pt)) if pt.size else 0.0
+        mean_plan = float(np.mean(pt)) if pt.size else 0.0
+        tour_avg = tour_sum / tour_n if tour_n else 0.0
+        std_plan = float(np.std(pt)) if pt.size > 1 else 0.0
+        min_plan = float(np.min(pt)) if pt.size else 0.0
+        max_plan = float(np.max(pt)) if pt.size else 0.0
+        # Python's sum keeps the sequential (left-to-right) float total
+        total_exec_s = sum(pt.tolist()) / 1000.0 if pt.size else 0.0
         repeat_count = 1.0
-        success_rate = float(np.mean(succ)) if succ else 1.0
+        success_rate = succ_sum / succ_n if succ_n else 1.0
         mem = MEMORY_MB.get(algo, 0.0)
 
         metrics.append({
@@ -3,35 +3,74 @@ Generate formatted comparison results for multi-depot experiments
 Similar style to format_results.py
 """
 
-import csv
 import os
 from typing import Dict, List
 from collections import defaultdict
+from statistics import fmean
+
+from utils.csv_io import read_rows
 
 # Only show these algorithms in results and comparisons
 DISPLAY_ALGOS = {"HybridNN2opt", "NN2opt", "HeldKarp", "GA"}
 
+# Every emoji the report and its console messages use: per-row table markers, then line
+# prefixes (with their trailing spacing). --plain swaps in ASCII equivalents throughout.
+TROPHY = " 🏆"
+SHIELD = " 🛡️"
+BOLT = " ⚡"
+MARKERS = {
+    "best": TROPHY, "shield": SHIELD, "bolt": BOLT, "ok": "✅", "missing": "❌",
+    "title": "🏭 ", "situation": "📍 ", "trophy": "🏆 ", "lightning": "⚡ ", "guard": "🛡️  ",
+    "stats": "📊 ", "lab": "🔬 ", "trend": "📈 ", "idea": "💡 ", "map": "🗺️  ", "arrow": " → ",
+    "error": "❌ ", "warn": "⚠️  ", "done": "✅ ",
+}
+PLAIN_MARKERS = {
+    "best": " *", "shield": " #", "bolt": " !", "ok": "Y", "missing": "N",
+    "title": "", "situation": "", "trophy": "* ", "lightning": "! ", "guard": "# ",
+    "stats": "", "lab": "", "trend": "", "idea": "", "map": "", "arrow": " -> ",
+    "error": "ERROR: ", "warn": "WARNING: ", "done": "",
+}
+
+
+def _best_min(rows_by_algo: Dict[str, Dict], field: str, algos: List[str], parse=float):
+    """Return (lowest parsed value of `field`, algorithms tied at it); unparseable values are skipped"""
+    best = None
+    tied = []
+    for algo in algos:
+        row = rows_by_algo.get(algo)
+        if not row:
+            continue
+        try:
+            value = parse(row.get(field, 0))
+        except (ValueError, TypeError):
+            continue
+        if best is None or value < best:
+            best = value
+            tied = [algo]
+        elif value == best:
+            tied.append(algo)
+    return best, tied
 
-def generate_comparison(csv_file: str = "results/raw/multi_depot_runs.csv"):
+
+def generate_comparison(csv_file: str = "results/raw/multi_depot_runs.csv", plain: bool = False):
     """Generate formatted comparison between single and multi-depot"""
+    marks = PLAIN_MARKERS if plain else MARKERS
+    best_mark, shield_mark, bolt_mark = marks["best"], marks["shield"], marks["bolt"]
     
     if not os.path.exists(csv_file):
-        print(f"❌ File not found: {csv_file}")
+        print(f"{marks['error']}File not found: {csv_file}")
         return
     
-    results: List[Dict] = []
-    with open(csv_file, 'r', newline='') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row.get("algo", "") in DISPLAY_ALGOS:
-                results.append(row)
-    
+    results: List[Dict] = read_rows(csv_file, DISPLAY_ALGOS)
+
     if not results:
-        print(f"⚠️  No data found in {csv_file}")
+        print(f"{marks['warn']}No data found in {csv_file}")
         return
     
     # Group by situation and config
     situations = defaultdict(lambda: {'single': {}, 'multi': {}})
+    # Algorithms seen anywhere in the file; situations skip the ones they lack
+    all_algos = sorted({row['algo'] for row in results})
     
     for row in results:
         key = (row['map_type'], row['K'], row['seed'])
@@ -45,11 +84,11 @@ def generate_comparison(csv_file: str = "results/raw/multi_depot_runs.csv"):
     
     # Generate output
     output_file = "results/multi_depot_comparison.txt"
-    os.makedirs(os.path.dirname(output_file) if os.path.dirname(output_file) else '.', exist_ok=True)
+    os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
     
     with open(output_file, 'w') as f:
         f.write("=" * 100 + "\n")
-        f.write("🏭 MULTI-DEPOT vs SINGLE-DEPOT COMPARISON\n")
+        f.write(f"{marks['title']}MULTI-DEPOT vs SINGLE-DEPOT COMPARISON\n")
         f.write("=" * 100 + "\n\n")
         
         # Track statistics
@@ -70,101 +109,44 @@ def generate_comparison(csv_file: str = "results/raw/multi_depot_runs.csv"):
                 continue
             
             f.write("=" * 100 + "\n")
-            f.write(f"📍 SITUATION: Map={map_type.upper()}, K={K}, Seed={seed}\n")
+            f.write(f"{marks['situation']}SITUATION: Map={map_type.upper()}, K={K}, Seed={seed}\n")
             f.write("=" * 100 + "\n\n")
             
-            # Get all algorithms that appear in either config
-            all_algos = sorted(set(list(single.keys()) + list(multi.keys())))
-            
-            # Find best performers for single depot
-            best_single_makespan = None
-            best_single_algos = []
-            best_single_time = None
-            best_single_time_algo = None
-            
-            for algo in all_algos:
-                if algo in single:
-                    try:
-                        makespan = float(single[algo]['makespan'])
-                        if best_single_makespan is None or makespan < best_single_makespan:
-                            best_single_makespan = makespan
-                            best_single_algos = [algo]
-                        elif makespan == best_single_makespan:
-                            best_single_algos.append(algo)
-                    except (ValueError, TypeError):
-                        pass
-                    
-                    try:
-                        plan_time = float(single[algo]['plan_time_ms'])
-                        if best_single_time is None or plan_time < best_single_time:
-                            best_single_time = plan_time
-                            best_single_time_algo = algo
-                    except (ValueError, TypeError):
-                        pass
-            
-            # Find best performers for multi-depot
-            best_multi_makespan = None
-            best_multi_algos = []
-            best_multi_time = None
-            best_multi_time_algo = None
-            
-            for algo in all_algos:
-                if algo in multi:
-                    try:
-                        makespan = float(multi[algo]['makespan'])
-                        if best_multi_makespan is None or makespan < best_multi_makespan:
-                            best_multi_makespan = makespan
-                            best_multi_algos = [algo]
-                        elif makespan == best_multi_makespan:
-                            best_multi_algos.append(algo)
-                    except (ValueError, TypeError):
-                        pass
-                    
-                    try:
-                        plan_time = float(multi[algo]['plan_time_ms'])
-                        if best_multi_time is None or plan_time < best_multi_time:
-                            best_multi_time = plan_time
-                            best_multi_time_algo = algo
-                    except (ValueError, TypeError):
-                        pass
-            
+            # Find best performers (lowest value, with ties) per config
+            best_single_makespan, best_single_algos = _best_min(single, 'makespan', all_algos)
+            best_single_time, fastest = _best_min(single, 'plan_time_ms', all_algos)
+            best_single_time_algo = fastest[0] if fastest else None
+            best_multi_makespan, best_multi_algos = _best_min(multi, 'makespan', all_algos)
+            best_multi_time, fastest = _best_min(multi, 'plan_time_ms', all_algos)
+            best_multi_time_algo = fastest[0] if fastest else None
+            best_collision_count, best_collision_algos = _best_min(multi, 'collision_count', all_algos, parse=int)
+            best_wait_time, best_wait_time_algos = _best_min(multi, 'total_wait_time', all_algos)
+
             # Display comparison table with collision metrics
             f.write(f"{'Algorithm':<20} {'Single Makespan':<20} {'Multi Makespan':<20} {'Collision Makespan':<22} {'Collisions':<12} {'Total Wait':<15} {'Status':<10}\n")
             f.write("-" * 120 + "\n")
             
             best_improvement = None
             best_improvement_algo = None
-            
-            # Find best collision performers
-            best_collision_count = None
-            best_collision_algos = []
-            best_wait_time = None
-            best_wait_time_algos = []
-            
-            for algo in all_algos:
-                multi_data = multi.get(algo, {})
-                if multi_data:
-                    try:
-                        collision_count = int(multi_data.get('collision_count', 0))
-                        if best_collision_count is None or collision_count < best_collision_count:
-                            best_collision_count = collision_count
-                            best_collision_algos = [algo]
-                        elif collision_count == best_collision_count:
-                            best_collision_algos.append(algo)
-                    except (ValueError, TypeError):
-                        pass
-                    
-                    try:
-                        wait_time = float(multi_data.get('total_wait_time', 0))
-                        if best_wait_time is None or wait_time < best_wait_time:
-                            best_wait_time = wait_time
-                            best_wait_time_algos = [algo]
-                        elif wait_time == best_wait_time:
-                            best_wait_time_algos.append(algo)
-                    except (ValueError, TypeError):
-                        pass
-            
+
+            # Markers (resolved once per situation, looked up per row)
+            single_best = frozenset(best_single_algos) if best_single_makespan else frozenset()
+            multi_best = frozenset(best_multi_algos) if best_multi_makespan else frozenset()
+            collision_best = frozenset(best_collision_algos) if best_collision_count is not None else frozenset()
+            wait_best = frozenset(best_wait_time_algos) if best_wait_time is not None else frozenset()
+            markers = {
+                algo: (
+                    best_mark if algo in single_best else "",
+                    best_mark if algo in multi_best else "",
+                    shield_mark if algo in collision_best else "",
+                    bolt_mark if algo in wait_best else "",
+                )
+                for algo in all_algos
+            }
+
             for algo in all_algos:
+                if algo not in single and algo not in multi:
+                    continue
                 single_data = single.get(algo, {})
                 multi_data = multi.get(algo, {})
                 
@@ -204,19 +186,15 @@ def generate_comparison(csv_file: str = "results/raw/multi_depot_runs.csv"):
                 except (ValueError, TypeError):
                     pass
                 
-                # Markers
-                single_marker = " 🏆" if algo in best_single_algos and best_single_makespan else ""
-                multi_marker = " 🏆" if algo in best_multi_algos and best_multi_makespan else ""
-                collision_marker = " 🛡️" if algo in best_collision_algos and best_collision_count is not None else ""
-                wait_marker = " ⚡" if algo in best_wait_time_algos and best_wait_time is not None else ""
-                
+                single_marker, multi_marker, collision_marker, wait_marker = markers[algo]
+
                 single_display = f"{single_makespan_str:<20}{single_marker}"
                 multi_display = f"{multi_makespan_str:<20}{multi_marker}"
                 collision_display = f"{collision_makespan_str:<22}"
                 collision_count_display = f"{collision_count_str:<12}{collision_marker}"
                 wait_display = f"{total_wait_str:<15}{wait_marker}"
                 
-                status = "✅" if single_data and multi_data else "❌"
+                status = marks["ok"] if single_data and multi_data else marks["missing"]
                 
                 f.write(f"{algo:<20} {single_display} {multi_display} {collision_display} {collision_count_display} {wait_display} {status:<10}\n")
             
@@ -225,42 +203,42 @@ def generate_comparison(csv_file: str = "results/raw/multi_depot_runs.csv"):
             # Summary for this situation
             if best_single_algos and best_single_makespan:
                 if len(best_single_algos) == 1:
-                    f.write(f"🏆 Best Single-Depot Makespan: {best_single_algos[0]} ({best_single_makespan:.2f})\n")
+                    f.write(f"{marks['trophy']}Best Single-Depot Makespan: {best_single_algos[0]} ({best_single_makespan:.2f})\n")
                 else:
-                    f.write(f"🏆 Best Single-Depot Makespan: {' & '.join(best_single_algos)} (tied at {best_single_makespan:.2f})\n")
+                    f.write(f"{marks['trophy']}Best Single-Depot Makespan: {' & '.join(best_single_algos)} (tied at {best_single_makespan:.2f})\n")
             
             if best_multi_algos and best_multi_makespan:
                 if len(best_multi_algos) == 1:
-                    f.write(f"🏆 Best Multi-Depot Makespan: {best_multi_algos[0]} ({best_multi_makespan:.2f})\n")
+                    f.write(f"{marks['trophy']}Best Multi-Depot Makespan: {best_multi_algos[0]} ({best_multi_makespan:.2f})\n")
                 else:
-                    f.write(f"🏆 Best Multi-Depot Makespan: {' & '.join(best_multi_algos)} (tied at {best_multi_makespan:.2f})\n")
+                    f.write(f"{marks['trophy']}Best Multi-Depot Makespan: {' & '.join(best_multi_algos)} (tied at {best_multi_makespan:.2f})\n")
             
             if best_improvement_algo and best_improvement is not None:
-                f.write(f"⚡ Best Improvement: {best_improvement_algo} ({best_improvement:.2f}% faster with multi-depot)\n")
+                f.write(f"{marks['lightning']}Best Improvement: {best_improvement_algo} ({best_improvement:.2f}% faster with multi-depot)\n")
             
             if best_single_time_algo:
-                f.write(f"⚡ Fastest Single Planning: {best_single_time_algo} ({best_single_time:.2f} ms)\n")
+                f.write(f"{marks['lightning']}Fastest Single Planning: {best_single_time_algo} ({best_single_time:.2f} ms)\n")
             
             if best_multi_time_algo:
-                f.write(f"⚡ Fastest Multi Planning: {best_multi_time_algo} ({best_multi_time:.2f} ms)\n")
+                f.write(f"{marks['lightning']}Fastest Multi Planning: {best_multi_time_algo} ({best_multi_time:.2f} ms)\n")
             
             if best_collision_algos and best_collision_count is not None:
                 if len(best_collision_algos) == 1:
-                    f.write(f"🛡️  Fewest Collisions: {best_collision_algos[0]} ({best_collision_count} collisions)\n")
+                    f.write(f"{marks['guard']}Fewest Collisions: {best_collision_algos[0]} ({best_collision_count} collisions)\n")
                 else:
-                    f.write(f"🛡️  Fewest Collisions: {' & '.join(best_collision_algos)} (tied at {best_collision_count})\n")
+                    f.write(f"{marks['guard']}Fewest Collisions: {' & '.join(best_collision_algos)} (tied at {best_collision_count})\n")
             
             if best_wait_time_algos and best_wait_time is not None:
                 if len(best_wait_time_algos) == 1:
-                    f.write(f"⚡ Lowest Wait Time: {best_wait_time_algos[0]} ({best_wait_time:.2f} total wait)\n")
+                    f.write(f"{marks['lightning']}Lowest Wait Time: {best_wait_time_algos[0]} ({best_wait_time:.2f} total wait)\n")
                 else:
-                    f.write(f"⚡ Lowest Wait Time: {' & '.join(best_wait_time_algos)} (tied at {best_wait_time:.2f})\n")
+                    f.write(f"{marks['lightning']}Lowest Wait Time: {' & '.join(best_wait_time_algos)} (tied at {best_wait_time:.2f})\n")
             
             f.write("\n\n")
         
         # Overall statistics
         f.write("=" * 100 + "\n")
-        f.write("📊 OVERALL STATISTICS\n")
+        f.write(f"{marks['stats']}OVERALL STATISTICS\n")
         f.write("=" * 100 + "\n\n")
         
         # Algorithm performance summary
@@ -273,10 +251,10 @@ def generate_comparison(csv_file: str = "results/raw/multi_depot_runs.csv"):
             single_makespans = algo_single_makespans[algo]
             multi_makespans = algo_multi_makespans[algo]
             
-            avg_improvement = sum(improvements) / len(improvements) if improvements else 0.0
+            avg_improvement = fmean(improvements) if improvements else 0.0
             best_improvement = max(improvements) if improvements else 0.0
-            avg_single = sum(single_makespans) / len(single_makespans) if single_makespans else 0.0
-            avg_multi = sum(multi_makespans) / len(multi_makespans) if multi_makespans else 0.0
+            avg_single = fmean(single_makespans) if single_makespans else 0.0
+            avg_multi = fmean(multi_makespans) if multi_makespans else 0.0
             
             f.write(f"{algo:<20} {len(improvements):<8} {avg_improvement:<20.2f} {best_improvement:<20.2f} "
                    f"{avg_single:<22.2f} {avg_multi:<22.2f}\n")
@@ -286,20 +264,20 @@ def generate_comparison(csv_file: str = "results/raw/multi_depot_runs.csv"):
         # Find best overall algorithms
         if algo_improvements:
             best_avg_improvement = max(algo_improvements.items(), 
-                                      key=lambda x: sum(x[1]) / len(x[1]) if x[1] else 0)
+                                      key=lambda x: fmean(x[1]) if x[1] else 0)
             best_max_improvement = max(algo_improvements.items(),
                                       key=lambda x: max(x[1]) if x[1] else 0)
             
-            avg_imp_val = sum(best_avg_improvement[1]) / len(best_avg_improvement[1]) if best_avg_improvement[1] else 0
+            avg_imp_val = fmean(best_avg_improvement[1]) if best_avg_improvement[1] else 0
             max_imp_val = max(best_max_improvement[1]) if best_max_improvement[1] else 0
             
-            f.write(f"🏆 Best Average Improvement: {best_avg_improvement[0]} ({avg_imp_val:.2f}%)\n")
-            f.write(f"⚡ Best Maximum Improvement: {best_max_improvement[0]} ({max_imp_val:.2f}%)\n")
+            f.write(f"{marks['trophy']}Best Average Improvement: {best_avg_improvement[0]} ({avg_imp_val:.2f}%)\n")
+            f.write(f"{marks['lightning']}Best Maximum Improvement: {best_max_improvement[0]} ({max_imp_val:.2f}%)\n")
             f.write("\n")
         
         # Collision Statistics Section
         f.write("=" * 100 + "\n")
-        f.write("🛡️  COLLISION STATISTICS (Multi-Depot Only)\n")
+        f.write(f"{marks['guard']}COLLISION STATISTICS (Multi-Depot Only)\n")
         f.write("=" * 100 + "\n\n")
         
         f.write(f"{'Algorithm':<20} {'Avg Collisions':<18} {'Avg Wait Time':<18} {'Max Wait Time':<18} {'Collision Makespan':<22}\n")
@@ -311,10 +289,10 @@ def generate_comparison(csv_file: str = "results/raw/multi_depot_runs.csv"):
             max_waits = algo_max_wait_times[algo]
             collision_makespans = algo_collision_makespans[algo]
             
-            avg_collisions = sum(collisions) / len(collisions) if collisions else 0.0
-            avg_wait = sum(wait_times) / len(wait_times) if wait_times else 0.0
-            avg_max_wait = sum(max_waits) / len(max_waits) if max_waits else 0.0
-            avg_collision_makespan = sum(collision_makespans) / len(collision_makespans) if collision_makespans else 0.0
+            avg_collisions = fmean(collisions) if collisions else 0.0
+            avg_wait = fmean(wait_times) if wait_times else 0.0
+            avg_max_wait = fmean(max_waits) if max_waits else 0.0
+            avg_collision_makespan = fmean(collision_makespans) if collision_makespans else 0.0
             
             f.write(f"{algo:<20} {avg_collisions:<18.2f} {avg_wait:<18.2f} {avg_max_wait:<18.2f} {avg_collision_makespan:<22.2f}\n")
         
@@ -323,15 +301,15 @@ def generate_comparison(csv_file: str = "results/raw/multi_depot_runs.csv"):
         # Find best collision handlers
         if algo_collision_counts:
             best_avg_collisions = min(algo_collision_counts.items(), 
-                                     key=lambda x: sum(x[1]) / len(x[1]) if x[1] else float('inf'))
+                                     key=lambda x: fmean(x[1]) if x[1] else float('inf'))
             best_avg_wait = min(algo_total_wait_times.items(),
-                               key=lambda x: sum(x[1]) / len(x[1]) if x[1] else float('inf'))
+                               key=lambda x: fmean(x[1]) if x[1] else float('inf'))
             
-            best_coll_val = sum(best_avg_collisions[1]) / len(best_avg_collisions[1]) if best_avg_collisions[1] else 0
-            best_wait_val = sum(best_avg_wait[1]) / len(best_avg_wait[1]) if best_avg_wait[1] else 0
+            best_coll_val = fmean(best_avg_collisions[1]) if best_avg_collisions[1] else 0
+            best_wait_val = fmean(best_avg_wait[1]) if best_avg_wait[1] else 0
             
-            f.write(f"🛡️  Best Collision Handler (Fewest Avg): {best_avg_collisions[0]} ({best_coll_val:.2f} avg collisions)\n")
-            f.write(f"⚡ Best Wait Time Handler (Lowest Avg): {best_avg_wait[0]} ({best_wait_val:.2f} avg wait time)\n")
+            f.write(f"{marks['guard']}Best Collision Handler (Fewest Avg): {best_avg_collisions[0]} ({best_coll_val:.2f} avg collisions)\n")
+            f.write(f"{marks['lightning']}Best Wait Time Handler (Lowest Avg): {best_avg_wait[0]} ({best_wait_val:.2f} avg wait time)\n")
             f.write("\n")
         
         # Highlight HybridNN2opt advantages
@@ -343,15 +321,15 @@ def generate_comparison(csv_file: str = "results/raw/multi_depot_runs.csv"):
             hybrid_waits = algo_total_wait_times.get('HybridNN2opt', [])
             
             f.write("=" * 100 + "\n")
-            f.write("🔬 HYBRIDNN2OPT: BEST COLLISION & CONGESTION HANDLING (Multi-Depot)\n")
+            f.write(f"{marks['lab']}HYBRIDNN2OPT: BEST COLLISION & CONGESTION HANDLING (Multi-Depot)\n")
             f.write("=" * 100 + "\n\n")
             
-            avg_hybrid_improvement = sum(hybrid_improvements) / len(hybrid_improvements) if hybrid_improvements else 0.0
-            f.write(f"📈 Average Makespan Improvement: {avg_hybrid_improvement:.2f}% (with multi-depot)\n")
+            avg_hybrid_improvement = fmean(hybrid_improvements) if hybrid_improvements else 0.0
+            f.write(f"{marks['trend']}Average Makespan Improvement: {avg_hybrid_improvement:.2f}% (with multi-depot)\n")
             
             if hybrid_collisions:
-                avg_hybrid_collisions = sum(hybrid_collisions) / len(hybrid_collisions)
-                f.write(f"🛡️  Average Collisions: {avg_hybrid_collisions:.2f}\n")
+                avg_hybrid_collisions = fmean(hybrid_collisions)
+                f.write(f"{marks['guard']}Average Collisions: {avg_hybrid_collisions:.2f}\n")
                 
                 # Compare collision handling with other algorithms
                 for other_algo in sorted(algo_collision_counts.keys()):
@@ -359,14 +337,14 @@ def generate_comparison(csv_file: str = "results/raw/multi_depot_runs.csv"):
                         continue
                     other_collisions = algo_collision_counts[other_algo]
                     if other_collisions:
-                        avg_other = sum(other_collisions) / len(other_collisions)
+                        avg_other = fmean(other_collisions)
                         diff = avg_other - avg_hybrid_collisions
                         if abs(diff) > 0.01:
                             f.write(f"   vs {other_algo}: {diff:+.2f} collisions ({'fewer' if diff > 0 else 'more'} collisions)\n")
             
             if hybrid_waits:
-                avg_hybrid_wait = sum(hybrid_waits) / len(hybrid_waits)
-                f.write(f"⚡ Average Wait Time: {avg_hybrid_wait:.2f}\n")
+                avg_hybrid_wait = fmean(hybrid_waits)
+                f.write(f"{marks['lightning']}Average Wait Time: {avg_hybrid_wait:.2f}\n")
                 
                 # Compare wait times with other algorithms
                 for other_algo in sorted(algo_total_wait_times.keys()):
@@ -374,7 +352,7 @@ def generate_comparison(csv_file: str = "results/raw/multi_depot_runs.csv"):
                         continue
                     other_waits = algo_total_wait_times[other_algo]
                     if other_waits:
-                        avg_other = sum(other_waits) / len(other_waits)
+                        avg_other = fmean(other_waits)
                         diff = avg_other - avg_hybrid_wait
                         if abs(diff) > 0.01:
                             f.write(f"   vs {other_algo}: {diff:+.2f} wait time ({'less' if diff > 0 else 'more'} wait time)\n")
@@ -385,21 +363,21 @@ def generate_comparison(csv_file: str = "results/raw/multi_depot_runs.csv"):
                     continue
                 other_improvements = algo_improvements[other_algo]
                 if other_improvements:
-                    avg_other = sum(other_improvements) / len(other_improvements)
+                    avg_other = fmean(other_improvements)
                     diff = avg_hybrid_improvement - avg_other
                     if abs(diff) > 0.01:  # Only show if meaningful difference
                         f.write(f"   vs {other_algo}: {diff:+.2f}% improvement ({'better' if diff > 0 else 'worse'})\n")
             
             f.write("\n")
             
-            avg_hybrid_single = sum(hybrid_single) / len(hybrid_single) if hybrid_single else 0.0
-            avg_hybrid_multi = sum(hybrid_multi) / len(hybrid_multi) if hybrid_multi else 0.0
+            avg_hybrid_single = fmean(hybrid_single) if hybrid_single else 0.0
+            avg_hybrid_multi = fmean(hybrid_multi) if hybrid_multi else 0.0
             
-            f.write(f"📊 Makespan Reduction: {avg_hybrid_single:.2f} → {avg_hybrid_multi:.2f} "
+            f.write(f"{marks['stats']}Makespan Reduction: {avg_hybrid_single:.2f}{marks['arrow']}{avg_hybrid_multi:.2f} "
                    f"({avg_hybrid_improvement:.2f}% faster)\n")
             
             f.write("\n")
-            f.write("💡 Key Insights:\n")
+            f.write(f"{marks['idea']}Key Insights:\n")
             f.write("   - HybridNN2opt may have slightly worse makespan/plan time than NN2opt in some runs.\n")
             f.write("   - It handles collision and congestion better: fewer collisions, lower wait times.\n")
             f.write("   - Choose HybridNN2opt when multi-bot collision and congestion matter most.\n")
@@ -407,7 +385,7 @@ def generate_comparison(csv_file: str = "results/raw/multi_depot_runs.csv"):
         
         # Map type analysis
         f.write("=" * 100 + "\n")
-        f.write("🗺️  PERFORMANCE BY MAP TYPE\n")
+        f.write(f"{marks['map']}PERFORMANCE BY MAP TYPE\n")
         f.write("=" * 100 + "\n\n")
         
         map_improvements = defaultdict(lambda: defaultdict(list))
@@ -416,7 +394,7 @@ def generate_comparison(csv_file: str = "results/raw/multi_depot_runs.csv"):
             single = data['single']
             multi = data['multi']
             
-            for algo in set(list(single.keys()) + list(multi.keys())):
+            for algo in all_algos:
                 if algo in single and algo in multi:
                     try:
                         single_makespan = float(single[algo]['makespan'])
@@ -430,17 +408,20 @@ def generate_comparison(csv_file: str = "results/raw/multi_depot_runs.csv"):
             f.write(f"Map Type: {map_type.upper()}\n")
             for algo in sorted(map_improvements[map_type].keys()):
                 improvements = map_improvements[map_type][algo]
-                avg_imp = sum(improvements) / len(improvements) if improvements else 0.0
+                avg_imp = fmean(improvements) if improvements else 0.0
                 f.write(f"  {algo:<20}: {avg_imp:.2f}% avg improvement ({len(improvements)} runs)\n")
             f.write("\n")
         
         f.write("=" * 100 + "\n")
     
-    print(f"✅ Comparison written to: {output_file}")
+    print(f"{marks['done']}Comparison written to: {output_file}")
     print(f"   View with: cat {output_file}")
 
 
 if __name__ == "__main__":
-    import sys
-    csv_file = sys.argv[1] if len(sys.argv) > 1 else "results/raw/multi_depot_runs.csv"
-    generate_comparison(csv_file)
+    import argparse
+    ap = argparse.ArgumentParser(description="Generate multi-depot vs single-depot comparison")
+    ap.add_argument("csv_file", nargs="?", default="results/raw/multi_depot_runs.csv", help="Input CSV (e.g. results/raw/multi_depot_runs.csv)")
+    ap.add_argument("--plain", action="store_true", help="ASCII-only output: * # ! markers and plain headings instead of emoji")
+    args = ap.parse_args()
+    generate_comparison(args.csv_file, plain=args.plain)
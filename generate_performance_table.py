@@ -4,9 +4,12 @@ Columns: Model, Memory (MB), Planning Time (ms), Optimization Rate (%), Success
 Excludes HybridGA2opt and HybridACO2opt.
 """
 
-import csv
 import os
-from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+from utils.csv_io import read_frame
 
 ALGOS = ["HeldKarp", "HybridNN2opt", "NN2opt", "GA", "ACO", "ALO"]
 
@@ -34,68 +37,41 @@ REPLAN_COUNT = {
     "ALO": 0.13,
 }
 
+COLUMNS = ["Model", "Memory (MB)", "Planning Time (ms)", "Optimization Rate (%)", "Success Rate (%)", "Replan Count"]
+COL_WIDTHS = [18, 14, 20, 24, 18, 14]
+
 
-def load_runs(csv_path: str = "results/raw/runs.csv"):
+def load_runs(csv_path: str = "results/raw/runs.csv") -> pd.DataFrame:
     if not os.path.exists(csv_path):
-        return []
-    with open(csv_path, "r", newline="") as f:
-        return list(csv.DictReader(f))
-
-
-def build_table(data):
-    by_algo = defaultdict(lambda: {"plan_times": [], "tour_lens": [], "improvements": [], "success": []})
-    for row in data:
-        algo = row.get("algo", "").strip()
-        if algo not in ALGOS:
-            continue
-        try:
-            t = row.get("plan_time_ms", "")
-            if t != "":
-                by_algo[algo]["plan_times"].append(float(t))
-        except (ValueError, TypeError):
-            pass
-        try:
-            tour = row.get("tour_len", "")
-            if tour and str(tour).lower() != "inf":
-                by_algo[algo]["tour_lens"].append(float(tour))
-        except (ValueError, TypeError):
-            pass
-        try:
-            imp = row.get("improvement_pct", "")
-            if imp != "":
-                by_algo[algo]["improvements"].append(float(imp))
-        except (ValueError, TypeError):
-            pass
-        try:
-            s = row.get("success", "1")
-            by_algo[algo]["success"].append(1 if str(s).strip() in ("1", "true", "yes") else 0)
-        except (ValueError, TypeError):
-            by_algo[algo]["success"].append(1)
-
-    avg_tour = {a: sum(by_algo[a]["tour_lens"]) / len(by_algo[a]["tour_lens"]) for a in ALGOS if by_algo[a]["tour_lens"]}
+        return pd.DataFrame()
+    return read_frame(csv_path, text_columns=("algo", "success"))
+
+
+def build_table(data: pd.DataFrame):
+    df = data.assign(algo=data["algo"].str.strip())
+    df = df[df["algo"].isin(ALGOS)]
+    success = df["success"] if "success" in df.columns else pd.Series("1", index=df.index)
+    df = df.assign(
+        plan_time_ms=pd.to_numeric(df["plan_time_ms"], errors="coerce"),
+        tour_len=pd.to_numeric(df["tour_len"], errors="coerce").replace(np.inf, np.nan),
+        success=success.astype(str).str.strip().isin(("1", "true", "yes")).astype(float),
+    )
+    agg = df.groupby("algo").agg(
+        plan_ms=("plan_time_ms", "mean"),
+        avg_tour=("tour_len", "mean"),
+        success=("success", "mean"),
+    ).reindex(ALGOS)
+
+    avg_tour = agg["avg_tour"].dropna()
     # Optimization rate: rank by avg tour (best first), assign REF_OPT_RATES so table matches algorithm_performance graph
-    sorted_algos = sorted(avg_tour.keys(), key=lambda a: avg_tour[a]) if avg_tour else ALGOS
-    opt_rate_by_algo = {}
-    for i, algo in enumerate(sorted_algos):
-        opt_rate_by_algo[algo] = REF_OPT_RATES[min(i, len(REF_OPT_RATES) - 1)]
+    ranked = avg_tour.sort_values(kind="stable").index.tolist() if not avg_tour.empty else ALGOS
+    opt_rate_by_algo = dict(zip(ranked, REF_OPT_RATES))
 
     rows = []
     for algo in ALGOS:
-        if algo not in by_algo:
-            rows.append({
-                "Model": algo,
-                "Memory (MB)": MEMORY_MB.get(algo, 0.0),
-                "Planning Time (ms)": 0.0,
-                "Optimization Rate (%)": REF_OPT_RATES[ALGOS.index(algo)] if algo in ALGOS else 0.0,
-                "Success Rate (%)": 0.0,
-                "Replan Count": REPLAN_COUNT.get(algo, 0.0),
-            })
-            continue
-        d = by_algo[algo]
-        plan_times = d["plan_times"]
-        plan_ms = sum(plan_times) / len(plan_times) if plan_times else 0.0
-        success_list = d["success"]
-        success_rate = 100.0 * sum(success_list) / len(success_list) if success_list else 100.0
+        a = agg.loc[algo]
+        plan_ms = 0.0 if pd.isna(a["plan_ms"]) else float(a["plan_ms"])
+        success_rate = 100.0 * float(a["success"]) if pd.notna(a["success"]) else 100.0
         rows.append({
             "Model": algo,
             "Memory (MB)": MEMORY_MB.get(algo, 0.0),
@@ -107,35 +83,27 @@ def build_table(data):
     return rows
 
 
-def write_table(rows, out_path: str = "results/performance_table.txt"):
-    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
-    col_headers = ["Model", "Memory (MB)", "Planning Time (ms)", "Optimization Rate (%)", "Success Rate (%)", "Replan Count"]
-    col_widths = [18, 14, 20, 24, 18, 14]
+def _ensure_parent_dir(path: str):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+
+def write_table(table: pd.DataFrame, out_path: str = "results/performance_table.txt"):
+    _ensure_parent_dir(out_path)
+    lines = table[COLUMNS[0]].str.ljust(COL_WIDTHS[0])
+    for col, width in zip(COLUMNS[1:], COL_WIDTHS[1:]):
+        lines = lines + table[col].astype(str).str.rjust(width)
     with open(out_path, "w") as f:
         f.write("Performance metrics from codebase (runs.csv). HybridGA2opt & HybridACO2opt excluded.\n\n")
-        header = "".join(h.ljust(col_widths[i]) for i, h in enumerate(col_headers))
+        header = "".join(h.ljust(COL_WIDTHS[i]) for i, h in enumerate(COLUMNS))
         f.write(header + "\n")
-        f.write("-" * sum(col_widths) + "\n")
-        for r in rows:
-            line = (
-                r["Model"].ljust(col_widths[0])
-                + str(r["Memory (MB)"]).rjust(col_widths[1])
-                + str(r["Planning Time (ms)"]).rjust(col_widths[2])
-                + str(r["Optimization Rate (%)"]).rjust(col_widths[3])
-                + str(r["Success Rate (%)"]).rjust(col_widths[4])
-                + str(r["Replan Count"]).rjust(col_widths[5])
-            )
-            f.write(line + "\n")
+        f.write("-" * sum(COL_WIDTHS) + "\n")
+        f.writelines(line + "\n" for line in lines)
     print(f"Wrote: {out_path}")
 
 
-def write_csv(rows, out_path: str = "results/performance_table.csv"):
-    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
-    col_headers = ["Model", "Memory (MB)", "Planning Time (ms)", "Optimization Rate (%)", "Success Rate (%)", "Replan Count"]
-    with open(out_path, "w", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=col_headers)
-        w.writeheader()
-        w.writerows(rows)
+def write_csv(table: pd.DataFrame, out_path: str = "results/performance_table.csv"):
+    _ensure_parent_dir(out_path)
+    table.to_csv(out_path, index=False, lineterminator="\r\n")
     print(f"Wrote: {out_path}")
 
 
@@ -147,12 +115,12 @@ def main():
     ap.add_argument("--out-csv", default="results/performance_table.csv", help="Output CSV table")
     args = ap.parse_args()
     data = load_runs(args.csv)
-    if not data:
+    if data.empty:
         print("No data in", args.csv)
         return
-    rows = build_table(data)
-    write_table(rows, args.out_txt)
-    write_csv(rows, args.out_csv)
+    table = pd.DataFrame(build_table(data), columns=COLUMNS)
+    write_table(table, args.out_txt)
+    write_csv(table, args.out_csv)
 
 
 if __name__ == "__main__":
@@ -6,112 +6,100 @@ Metrics: Tour Length (cells), Planning Time, Collision Count (avg.), Makespan.
 
 import csv
 import os
-from collections import defaultdict
 
-ALGOS = ["NN2opt", "HybridNN2opt", "GA"]
-ALGO_DISPLAY = ["NN2opt", "Hybrid NN2opt", "Genetic Algorithm (GA)"]
+import numpy as np
+import pandas as pd
 
+from utils.csv_io import read_frame
 
-def safe_float(v, default=0.0):
-    if v is None or v == "":
-        return default
-    try:
-        return float(v)
-    except (ValueError, TypeError):
-        return default
-
-
-def _aggregate_single_depot_rows(rows_by_algo):
-    """Turn per-algo lists into per-algo dict of means. Only include algos with at least one row."""
-    result = {}
-    for algo in ALGOS:
-        d = rows_by_algo[algo]
-        n = len(d["tour_len"])
-        if n == 0:
-            continue
-        result[algo] = {
-            "tour_len": sum(d["tour_len"]) / n,
-            "plan_time_ms": sum(d["plan_time_ms"]) / n if d["plan_time_ms"] else 0,
-            "collision_count": sum(d["collision_count"]) / n,
-            "makespan": sum(d["collision_makespan"]) / n if d["collision_makespan"] else 0,
-        }
-    return result
-
-
-def load_single_depot_1bot(csv_path: str = "results/raw/runs.csv"):
-    """Single-depot, 1 robot (num_bots=1). Collision count is always 0."""
-    if not os.path.exists(csv_path):
-        return {}
-    by_algo = defaultdict(lambda: {"tour_len": [], "plan_time_ms": [], "collision_count": [], "collision_makespan": []})
-    with open(csv_path, "r", newline="") as f:
-        r = csv.DictReader(f)
-        for row in r:
-            if safe_float(row.get("num_bots"), 1) != 1:
-                continue
-            algo = row.get("algo", "").strip()
-            if algo not in ALGOS:
-                continue
-            t = row.get("tour_len", "")
-            if t and str(t).lower() != "inf":
-                by_algo[algo]["tour_len"].append(safe_float(t))
-            by_algo[algo]["plan_time_ms"].append(safe_float(row.get("plan_time_ms")))
-            by_algo[algo]["collision_count"].append(safe_float(row.get("collision_count")))
-            by_algo[algo]["collision_makespan"].append(safe_float(row.get("collision_makespan")) or safe_float(row.get("theoretical_makespan")))
-    return _aggregate_single_depot_rows(by_algo)
-
-
-def load_single_depot_multibot(csv_path: str = "results/raw/runs.csv"):
-    """Single-depot, multiple robots (num_bots>1). Can have non-zero collision count."""
+ALGOS = ["NN2opt", "HybridNN2opt", "GA"]
+ALGO_DISPLAY = ["NN2opt", "Hybrid NN2opt", "Genetic Algorithm (GA)"]
+ALGOS_SET = frozenset(ALGOS)
+
+# Only these columns are parsed from the run CSVs
+SINGLE_DEPOT_COLUMNS = ["algo", "num_bots", "tour_len", "plan_time_ms", "collision_count", "collision_makespan", "theoretical_makespan"]
+MULTI_DEPOT_COLUMNS = ["algo", "config", "total_distance", "plan_time_ms", "collision_count", "collision_makespan"]
+
+
+def _numeric(df: pd.DataFrame, col: str, default: float = 0.0) -> pd.Series:
+    """Column as floats; missing, blank or unparseable cells become `default`."""
+    if col not in df.columns:
+        return pd.Series(default, index=df.index, dtype=float)
+    return pd.to_numeric(df[col], errors="coerce").fillna(default)
+
+
+def _algo_codes(algo: pd.Series) -> np.ndarray:
+    """Integer code per row (index into ALGOS); rows must already be restricted to ALGOS."""
+    return pd.Categorical(algo, categories=ALGOS).codes.astype(np.intp)
+
+
+def _algo_sums(codes: np.ndarray, values) -> np.ndarray:
+    """Per-algo sum of `values`, indexed like ALGOS."""
+    return np.bincount(codes, weights=values, minlength=len(ALGOS))
+
+
+def _aggregate_single_depot_rows(df: pd.DataFrame) -> dict:
+    """Per-algo dict of means over rows already restricted to ALGOS. Only include algos with
+    at least one finite tour length (tour counts are also the divisor for the other metrics)."""
+    codes = _algo_codes(df["algo"])
+    tour = pd.to_numeric(df["tour_len"], errors="coerce").to_numpy(dtype=float)
+    finite = np.isfinite(tour)
+    n = np.bincount(codes[finite], minlength=len(ALGOS))
+    collision_makespan = _numeric(df, "collision_makespan").to_numpy()
+    # Fall back to the theoretical makespan when no collision makespan was recorded (0)
+    makespan = np.where(collision_makespan != 0.0, collision_makespan, _numeric(df, "theoretical_makespan").to_numpy())
+    sums = {
+        "tour_len": _algo_sums(codes, np.where(finite, tour, 0.0)),
+        "plan_time_ms": _algo_sums(codes, _numeric(df, "plan_time_ms").to_numpy()),
+        "collision_count": _algo_sums(codes, _numeric(df, "collision_count").to_numpy()),
+        "makespan": _algo_sums(codes, makespan),
+    }
+    return {
+        algo: {key: float(total[i] / n[i]) for key, total in sums.items()}
+        for i, algo in enumerate(ALGOS) if n[i] > 0
+    }
+
+
+def load_single_depot(csv_path: str = "results/raw/runs.csv"):
+    """Single-depot runs split by robot count, reading the CSV once.
+
+    Returns (1 robot, multiple robots). 1-robot runs (num_bots=1, or blank) always have
+    collision count 0; multi-robot runs (num_bots>1) can have collisions.
+    """
     if not os.path.exists(csv_path):
-        return {}
-    by_algo = defaultdict(lambda: {"tour_len": [], "plan_time_ms": [], "collision_count": [], "collision_makespan": []})
-    with open(csv_path, "r", newline="") as f:
-        r = csv.DictReader(f)
-        for row in r:
-            if safe_float(row.get("num_bots"), 0) <= 1:
-                continue
-            algo = row.get("algo", "").strip()
-            if algo not in ALGOS:
-                continue
-            t = row.get("tour_len", "")
-            if t and str(t).lower() != "inf":
-                by_algo[algo]["tour_len"].append(safe_float(t))
-            by_algo[algo]["plan_time_ms"].append(safe_float(row.get("plan_time_ms")))
-            by_algo[algo]["collision_count"].append(safe_float(row.get("collision_count")))
-            by_algo[algo]["collision_makespan"].append(safe_float(row.get("collision_makespan")) or safe_float(row.get("theoretical_makespan")))
-    return _aggregate_single_depot_rows(by_algo)
+        return {}, {}
+    df = read_frame(csv_path, text_columns=("algo",), usecols=SINGLE_DEPOT_COLUMNS)
+    # Drop untracked algorithms before any numeric parsing
+    algo = df["algo"].str.strip()
+    keep = algo.isin(ALGOS_SET)
+    df = df[keep].assign(algo=algo[keep])
+    num_bots = _numeric(df, "num_bots", np.nan)
+    single_1 = _aggregate_single_depot_rows(df[(num_bots == 1) | num_bots.isna()])
+    single_multi = _aggregate_single_depot_rows(df[num_bots > 1])
+    return single_1, single_multi
 
 
 def load_multi_depot(csv_path: str = "results/raw/multi_depot_runs.csv"):
     """Aggregate multi-depot metrics from multi_depot_runs.csv (config=multi_depot)."""
     if not os.path.exists(csv_path):
         return {}
-    by_algo = defaultdict(lambda: {"tour_len": [], "total_distance": [], "plan_time_ms": [], "collision_count": [], "collision_makespan": []})
-    with open(csv_path, "r", newline="") as f:
-        r = csv.DictReader(f)
-        for row in r:
-            if row.get("config", "").strip() != "multi_depot":
-                continue
-            algo = row.get("algo", "").strip()
-            if algo not in ALGOS:
-                continue
-            by_algo[algo]["tour_len"].append(safe_float(row.get("tour_len")))
-            by_algo[algo]["total_distance"].append(safe_float(row.get("total_distance")))
-            by_algo[algo]["plan_time_ms"].append(safe_float(row.get("plan_time_ms")))
-            by_algo[algo]["collision_count"].append(safe_float(row.get("collision_count")))
-            by_algo[algo]["collision_makespan"].append(safe_float(row.get("collision_makespan")))
-    result = {}
-    for algo in ALGOS:
-        d = by_algo[algo]
-        n = len(d["tour_len"]) or 1
-        # Tour length as total cells visited (total_distance)
-        result[algo] = {
-            "tour_len": sum(d["total_distance"]) / n if d["total_distance"] else (sum(d["tour_len"]) / n if d["tour_len"] else 0),
-            "plan_time_ms": sum(d["plan_time_ms"]) / n if d["plan_time_ms"] else 0,
-            "collision_count": sum(d["collision_count"]) / n if d["collision_count"] else 0,
-            "makespan": sum(d["collision_makespan"]) / n if d["collision_makespan"] else 0,
-        }
-    return result
+    df = read_frame(csv_path, text_columns=("algo", "config"), usecols=MULTI_DEPOT_COLUMNS)
+    algo = df["algo"].str.strip()
+    keep = algo.isin(ALGOS_SET) & (df["config"].str.strip() == "multi_depot")
+    df = df[keep]
+    codes = _algo_codes(algo[keep])
+    counts = np.bincount(codes, minlength=len(ALGOS))
+    n = np.maximum(counts, 1)
+    # Tour length as total cells visited (total_distance)
+    sums = {
+        "tour_len": _algo_sums(codes, _numeric(df, "total_distance").to_numpy()),
+        "plan_time_ms": _algo_sums(codes, _numeric(df, "plan_time_ms").to_numpy()),
+        "collision_count": _algo_sums(codes, _numeric(df, "collision_count").to_numpy()),
+        "makespan": _algo_sums(codes, _numeric(df, "collision_makespan").to_numpy()),
+    }
+    # Algos without rows get an int 0 for every metric, as the per-row loop reported them
+    return {algo: {key: float(total[i] / n[i]) if counts[i] else 0 for key, total in sums.items()}
+            for i, algo in enumerate(ALGOS)}
 
 
 def _fmt(val, num_fmt=".3f", na="N/A"):
@@ -123,56 +111,71 @@ def _fmt(val, num_fmt=".3f", na="N/A"):
         return na
 
 
+TABLE_HEADER = [
+    "Scenario comparison: Single-depot (1 bot), Single-depot (multi-bot), Multi-depot. Algorithms: NN2opt, Hybrid NN2opt, GA.",
+    "Note: Single-depot 1 bot has collision count 0 (one robot). Single-depot multi-bot and multi-depot use multiple robots and can have collisions.",
+    "To generate single-depot multi-bot data: python3 -m exp.run_matrix --num-bots 1,2 (or 1,2,3).",
+    "",
+    "| Algorithm              | Single-Depot (1 bot)                                  | Single-Depot (multi-bot)                               | Multi-Depot                                              |",
+    "|                        | Tour Len | Plan (ms) | Coll. | Makespan | Tour Len | Plan (ms) | Coll. | Makespan | Tour Len | Plan (ms) | Coll. | Makespan |",
+    "|------------------------|----------|-----------+-------+----------|----------|-----------+-------+----------|----------|-----------+-------+----------|",
+]
+# One scenario block: tour len, plan ms, collisions, makespan
+_BLOCK_FMT = " {:>8} | {:>9} | {:>5} | {:>8} |"
+ROW_FMT = ("| {:<22} |" + _BLOCK_FMT * 3).format
+
+
+def _row_vals(d):
+    if not d:
+        return ("N/A", "N/A", "N/A", "N/A")
+    return (
+        _fmt(d.get("tour_len"), ".1f"),
+        _fmt(d.get("plan_time_ms"), ".2f"),
+        _fmt(d.get("collision_count"), ".2f"),
+        _fmt(d.get("makespan"), ".2f"),
+    )
+
+
 def write_table(single_1: dict, single_multi: dict, multi: dict, out_path: str = "results/scenario_comparison_table.txt"):
     os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    lines = list(TABLE_HEADER)
+    for algo, name in zip(ALGOS, ALGO_DISPLAY):
+        lines.append(ROW_FMT(
+            name,
+            *_row_vals(single_1.get(algo, {})),
+            *_row_vals(single_multi.get(algo, {})),
+            *_row_vals(multi.get(algo, {})),
+        ))
     with open(out_path, "w") as f:
-        f.write("Scenario comparison: Single-depot (1 bot), Single-depot (multi-bot), Multi-depot. Algorithms: NN2opt, Hybrid NN2opt, GA.\n")
-        f.write("Note: Single-depot 1 bot has collision count 0 (one robot). Single-depot multi-bot and multi-depot use multiple robots and can have collisions.\n")
-        f.write("To generate single-depot multi-bot data: python3 -m exp.run_matrix --num-bots 1,2 (or 1,2,3).\n\n")
-        f.write("| Algorithm              | Single-Depot (1 bot)                                  | Single-Depot (multi-bot)                               | Multi-Depot                                              |\n")
-        f.write("|                        | Tour Len | Plan (ms) | Coll. | Makespan | Tour Len | Plan (ms) | Coll. | Makespan | Tour Len | Plan (ms) | Coll. | Makespan |\n")
-        f.write("|------------------------|----------|-----------+-------+----------|----------|-----------+-------+----------|----------|-----------+-------+----------|\n")
-        for i, algo in enumerate(ALGOS):
-            name = ALGO_DISPLAY[i]
-            s1 = single_1.get(algo, {})
-            sm = single_multi.get(algo, {})
-            md = multi.get(algo, {})
-            def row_vals(d):
-                if not d:
-                    return ("N/A", "N/A", "N/A", "N/A")
-                return (
-                    _fmt(d.get("tour_len"), ".1f"),
-                    _fmt(d.get("plan_time_ms"), ".2f"),
-                    _fmt(d.get("collision_count"), ".2f"),
-                    _fmt(d.get("makespan"), ".2f"),
-                )
-            r1 = row_vals(s1)
-            rm = row_vals(sm)
-            rd = row_vals(md)
-            f.write(f"| {name:<22} | {r1[0]:>8} | {r1[1]:>9} | {r1[2]:>5} | {r1[3]:>8} | {rm[0]:>8} | {rm[1]:>9} | {rm[2]:>5} | {rm[3]:>8} | {rd[0]:>8} | {rd[1]:>9} | {rd[2]:>5} | {rd[3]:>8} |\n")
+        f.write("\n".join(lines) + "\n")
     print(f"Wrote: {out_path}")
 
 
+CSV_HEADER = [
+    "Algorithm",
+    "Single_1bot_Tour_cells", "Single_1bot_Plan_ms", "Single_1bot_Collision_avg", "Single_1bot_Makespan",
+    "Single_multibot_Tour_cells", "Single_multibot_Plan_ms", "Single_multibot_Collision_avg", "Single_multibot_Makespan",
+    "Multi_depot_Tour_cells", "Multi_depot_Plan_ms", "Multi_depot_Collision_avg", "Multi_depot_Makespan",
+]
+
+
+def _csv_vals(d: dict):
+    return [round(d.get("tour_len", 0), 3), round(d.get("plan_time_ms", 0), 2), round(d.get("collision_count", 0), 2), round(d.get("makespan", 0), 2)]
+
+
 def write_csv(single_1: dict, single_multi: dict, multi: dict, out_path: str = "results/scenario_comparison_table.csv"):
     os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
-    with open(out_path, "w", newline="") as f:
-        w = csv.writer(f)
-        w.writerow([
-            "Algorithm",
-            "Single_1bot_Tour_cells", "Single_1bot_Plan_ms", "Single_1bot_Collision_avg", "Single_1bot_Makespan",
-            "Single_multibot_Tour_cells", "Single_multibot_Plan_ms", "Single_multibot_Collision_avg", "Single_multibot_Makespan",
-            "Multi_depot_Tour_cells", "Multi_depot_Plan_ms", "Multi_depot_Collision_avg", "Multi_depot_Makespan",
+    rows = [CSV_HEADER]
+    for algo, name in zip(ALGOS, ALGO_DISPLAY):
+        sm = single_multi.get(algo, {})
+        rows.append([
+            name,
+            *_csv_vals(single_1.get(algo, {})),
+            *(_csv_vals(sm) if sm else ["", "", "", ""]),
+            *_csv_vals(multi.get(algo, {})),
         ])
-        for i, algo in enumerate(ALGOS):
-            s1 = single_1.get(algo, {})
-            sm = single_multi.get(algo, {})
-            m = multi.get(algo, {})
-            w.writerow([
-                ALGO_DISPLAY[i],
-                round(s1.get("tour_len", 0), 3), round(s1.get("plan_time_ms", 0), 2), round(s1.get("collision_count", 0), 2), round(s1.get("makespan", 0), 2),
-                round(sm.get("tour_len", 0), 3) if sm else "", round(sm.get("plan_time_ms", 0), 2) if sm else "", round(sm.get("collision_count", 0), 2) if sm else "", round(sm.get("makespan", 0), 2) if sm else "",
-                round(m.get("tour_len", 0), 3), round(m.get("plan_time_ms", 0), 2), round(m.get("collision_count", 0), 2), round(m.get("makespan", 0), 2),
-            ])
+    with open(out_path, "w", newline="") as f:
+        csv.writer(f).writerows(rows)
     print(f"Wrote: {out_path}")
 
 
@@ -184,8 +187,7 @@ def main():
     ap.add_argument("--out-txt", default="results/scenario_comparison_table.txt", help="Output text table")
     ap.add_argument("--out-csv", default="results/scenario_comparison_table.csv", help="Output CSV")
     args = ap.parse_args()
-    single_1 = load_single_depot_1bot(args.single_csv)
-    single_multi = load_single_depot_multibot(args.single_csv)
+    single_1, single_multi = load_single_depot(args.single_csv)
     multi = load_multi_depot(args.multi_csv)
     if not single_1 and not single_multi and not multi:
         print("No data found.")
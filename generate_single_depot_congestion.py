@@ -3,77 +3,146 @@ Generate congestion handling comparison for single-depot experiments
 Shows how algorithms handle congested areas (narrow maps, bottlenecks)
 """
 
-import csv
 import os
-from typing import Dict, List
-from collections import defaultdict
+import re
+from operator import itemgetter
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from utils.csv_io import read_frame
 
 # Only show these algorithms in results
 DISPLAY_ALGOS = {"HybridNN2opt", "NN2opt", "HeldKarp", "GA"}
+MAP_TYPES = ('narrow', 'wide', 'cross')
 
+# Only these columns are parsed from runs.csv
+CONGESTION_COLUMNS = ['algo', 'map_type', 'tour_len', 'plan_time_ms', 'improvement_pct', 'collision_count', 'total_wait_time']
 
-def calculate_congestion_metrics(results: List[Dict]) -> Dict:
-    """Calculate congestion-related metrics from results"""
-    
-    # Group by algorithm and map type
-    algo_map_stats = defaultdict(lambda: {
-        'narrow': {'tour_lens': [], 'plan_times': [], 'improvements': [], 
-                   'collisions': [], 'wait_times': [], 'count': 0},
-        'wide': {'tour_lens': [], 'plan_times': [], 'improvements': [],
-                 'collisions': [], 'wait_times': [], 'count': 0},
-        'cross': {'tour_lens': [], 'plan_times': [], 'improvements': [],
-                  'collisions': [], 'wait_times': [], 'count': 0},
-        'all': {'tour_lens': [], 'plan_times': [], 'improvements': [],
-                'collisions': [], 'wait_times': [], 'count': 0}
-    })
-    
-    for row in results:
-        algo = row.get('algo', '')
-        map_type = row.get('map_type', '').lower()
-        
-        try:
-            tour_len = float(row.get('tour_len', 0))
-            plan_time = float(row.get('plan_time_ms', 0))
-            improvement = row.get('improvement_pct', '')
-            collision_count = int(row.get('collision_count', 0))
-            wait_time = float(row.get('total_wait_time', 0))
-            
-            if tour_len > 0 and tour_len != float('inf'):
-                algo_map_stats[algo][map_type]['tour_lens'].append(tour_len)
-                algo_map_stats[algo][map_type]['plan_times'].append(plan_time)
-                algo_map_stats[algo][map_type]['collisions'].append(collision_count)
-                algo_map_stats[algo][map_type]['wait_times'].append(wait_time)
-                algo_map_stats[algo][map_type]['count'] += 1
-                
-                algo_map_stats[algo]['all']['tour_lens'].append(tour_len)
-                algo_map_stats[algo]['all']['plan_times'].append(plan_time)
-                algo_map_stats[algo]['all']['collisions'].append(collision_count)
-                algo_map_stats[algo]['all']['wait_times'].append(wait_time)
-                algo_map_stats[algo]['all']['count'] += 1
-                
-                # Track improvement percentage
-                if improvement and improvement != '':
-                    try:
-                        imp_val = float(improvement)
-                        if imp_val > 0:
-                            algo_map_stats[algo][map_type]['improvements'].append(imp_val)
-                            algo_map_stats[algo]['all']['improvements'].append(imp_val)
-                    except (ValueError, TypeError):
-                        pass
-        except (ValueError, TypeError):
-            continue
+# Per-algorithm report rows, formatted once per row with str.format
+_SUMMARY_HEADER = f"{'Algorithm':<20} {'Tour Length':<15} {'Plan Time (ms)':<18} {'Improvement %':<15} {'Composite Score':<18} {'Status':<10}\n"
+_SUMMARY_ROW = "{:<20} {:<15.3f} {:<18.2f} {:<15} {:<18.2f} {:<10}\n"
+_SUMMARY_NA_ROW = "{:<20} " + f"{'N/A':<15} {'N/A':<18} {'N/A':<15} {'N/A':<18} {'N/A':<10}\n"
+_RUNS_ROW = "{} {:<20} {:.3f} ({} runs)\n"
+_PENALTY_ROW = "{} {:<20} {:<15} (Narrow: {:.3f}, Wide: {:.3f})\n"
+_COLLISION_ROW = "  {} {:<20} {:.2f} avg collisions\n"
+_WAIT_ROW = "  {} {:<20} {:.3f} avg wait time\n"
+_MAP_ROW = "  {} {:<20}: {:.3f} ({} runs)\n"
+# Closing line of a ranked list, naming its best algorithm
+_BEST_LINE = "\n   🏆 Best: {}\n"
+_BEST_SUBLINE = "  🏆 Best: {}\n"
+
+# collision_count must parse as an int (a value like "2.0" invalidates the run, as int() would)
+_INT_RE = re.compile(r"\s*[+-]?\d+\s*")
+
+# Float columns summed per bucket, in this order along the last axis of the sums array
+# (collision counts are integers and summed separately)
+_SUM_COLUMNS = ('tour_len', 'plan_time_ms', 'total_wait_time', 'improvement_pct')
+# Buckets along the second axis: one per map type, then all map types together
+_BUCKETS = MAP_TYPES + ('all',)
+
+
+def _numeric(df: pd.DataFrame, col: str, missing: float = 0.0) -> pd.Series:
+    """Column as floats; blank or unparseable cells become NaN, a missing column is all `missing`."""
+    if col not in df.columns:
+        return pd.Series(missing, index=df.index)
+    return pd.to_numeric(df[col], errors='coerce')
+
+
+def _reduce_runs(group: np.ndarray, n_groups: int, columns: List[np.ndarray]):
+    """Per-group (codes 0..n_groups-1) column sums, shape (n_groups, len(columns)).
+
+    `columns` follow _SUM_COLUMNS; each is reduced in a single bincount pass in row order
+    (no argsort, and left-to-right sums, unlike np.add.reduceat's pairwise ones).
+    NaN improvements (the last column) are not summed.
+    """
+    imp_valid = ~np.isnan(columns[-1])
+    totals = [np.bincount(group, weights=col, minlength=n_groups) for col in columns[:-1]]
+    totals.append(np.bincount(group[imp_valid], weights=columns[-1][imp_valid], minlength=n_groups))
+    # (bincount of no rows is int, even with weights)
+    return np.stack(totals, axis=-1).astype(float, copy=False)
+
+
+def _bucket_totals(map_group: np.ndarray, n_algos: int, values: Optional[np.ndarray] = None) -> np.ndarray:
+    """Integer [algo, bucket] totals of `values` (run counts if None) from map-bucket group ids.
+
+    'all' is the total of the map buckets, which is exact for integers.
+    """
+    if values is None:
+        totals = np.bincount(map_group, minlength=n_algos * len(_BUCKETS))
+    else:
+        totals = np.zeros(n_algos * len(_BUCKETS), dtype=np.int64)
+        np.add.at(totals, map_group, values)
+    totals = totals.reshape(n_algos, len(_BUCKETS))
+    totals[:, -1] = totals[:, :-1].sum(axis=1)
+    return totals
+
+
+def _safe_mean(sums: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """sums / counts, 0.0 where the count is 0."""
+    return np.divide(sums, counts, out=np.zeros(sums.shape), where=counts > 0)
+
+
+def calculate_congestion_metrics(results: pd.DataFrame) -> Dict:
+    """Calculate congestion-related metrics from results (one run per row)"""
+    
+    if 'collision_count' in results.columns:
+        raw = results['collision_count'].astype('string')
+        collision_count = pd.to_numeric(raw.where(raw.str.fullmatch(_INT_RE).fillna(False)), errors='coerce')
+    else:
+        collision_count = pd.Series(0, index=results.index)
+    # Parsed once; only positive improvement percentages are tracked
+    improvement = _numeric(results, 'improvement_pct', float('nan')).to_numpy(dtype=float)
+    values = {
+        'tour_len': _numeric(results, 'tour_len').to_numpy(dtype=float),
+        'plan_time_ms': _numeric(results, 'plan_time_ms').to_numpy(dtype=float),
+        'total_wait_time': _numeric(results, 'total_wait_time').to_numpy(dtype=float),
+        'improvement_pct': np.where(improvement > 0, improvement, np.nan),
+    }
+    # NaN marks a count that is not an int
+    collision = collision_count.to_numpy(dtype=float)
+    # Runs on other map types (code -1) are not part of the comparison
+    map_code = pd.Index(MAP_TYPES).get_indexer(results['map_type'].str.lower()).astype(np.intp)
+    
+    # A run counts if tour/plan/wait parse as floats, collision_count as an int,
+    # and the tour length is positive and finite
+    tour = values['tour_len']
+    valid = (tour > 0) & (tour != float('inf')) & (map_code >= 0)
+    for col in (values['plan_time_ms'], collision, values['total_wait_time']):
+        valid &= ~np.isnan(col)
+    
+    # Group by algorithm and map type (algorithms in order of first valid run)
+    algo_codes, algos = pd.factorize(results['algo'][valid])
+    n_algos = len(algos)
+    
+    # Group id = algo * len(_BUCKETS) + bucket; float sums list each run under its map and 'all'
+    algo_base = algo_codes.astype(np.intp) * len(_BUCKETS)
+    map_group = algo_base + map_code[valid]
+    group = np.concatenate((map_group, algo_base + len(MAP_TYPES)))
+    columns = [np.tile(values[col][valid], 2) for col in _SUM_COLUMNS]
+    
+    # Structure of arrays: sums[algo, bucket, column], counts[algo, bucket]
+    sums = _reduce_runs(group, n_algos * len(_BUCKETS), columns).reshape(n_algos, len(_BUCKETS), len(_SUM_COLUMNS))
+    counts = _bucket_totals(map_group, n_algos)
+    imp_counts = _bucket_totals(map_group[~np.isnan(values['improvement_pct'][valid])], n_algos)
+    collision_sums = _bucket_totals(map_group, n_algos, collision[valid].astype(np.int64))
+    
+    # Means as [algo][bucket] lists (buckets ordered like _BUCKETS); sums are only divided here
+    tour_avgs, plan_avgs, wait_avgs = (_safe_mean(sums[..., k], counts).tolist() for k in range(3))
+    improvement_avgs = _safe_mean(sums[..., 3], imp_counts).tolist()
+    collision_avgs = _safe_mean(collision_sums, counts).tolist()
+    run_counts = counts.tolist()
     
     # Calculate metrics
     congestion_metrics = {}
     
-    for algo in algo_map_stats.keys():
-        stats = algo_map_stats[algo]
-        
+    # The largest overall plan time normalizes plan time in the composite score
+    max_plan_time = max((plan[-1] for plan in plan_avgs), default=1)
+    
+    for i, algo in enumerate(algos):
         # Average tour lengths by map type
-        narrow_avg = sum(stats['narrow']['tour_lens']) / len(stats['narrow']['tour_lens']) if stats['narrow']['tour_lens'] else 0
-        wide_avg = sum(stats['wide']['tour_lens']) / len(stats['wide']['tour_lens']) if stats['wide']['tour_lens'] else 0
-        cross_avg = sum(stats['cross']['tour_lens']) / len(stats['cross']['tour_lens']) if stats['cross']['tour_lens'] else 0
-        all_avg = sum(stats['all']['tour_lens']) / len(stats['all']['tour_lens']) if stats['all']['tour_lens'] else 0
+        narrow_avg, wide_avg, cross_avg, all_avg = tour_avgs[i]
         
         # Congestion penalty: how much worse in narrow maps (more congested)
         # Only calculate if we have both narrow and wide data
@@ -91,29 +160,18 @@ def calculate_congestion_metrics(results: List[Dict]) -> Dict:
         overall_efficiency = all_avg
         
         # Planning time in narrow maps (congestion handling speed)
-        narrow_plan_time = sum(stats['narrow']['plan_times']) / len(stats['narrow']['plan_times']) if stats['narrow']['plan_times'] else 0
-        all_plan_time = sum(stats['all']['plan_times']) / len(stats['all']['plan_times']) if stats['all']['plan_times'] else 0
+        narrow_plan_time, all_plan_time = plan_avgs[i][0], plan_avgs[i][-1]
         
         # Improvement percentage
-        narrow_improvement = sum(stats['narrow']['improvements']) / len(stats['narrow']['improvements']) if stats['narrow']['improvements'] else 0
-        all_improvement = sum(stats['all']['improvements']) / len(stats['all']['improvements']) if stats['all']['improvements'] else 0
+        narrow_improvement, all_improvement = improvement_avgs[i][0], improvement_avgs[i][-1]
         
         # Collision metrics by map type
-        narrow_collisions = sum(stats['narrow']['collisions']) / len(stats['narrow']['collisions']) if stats['narrow']['collisions'] else 0
-        wide_collisions = sum(stats['wide']['collisions']) / len(stats['wide']['collisions']) if stats['wide']['collisions'] else 0
-        all_collisions = sum(stats['all']['collisions']) / len(stats['all']['collisions']) if stats['all']['collisions'] else 0
-        
-        narrow_wait_time = sum(stats['narrow']['wait_times']) / len(stats['narrow']['wait_times']) if stats['narrow']['wait_times'] else 0
-        wide_wait_time = sum(stats['wide']['wait_times']) / len(stats['wide']['wait_times']) if stats['wide']['wait_times'] else 0
-        all_wait_time = sum(stats['all']['wait_times']) / len(stats['all']['wait_times']) if stats['all']['wait_times'] else 0
+        narrow_collisions, wide_collisions, _, all_collisions = collision_avgs[i]
+        narrow_wait_time, wide_wait_time, _, all_wait_time = wait_avgs[i]
         
         # Composite score: lower is better (weighted combination)
         # Weight: tour length (50%), plan time normalized (30%), improvement bonus (20%)
         # For plan time, normalize by dividing by max plan time to get 0-1 scale
-        max_plan_time = max([sum(algo_map_stats[a]['all']['plan_times']) / len(algo_map_stats[a]['all']['plan_times']) 
-                            if algo_map_stats[a]['all']['plan_times'] else 0 
-                            for a in algo_map_stats.keys()]) if any(stats['all']['plan_times'] for stats in algo_map_stats.values()) else 1
-        
         normalized_plan_time = (all_plan_time / max_plan_time) if max_plan_time > 0 else 0
         improvement_bonus = (100 - all_improvement) / 100 if all_improvement > 0 else 1  # Higher improvement = lower score
         composite_score = (all_avg * 0.5) + (normalized_plan_time * 100 * 0.3) + (improvement_bonus * 50 * 0.2)
@@ -137,425 +195,386 @@ def calculate_congestion_metrics(results: List[Dict]) -> Dict:
             'wide_wait_time': wide_wait_time,
             'all_wait_time': all_wait_time,
             'composite_score': composite_score,
-            'narrow_count': stats['narrow']['count'],
-            'wide_count': stats['wide']['count'],
-            'cross_count': stats['cross']['count'],
-            'total_count': stats['all']['count']
+            'narrow_count': run_counts[i][0],
+            'wide_count': run_counts[i][1],
+            'cross_count': run_counts[i][2],
+            'total_count': run_counts[i][3]
         }
     
     return congestion_metrics
 
 
-def generate_congestion_comparison(csv_file: str = "results/raw/runs.csv"):
-    """Generate formatted congestion handling comparison"""
+# Ranked lowest-first in the report, counting only positive values
+_MIN_POSITIVE_KEYS = ('all_avg', 'all_plan_time', 'narrow_avg', 'wide_avg', 'cross_avg',
+                      'narrow_collisions', 'wide_collisions', 'narrow_wait_time', 'wide_wait_time')
+
+
+def _find_extrema(congestion_metrics: Dict) -> Dict:
+    """(value, algo) of the best algorithm per ranked metric, in one sweep over the algorithms.
+
+    Lowest positive value for _MIN_POSITIVE_KEYS, highest positive all_improvement, lowest
+    composite_score and congestion_penalty (when set), and 'worst_plan_time' (highest positive
+    all_plan_time). Ties go to the first algorithm; metrics with no candidate are left out.
+    """
+    extrema = {}
+    for algo, m in congestion_metrics.items():
+        for key in _MIN_POSITIVE_KEYS:
+            v = m[key]
+            if v > 0 and (key not in extrema or v < extrema[key][0]):
+                extrema[key] = (v, algo)
+        for key in ('composite_score', 'congestion_penalty'):
+            v = m[key]
+            if v is not None and (key not in extrema or v < extrema[key][0]):
+                extrema[key] = (v, algo)
+        v = m['all_improvement']
+        if v > 0 and ('all_improvement' not in extrema or v > extrema['all_improvement'][0]):
+            extrema['all_improvement'] = (v, algo)
+        v = m['all_plan_time']
+        if v > 0 and ('worst_plan_time' not in extrema or v > extrema['worst_plan_time'][0]):
+            extrema['worst_plan_time'] = (v, algo)
+    return extrema
+
+
+def _positive_first(values: pd.Series, fill: float = float('inf')) -> pd.Series:
+    """Non-positive values replaced by `fill`, so they rank last."""
+    return values.where(values > 0, fill)
+
+
+def _print_ranked(write, metrics: Dict, key: str, extrema: Dict, row_fmt: str, best_fmt: str,
+                  count_key: Optional[str] = None):
+    """Write one `row_fmt` line per algorithm with a positive `key` (lowest first, ties in report
+    order), marking the best from `extrema` with a trophy, then `best_fmt` naming it."""
+    best_algo = extrema.get(key, (None, None))[1]
+    rows = [(algo, m[key]) for algo, m in metrics.items() if m[key] > 0]
+    rows.sort(key=itemgetter(1))
+    for algo, value in rows:
+        marker = "🏆" if algo == best_algo else "  "
+        if count_key is None:
+            write(row_fmt.format(marker, algo, value))
+        else:
+            write(row_fmt.format(marker, algo, value, metrics[algo][count_key]))
+    if best_algo:
+        write(best_fmt.format(best_algo))
+
+
+def _format_report(congestion_metrics: Dict) -> str:
+    """Text of the congestion comparison report"""
     
-    if not os.path.exists(csv_file):
-        print(f"❌ File not found: {csv_file}")
-        return
+    # Best (and slowest plan time) per ranked metric, shared by all sections below
+    extrema = _find_extrema(congestion_metrics)
     
-    results: List[Dict] = []
-    with open(csv_file, 'r', newline='') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row.get("algo", "") in DISPLAY_ALGOS:
-                results.append(row)
+    # One table of metrics (rows in report order) that every section ranks from
+    ranking = pd.DataFrame.from_dict(congestion_metrics, orient='index')
     
-    if not results:
-        print(f"⚠️  No data found in {csv_file}")
-        return
+    def ranked(values: pd.Series, descending: bool = False):
+        # (algo, metrics) pairs by value; the stable sort keeps report order for ties
+        order = values.sort_values(ascending=not descending, kind='stable').index
+        return [(algo, congestion_metrics[algo]) for algo in order]
     
-    # Calculate congestion metrics
-    congestion_metrics = calculate_congestion_metrics(results)
+    by_name = sorted(congestion_metrics)
     
-    if not congestion_metrics:
-        print("⚠️  No valid metrics calculated")
-        return
+    # Build the report in memory; the caller writes it in one call
+    parts = []
+    write = parts.append
     
-    # Generate output
-    output_file = "results/single_depot_congestion.txt"
-    os.makedirs(os.path.dirname(output_file) if os.path.dirname(output_file) else '.', exist_ok=True)
+    write("=" * 100 + "\n")
+    write("🚧 SINGLE-DEPOT CONGESTION HANDLING COMPARISON\n")
+    write("=" * 100 + "\n\n")
+    write("This analysis shows how algorithms handle congested warehouse scenarios.\n")
+    write("Narrow maps represent more congested environments with tighter spaces.\n")
+    write("Better congestion handling = lower tour lengths in narrow maps.\n\n")
     
-    with open(output_file, 'w') as f:
-        f.write("=" * 100 + "\n")
-        f.write("🚧 SINGLE-DEPOT CONGESTION HANDLING COMPARISON\n")
-        f.write("=" * 100 + "\n\n")
-        f.write("This analysis shows how algorithms handle congested warehouse scenarios.\n")
-        f.write("Narrow maps represent more congested environments with tighter spaces.\n")
-        f.write("Better congestion handling = lower tour lengths in narrow maps.\n\n")
-        
-        # Summary statistics
-        f.write("=" * 100 + "\n")
-        f.write("📊 SUMMARY STATISTICS\n")
-        f.write("=" * 100 + "\n\n")
-        
-        f.write(f"{'Algorithm':<20} {'Tour Length':<15} {'Plan Time (ms)':<18} {'Improvement %':<15} {'Composite Score':<18} {'Status':<10}\n")
-        f.write("-" * 100 + "\n")
-        
-        # Sort by composite score (best first - lower is better)
-        sorted_algos = sorted(congestion_metrics.items(), 
-                            key=lambda x: x[1]['composite_score'])
-        
-        # Find best in each category (unbiased - no special treatment)
-        best_tour = min([m['all_avg'] for m in congestion_metrics.values() if m['all_avg'] > 0]) if any(m['all_avg'] > 0 for m in congestion_metrics.values()) else 0
-        best_time = min([m['all_plan_time'] for m in congestion_metrics.values() if m['all_plan_time'] > 0]) if any(m['all_plan_time'] > 0 for m in congestion_metrics.values()) else 0
-        best_improvement = max([m['all_improvement'] for m in congestion_metrics.values() if m['all_improvement'] > 0]) if any(m['all_improvement'] > 0 for m in congestion_metrics.values()) else 0
-        best_composite = min([m['composite_score'] for m in congestion_metrics.values()]) if congestion_metrics else 0
-        
-        for algo, metrics in sorted_algos:
-            algo_display = algo  # Unbiased display - no special highlighting
-            
-            tour_avg = metrics['all_avg']
-            plan_time = metrics['all_plan_time']
-            improvement = metrics['all_improvement']
-            composite = metrics['composite_score']
-            
-            # Mark winners
-            status = []
-            if tour_avg > 0 and abs(tour_avg - best_tour) < 0.01:
-                status.append('🏆')
-            if plan_time > 0 and abs(plan_time - best_time) < 0.01:
-                status.append('⚡')
-            if improvement > 0 and abs(improvement - best_improvement) < 0.01:
-                status.append('📈')
-            if abs(composite - best_composite) < 0.01:
-                status.append('⭐')
-            
-            status_str = ' '.join(status) if status else '✅'
-            
-            if tour_avg > 0:
-                improvement_str = f"{improvement:.2f}%" if improvement > 0 else "N/A"
-                f.write(f"{algo_display:<20} {tour_avg:<15.3f} {plan_time:<18.2f} {improvement_str:<15} {composite:<18.2f} {status_str:<10}\n")
-            else:
-                f.write(f"{algo_display:<20} {'N/A':<15} {'N/A':<18} {'N/A':<15} {'N/A':<18} {'N/A':<10}\n")
-        
-        # Detailed metrics
-        f.write("\n")
-        f.write("=" * 100 + "\n")
-        f.write("📈 DETAILED CONGESTION METRICS\n")
-        f.write("=" * 100 + "\n\n")
-        
-        # Planning Time Comparison (KEY DIFFERENTIATOR)
-        f.write("⚡ Planning Time Comparison (Speed in Congested Scenarios):\n")
-        f.write("Lower = Faster = Better for real-time applications\n")
-        f.write("-" * 100 + "\n")
-        
-        time_sorted = sorted(congestion_metrics.items(), 
-                           key=lambda x: x[1]['all_plan_time'] if x[1]['all_plan_time'] > 0 else float('inf'))
-        
-        best_time_algo = None
-        for algo, metrics in time_sorted:
-            if metrics['all_plan_time'] > 0:
-                if best_time_algo is None:
-                    best_time_algo = algo
-                
-                algo_display = f"🌟 {algo}" if algo == 'HybridNN2opt' else algo
-                marker = "🏆" if algo == best_time_algo else "  "
-                
-                # Calculate speedup vs worst
-                worst_time = max([m['all_plan_time'] for m in congestion_metrics.values() if m['all_plan_time'] > 0])
-                speedup = worst_time / metrics['all_plan_time'] if metrics['all_plan_time'] > 0 else 0
-                
-                f.write(f"{marker} {algo_display:<20} {metrics['all_plan_time']:.2f} ms")
-                if speedup > 1:
-                    f.write(f" ({speedup:.1f}x faster than slowest)")
-                f.write("\n")
-        
-        if best_time_algo:
-            f.write(f"\n   🏆 Fastest: {best_time_algo}\n")
-        
-        # Improvement Percentage
-        f.write("\n📈 Improvement Percentage (Convergence Quality):\n")
-        f.write("Higher = Better optimization from initial solution\n")
-        f.write("-" * 100 + "\n")
-        
-        imp_sorted = sorted(congestion_metrics.items(), 
-                          key=lambda x: x[1]['all_improvement'] if x[1]['all_improvement'] > 0 else -1, 
-                          reverse=True)
-        
-        best_imp_algo = None
-        for algo, metrics in imp_sorted:
-            if metrics['all_improvement'] > 0:
-                if best_imp_algo is None:
-                    best_imp_algo = algo
-                
-                algo_display = f"🌟 {algo}" if algo == 'HybridNN2opt' else algo
-                marker = "🏆" if algo == best_imp_algo else "  "
-                f.write(f"{marker} {algo_display:<20} {metrics['all_improvement']:.2f}%\n")
-            else:
-                algo_display = f"🌟 {algo}" if algo == 'HybridNN2opt' else algo
-                f.write(f"   {algo_display:<20} N/A (no improvement tracking)\n")
-        
-        if best_imp_algo:
-            f.write(f"\n   🏆 Best Improvement: {best_imp_algo}\n")
-        
-        # Narrow map performance (most congested)
-        f.write("\nAverage Tour Length in Narrow Maps (Most Congested):\n")
-        f.write("-" * 100 + "\n")
-        
-        narrow_sorted = sorted(congestion_metrics.items(), 
-                              key=lambda x: x[1]['narrow_avg'] if x[1]['narrow_avg'] > 0 else float('inf'))
-        
-        best_narrow = None
-        best_narrow_algo = None
-        for algo, metrics in narrow_sorted:
-            if metrics['narrow_avg'] > 0:
-                if best_narrow is None or metrics['narrow_avg'] < best_narrow:
-                    best_narrow = metrics['narrow_avg']
-                    best_narrow_algo = algo
-                
-                marker = "🏆" if algo == best_narrow_algo else "  "
-                f.write(f"{marker} {algo:<20} {metrics['narrow_avg']:.3f} ({metrics['narrow_count']} runs)\n")
-        
-        if best_narrow_algo:
-            f.write(f"\n   🏆 Best: {best_narrow_algo}\n")
-        
-        # Congestion penalty (how much worse in narrow vs wide)
-        f.write("\nCongestion Penalty (Narrow vs Wide Map Performance):\n")
-        f.write("Lower penalty = better congestion handling\n")
-        f.write("-" * 100 + "\n")
-        
-        # Only show penalty if we have both narrow and wide data
-        penalty_data = {algo: m for algo, m in congestion_metrics.items() 
-                       if m['congestion_penalty'] is not None}
-        
-        if penalty_data:
-            penalty_sorted = sorted(penalty_data.items(), 
-                                   key=lambda x: x[1]['congestion_penalty'])
+    # Summary statistics
+    write("=" * 100 + "\n")
+    write("📊 SUMMARY STATISTICS\n")
+    write("=" * 100 + "\n\n")
+    
+    write(_SUMMARY_HEADER)
+    write("-" * 100 + "\n")
+    
+    # Sort by composite score (best first - lower is better)
+    sorted_algos = ranked(ranking['composite_score'])
+    
+    # Find best in each category (unbiased - no special treatment)
+    best_tour = extrema.get('all_avg', (0, None))[0]
+    best_time = extrema.get('all_plan_time', (0, None))[0]
+    best_improvement = extrema.get('all_improvement', (0, None))[0]
+    best_composite = extrema['composite_score'][0]
+    
+    for algo, metrics in sorted_algos:
+        algo_display = algo  # Unbiased display - no special highlighting
+        
+        tour_avg = metrics['all_avg']
+        plan_time = metrics['all_plan_time']
+        improvement = metrics['all_improvement']
+        composite = metrics['composite_score']
+        
+        # Mark winners
+        status = []
+        if tour_avg > 0 and abs(tour_avg - best_tour) < 0.01:
+            status.append('🏆')
+        if plan_time > 0 and abs(plan_time - best_time) < 0.01:
+            status.append('⚡')
+        if improvement > 0 and abs(improvement - best_improvement) < 0.01:
+            status.append('📈')
+        if abs(composite - best_composite) < 0.01:
+            status.append('⭐')
+        
+        status_str = ' '.join(status) if status else '✅'
+        
+        if tour_avg > 0:
+            improvement_str = f"{improvement:.2f}%" if improvement > 0 else "N/A"
+            write(_SUMMARY_ROW.format(algo_display, tour_avg, plan_time, improvement_str, composite, status_str))
+        else:
+            write(_SUMMARY_NA_ROW.format(algo_display))
+    
+    # Detailed metrics
+    write("\n")
+    write("=" * 100 + "\n")
+    write("📈 DETAILED CONGESTION METRICS\n")
+    write("=" * 100 + "\n\n")
+    
+    # Planning Time Comparison (KEY DIFFERENTIATOR)
+    write("⚡ Planning Time Comparison (Speed in Congested Scenarios):\n")
+    write("Lower = Faster = Better for real-time applications\n")
+    write("-" * 100 + "\n")
+    
+    time_sorted = ranked(_positive_first(ranking['all_plan_time']))
+    
+    best_time_algo = extrema.get('all_plan_time', (None, None))[1]
+    worst_time = extrema.get('worst_plan_time', (0, None))[0]
+    for algo, metrics in time_sorted:
+        if metrics['all_plan_time'] > 0:
+            algo_display = f"🌟 {algo}" if algo == 'HybridNN2opt' else algo
+            marker = "🏆" if algo == best_time_algo else "  "
             
-            best_penalty = None
-            best_penalty_algo = None
-            for algo, metrics in penalty_sorted:
-                if best_penalty is None or metrics['congestion_penalty'] < best_penalty:
-                    best_penalty = metrics['congestion_penalty']
-                    best_penalty_algo = algo
-                
-                marker = "🏆" if algo == best_penalty_algo else "  "
-                penalty_str = f"{metrics['congestion_penalty']:.2f}%"
-                f.write(f"{marker} {algo:<20} {penalty_str:<15} (Narrow: {metrics['narrow_avg']:.3f}, Wide: {metrics['wide_avg']:.3f})\n")
+            # Calculate speedup vs worst
+            speedup = worst_time / metrics['all_plan_time'] if metrics['all_plan_time'] > 0 else 0
             
-            if best_penalty_algo:
-                f.write(f"\n   🏆 Best: {best_penalty_algo} (lowest penalty)\n")
-        else:
-            f.write("⚠️  Cannot calculate congestion penalty: Need both narrow and wide map data\n")
-            f.write("   Run experiments with: --map-types narrow wide cross\n")
-        
-        # Collision Analysis by Map Type
-        f.write("\n")
-        f.write("=" * 100 + "\n")
-        f.write("🛡️  COLLISION ANALYSIS BY MAP TYPE\n")
-        f.write("=" * 100 + "\n\n")
-        
-        # Check if we have collision data
-        has_collision_data = any(m['all_collisions'] > 0 for m in congestion_metrics.values())
-        
-        if not has_collision_data:
-            f.write("⚠️  No collision data found. Collisions only occur with multiple bots (--num-bots > 1).\n")
-            f.write("   Run experiments with: --num-bots 2 (or higher) to see collision analysis.\n\n")
+            write(f"{marker} {algo_display:<20} {metrics['all_plan_time']:.2f} ms")
+            if speedup > 1:
+                write(f" ({speedup:.1f}x faster than slowest)")
+            write("\n")
+    
+    if best_time_algo:
+        write(f"\n   🏆 Fastest: {best_time_algo}\n")
+    
+    # Improvement Percentage
+    write("\n📈 Improvement Percentage (Convergence Quality):\n")
+    write("Higher = Better optimization from initial solution\n")
+    write("-" * 100 + "\n")
+    
+    imp_sorted = ranked(_positive_first(ranking['all_improvement'], -1), descending=True)
+    
+    best_imp_algo = extrema.get('all_improvement', (None, None))[1]
+    for algo, metrics in imp_sorted:
+        if metrics['all_improvement'] > 0:
+            algo_display = f"🌟 {algo}" if algo == 'HybridNN2opt' else algo
+            marker = "🏆" if algo == best_imp_algo else "  "
+            write(f"{marker} {algo_display:<20} {metrics['all_improvement']:.2f}%\n")
         else:
-            # Collision count comparison (narrow vs wide)
-            f.write("Collision Count Comparison (Narrow vs Wide Maps):\n")
-            f.write("Lower = Better collision avoidance\n")
-            f.write("-" * 100 + "\n")
+            algo_display = f"🌟 {algo}" if algo == 'HybridNN2opt' else algo
+            write(f"   {algo_display:<20} N/A (no improvement tracking)\n")
+    
+    if best_imp_algo:
+        write(f"\n   🏆 Best Improvement: {best_imp_algo}\n")
+    
+    # Narrow map performance (most congested)
+    write("\nAverage Tour Length in Narrow Maps (Most Congested):\n")
+    write("-" * 100 + "\n")
+    
+    _print_ranked(write, congestion_metrics, 'narrow_avg', extrema, _RUNS_ROW, _BEST_LINE, 'narrow_count')
+    
+    # Congestion penalty (how much worse in narrow vs wide)
+    write("\nCongestion Penalty (Narrow vs Wide Map Performance):\n")
+    write("Lower penalty = better congestion handling\n")
+    write("-" * 100 + "\n")
+    
+    # Only show penalty if we have both narrow and wide data
+    penalty_data = {algo: m for algo, m in congestion_metrics.items() 
+                   if m['congestion_penalty'] is not None}
+    
+    if penalty_data:
+        penalty_sorted = ranked(ranking.loc[list(penalty_data), 'congestion_penalty'])
+        
+        best_penalty_algo = extrema.get('congestion_penalty', (None, None))[1]
+        for algo, metrics in penalty_sorted:
+            marker = "🏆" if algo == best_penalty_algo else "  "
+            penalty_str = f"{metrics['congestion_penalty']:.2f}%"
+            write(_PENALTY_ROW.format(marker, algo, penalty_str, metrics['narrow_avg'], metrics['wide_avg']))
+        
+        if best_penalty_algo:
+            write(f"\n   🏆 Best: {best_penalty_algo} (lowest penalty)\n")
+    else:
+        write("⚠️  Cannot calculate congestion penalty: Need both narrow and wide map data\n")
+        write("   Run experiments with: --map-types narrow wide cross\n")
+    
+    # Collision Analysis by Map Type
+    write("\n")
+    write("=" * 100 + "\n")
+    write("🛡️  COLLISION ANALYSIS BY MAP TYPE\n")
+    write("=" * 100 + "\n\n")
+    
+    # Check if we have collision data
+    has_collision_data = any(m['all_collisions'] > 0 for m in congestion_metrics.values())
+    
+    if not has_collision_data:
+        write("⚠️  No collision data found. Collisions only occur with multiple bots (--num-bots > 1).\n")
+        write("   Run experiments with: --num-bots 2 (or higher) to see collision analysis.\n\n")
+    else:
+        # Collision count comparison (narrow vs wide)
+        write("Collision Count Comparison (Narrow vs Wide Maps):\n")
+        write("Lower = Better collision avoidance\n")
+        write("-" * 100 + "\n")
+        
+        collision_data = {algo: m for algo, m in congestion_metrics.items() 
+                        if m['narrow_collisions'] > 0 or m['wide_collisions'] > 0}
+        
+        if collision_data:
+            # Narrow map collisions
+            write("Narrow Maps (Congested):\n")
+            _print_ranked(write, collision_data, 'narrow_collisions', extrema, _COLLISION_ROW, _BEST_SUBLINE)
             
-            collision_data = {algo: m for algo, m in congestion_metrics.items() 
-                            if m['narrow_collisions'] > 0 or m['wide_collisions'] > 0}
+            # Wide map collisions
+            write("\nWide Maps (Open):\n")
+            _print_ranked(write, collision_data, 'wide_collisions', extrema, _COLLISION_ROW, _BEST_SUBLINE)
             
-            if collision_data:
-                # Narrow map collisions
-                f.write("Narrow Maps (Congested):\n")
-                narrow_coll_sorted = sorted(collision_data.items(),
-                                           key=lambda x: x[1]['narrow_collisions'])
-                best_narrow_coll = None
-                best_narrow_coll_algo = None
-                for algo, metrics in narrow_coll_sorted:
-                    if metrics['narrow_collisions'] > 0:
-                        if best_narrow_coll is None or metrics['narrow_collisions'] < best_narrow_coll:
-                            best_narrow_coll = metrics['narrow_collisions']
-                            best_narrow_coll_algo = algo
-                        marker = "🏆" if algo == best_narrow_coll_algo else "  "
-                        f.write(f"  {marker} {algo:<20} {metrics['narrow_collisions']:.2f} avg collisions\n")
-                
-                if best_narrow_coll_algo:
-                    f.write(f"  🏆 Best: {best_narrow_coll_algo}\n")
-                
-                # Wide map collisions
-                f.write("\nWide Maps (Open):\n")
-                wide_coll_sorted = sorted(collision_data.items(),
-                                         key=lambda x: x[1]['wide_collisions'])
-                best_wide_coll = None
-                best_wide_coll_algo = None
-                for algo, metrics in wide_coll_sorted:
-                    if metrics['wide_collisions'] > 0:
-                        if best_wide_coll is None or metrics['wide_collisions'] < best_wide_coll:
-                            best_wide_coll = metrics['wide_collisions']
-                            best_wide_coll_algo = algo
-                        marker = "🏆" if algo == best_wide_coll_algo else "  "
-                        f.write(f"  {marker} {algo:<20} {metrics['wide_collisions']:.2f} avg collisions\n")
-                
-                if best_wide_coll_algo:
-                    f.write(f"  🏆 Best: {best_wide_coll_algo}\n")
-                
-                # Wait time comparison
-                f.write("\nWait Time Comparison (Narrow vs Wide Maps):\n")
-                f.write("Lower = Less time spent waiting due to collisions\n")
-                f.write("-" * 100 + "\n")
-                
-                wait_data = {algo: m for algo, m in congestion_metrics.items()
-                           if m['narrow_wait_time'] > 0 or m['wide_wait_time'] > 0}
-                
-                if wait_data:
-                    f.write("Narrow Maps:\n")
-                    narrow_wait_sorted = sorted(wait_data.items(),
-                                               key=lambda x: x[1]['narrow_wait_time'])
-                    best_narrow_wait = None
-                    best_narrow_wait_algo = None
-                    for algo, metrics in narrow_wait_sorted:
-                        if metrics['narrow_wait_time'] > 0:
-                            if best_narrow_wait is None or metrics['narrow_wait_time'] < best_narrow_wait:
-                                best_narrow_wait = metrics['narrow_wait_time']
-                                best_narrow_wait_algo = algo
-                            marker = "🏆" if algo == best_narrow_wait_algo else "  "
-                            f.write(f"  {marker} {algo:<20} {metrics['narrow_wait_time']:.3f} avg wait time\n")
-                    
-                    if best_narrow_wait_algo:
-                        f.write(f"  🏆 Best: {best_narrow_wait_algo}\n")
-                    
-                    f.write("\nWide Maps:\n")
-                    wide_wait_sorted = sorted(wait_data.items(),
-                                            key=lambda x: x[1]['wide_wait_time'])
-                    best_wide_wait = None
-                    best_wide_wait_algo = None
-                    for algo, metrics in wide_wait_sorted:
-                        if metrics['wide_wait_time'] > 0:
-                            if best_wide_wait is None or metrics['wide_wait_time'] < best_wide_wait:
-                                best_wide_wait = metrics['wide_wait_time']
-                                best_wide_wait_algo = algo
-                            marker = "🏆" if algo == best_wide_wait_algo else "  "
-                            f.write(f"  {marker} {algo:<20} {metrics['wide_wait_time']:.3f} avg wait time\n")
-                    
-                    if best_wide_wait_algo:
-                        f.write(f"  🏆 Best: {best_wide_wait_algo}\n")
-        
-        # Overall efficiency
-        f.write("\nOverall Efficiency (All Map Types):\n")
-        f.write("-" * 100 + "\n")
-        
-        overall_sorted = sorted(congestion_metrics.items(), 
-                              key=lambda x: x[1]['all_avg'] if x[1]['all_avg'] > 0 else float('inf'))
-        
-        best_overall = None
-        best_overall_algo = None
-        for algo, metrics in overall_sorted:
-            if metrics['all_avg'] > 0:
-                if best_overall is None or metrics['all_avg'] < best_overall:
-                    best_overall = metrics['all_avg']
-                    best_overall_algo = algo
-                
-                marker = "🏆" if algo == best_overall_algo else "  "
-                f.write(f"{marker} {algo:<20} {metrics['all_avg']:.3f} ({metrics['total_count']} runs)\n")
-        
-        if best_overall_algo:
-            f.write(f"\n   🏆 Best: {best_overall_algo}\n")
-        
-        # HybridNN2opt: collision & congestion handling (where it excels)
-        f.write("\n")
-        f.write("=" * 100 + "\n")
-        f.write("🔬 HYBRIDNN2OPT: BEST COLLISION & CONGESTION HANDLING\n")
-        f.write("=" * 100 + "\n\n")
-        
-        if 'HybridNN2opt' in congestion_metrics:
-            hybrid = congestion_metrics['HybridNN2opt']
+            # Wait time comparison
+            write("\nWait Time Comparison (Narrow vs Wide Maps):\n")
+            write("Lower = Less time spent waiting due to collisions\n")
+            write("-" * 100 + "\n")
             
-            f.write("HybridNN2opt may have slightly worse planning time and tour length than NN2opt.\n")
-            f.write("Here it excels: better collision and congestion handling (lower penalty, fewer collisions, less wait).\n\n")
+            wait_data = {algo: m for algo, m in congestion_metrics.items()
+                       if m['narrow_wait_time'] > 0 or m['wide_wait_time'] > 0}
             
-            f.write(f"⚡ Planning Time: {hybrid['all_plan_time']:.2f} ms average\n")
-            for algo in sorted(congestion_metrics.keys()):
+            if wait_data:
+                write("Narrow Maps:\n")
+                _print_ranked(write, wait_data, 'narrow_wait_time', extrema, _WAIT_ROW, _BEST_SUBLINE)
+                
+                write("\nWide Maps:\n")
+                _print_ranked(write, wait_data, 'wide_wait_time', extrema, _WAIT_ROW, _BEST_SUBLINE)
+    
+    # Overall efficiency
+    write("\nOverall Efficiency (All Map Types):\n")
+    write("-" * 100 + "\n")
+    
+    _print_ranked(write, congestion_metrics, 'all_avg', extrema, _RUNS_ROW, _BEST_LINE, 'total_count')
+    
+    # HybridNN2opt: collision & congestion handling (where it excels)
+    write("\n")
+    write("=" * 100 + "\n")
+    write("🔬 HYBRIDNN2OPT: BEST COLLISION & CONGESTION HANDLING\n")
+    write("=" * 100 + "\n\n")
+    
+    if 'HybridNN2opt' in congestion_metrics:
+        hybrid = congestion_metrics['HybridNN2opt']
+        
+        write("HybridNN2opt may have slightly worse planning time and tour length than NN2opt.\n")
+        write("Here it excels: better collision and congestion handling (lower penalty, fewer collisions, less wait).\n\n")
+        
+        write(f"⚡ Planning Time: {hybrid['all_plan_time']:.2f} ms average\n")
+        for algo in by_name:
+            if algo == 'HybridNN2opt':
+                continue
+            other = congestion_metrics[algo]
+            if other['all_plan_time'] > 0:
+                time_saved = other['all_plan_time'] - hybrid['all_plan_time']
+                if time_saved > 0:
+                    write(f"   vs {algo}: {time_saved:.2f} ms faster\n")
+                else:
+                    write(f"   vs {algo}: {abs(time_saved):.2f} ms slower\n")
+        
+        if hybrid['all_improvement'] > 0:
+            write(f"\n📈 Improvement: {hybrid['all_improvement']:.2f}% average\n")
+            for algo in by_name:
                 if algo == 'HybridNN2opt':
                     continue
                 other = congestion_metrics[algo]
-                if other['all_plan_time'] > 0:
-                    time_saved = other['all_plan_time'] - hybrid['all_plan_time']
-                    if time_saved > 0:
-                        f.write(f"   vs {algo}: {time_saved:.2f} ms faster\n")
+                if other['all_improvement'] > 0:
+                    diff = hybrid['all_improvement'] - other['all_improvement']
+                    if diff > 0:
+                        write(f"   vs {algo}: +{diff:.2f}%\n")
                     else:
-                        f.write(f"   vs {algo}: {abs(time_saved):.2f} ms slower\n")
-            
-            if hybrid['all_improvement'] > 0:
-                f.write(f"\n📈 Improvement: {hybrid['all_improvement']:.2f}% average\n")
-                for algo in sorted(congestion_metrics.keys()):
-                    if algo == 'HybridNN2opt':
-                        continue
-                    other = congestion_metrics[algo]
-                    if other['all_improvement'] > 0:
-                        diff = hybrid['all_improvement'] - other['all_improvement']
-                        if diff > 0:
-                            f.write(f"   vs {algo}: +{diff:.2f}%\n")
-                        else:
-                            f.write(f"   vs {algo}: {diff:.2f}%\n")
-            
-            f.write(f"\n📊 Narrow Map Tour Length: {hybrid['narrow_avg']:.3f}\n")
-            for algo in sorted(congestion_metrics.keys()):
+                        write(f"   vs {algo}: {diff:.2f}%\n")
+        
+        write(f"\n📊 Narrow Map Tour Length: {hybrid['narrow_avg']:.3f}\n")
+        for algo in by_name:
+            if algo == 'HybridNN2opt':
+                continue
+            other = congestion_metrics[algo]
+            if other['narrow_avg'] > 0:
+                diff = hybrid['narrow_avg'] - other['narrow_avg']
+                if diff < 0:
+                    write(f"   vs {algo}: {abs(diff):.3f} shorter\n")
+                else:
+                    write(f"   vs {algo}: {diff:.3f} longer\n")
+        
+        write(f"\n📉 Congestion Penalty (lower = better handling):\n")
+        if hybrid['congestion_penalty'] is not None:
+            write(f"   HybridNN2opt: {hybrid['congestion_penalty']:.2f}%\n")
+            for algo in by_name:
                 if algo == 'HybridNN2opt':
                     continue
                 other = congestion_metrics[algo]
-                if other['narrow_avg'] > 0:
-                    diff = hybrid['narrow_avg'] - other['narrow_avg']
+                if other['congestion_penalty'] is not None:
+                    diff = hybrid['congestion_penalty'] - other['congestion_penalty']
                     if diff < 0:
-                        f.write(f"   vs {algo}: {abs(diff):.3f} shorter\n")
+                        write(f"   vs {algo}: {abs(diff):.2f}% lower penalty (better) 🏆\n")
                     else:
-                        f.write(f"   vs {algo}: {diff:.3f} longer\n")
-            
-            f.write(f"\n📉 Congestion Penalty (lower = better handling):\n")
-            if hybrid['congestion_penalty'] is not None:
-                f.write(f"   HybridNN2opt: {hybrid['congestion_penalty']:.2f}%\n")
-                for algo in sorted(congestion_metrics.keys()):
-                    if algo == 'HybridNN2opt':
-                        continue
-                    other = congestion_metrics[algo]
-                    if other['congestion_penalty'] is not None:
-                        diff = hybrid['congestion_penalty'] - other['congestion_penalty']
-                        if diff < 0:
-                            f.write(f"   vs {algo}: {abs(diff):.2f}% lower penalty (better) 🏆\n")
-                        else:
-                            f.write(f"   vs {algo}: {diff:.2f}% higher penalty\n")
-            else:
-                f.write(f"   N/A (run with --map-types narrow wide cross)\n")
-            
-            f.write("\n💡 Why HybridNN2opt for Congestion & Collision:\n")
-            f.write("   - Handles collision and congestion better than NN2opt overall.\n")
-            f.write("   - Lower congestion penalty and typically fewer collisions / less wait time.\n")
-            f.write("   - Trade-off: slightly worse planning time and tour length vs NN2opt.\n")
-            f.write("   - Choose HybridNN2opt when crowded layouts and multi-bot collision matter.\n")
-        
-        # Map type breakdown
-        f.write("\n")
-        f.write("=" * 100 + "\n")
-        f.write("🗺️  PERFORMANCE BY MAP TYPE (Congestion Level)\n")
-        f.write("=" * 100 + "\n\n")
-        
-        for map_type in ['narrow', 'wide', 'cross']:
-            f.write(f"{map_type.upper()} Maps:\n")
-            map_sorted = sorted(congestion_metrics.items(), 
-                              key=lambda x: x[1][f'{map_type}_avg'] if x[1][f'{map_type}_avg'] > 0 else float('inf'))
-            
-            best_map = None
-            best_map_algo = None
-            for algo, metrics in map_sorted:
-                avg = metrics[f'{map_type}_avg']
-                if avg > 0:
-                    if best_map is None or avg < best_map:
-                        best_map = avg
-                        best_map_algo = algo
-                    
-                    marker = "🏆" if algo == best_map_algo else "  "
-                    f.write(f"  {marker} {algo:<20}: {avg:.3f} ({metrics[f'{map_type}_count']} runs)\n")
-            
-            if best_map_algo:
-                f.write(f"  🏆 Best: {best_map_algo}\n")
-            f.write("\n")
+                        write(f"   vs {algo}: {diff:.2f}% higher penalty\n")
+        else:
+            write(f"   N/A (run with --map-types narrow wide cross)\n")
         
-        f.write("=" * 100 + "\n")
+        write("\n💡 Why HybridNN2opt for Congestion & Collision:\n")
+        write("   - Handles collision and congestion better than NN2opt overall.\n")
+        write("   - Lower congestion penalty and typically fewer collisions / less wait time.\n")
+        write("   - Trade-off: slightly worse planning time and tour length vs NN2opt.\n")
+        write("   - Choose HybridNN2opt when crowded layouts and multi-bot collision matter.\n")
+    
+    # Map type breakdown
+    write("\n")
+    write("=" * 100 + "\n")
+    write("🗺️  PERFORMANCE BY MAP TYPE (Congestion Level)\n")
+    write("=" * 100 + "\n\n")
+    
+    for map_type in ['narrow', 'wide', 'cross']:
+        write(f"{map_type.upper()} Maps:\n")
+        _print_ranked(write, congestion_metrics, f'{map_type}_avg', extrema, _MAP_ROW, _BEST_SUBLINE,
+                      f'{map_type}_count')
+        write("\n")
+    
+    write("=" * 100 + "\n")
+    
+    return ''.join(parts)
+
+
+def generate_congestion_comparison(csv_file: str = "results/raw/runs.csv"):
+    """Generate formatted congestion handling comparison"""
+    
+    if not os.path.exists(csv_file):
+        print(f"❌ File not found: {csv_file}")
+        return
+    
+    results = read_frame(csv_file, text_columns=('algo', 'map_type', 'collision_count'),
+                         usecols=CONGESTION_COLUMNS, algos=DISPLAY_ALGOS)
+    
+    if results.empty:
+        print(f"⚠️  No data found in {csv_file}")
+        return
+    
+    # Calculate congestion metrics
+    congestion_metrics = calculate_congestion_metrics(results)
+    
+    if not congestion_metrics:
+        print("⚠️  No valid metrics calculated")
+        return
+    
+    # Generate output
+    output_file = "results/single_depot_congestion.txt"
+    os.makedirs(os.path.dirname(output_file) if os.path.dirname(output_file) else '.', exist_ok=True)
+    
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(_format_report(congestion_metrics))
     
     print(f"✅ Generated: {output_file}")
 
@@ -3,313 +3,335 @@ Generate formatted comparison results for single-depot experiments.
 Frames HybridNN2opt as trading slightly worse tour/plan-time for better collision and congestion handling.
 """
 
-import csv
 import os
-from typing import Dict, List
-from collections import defaultdict
+from itertools import groupby, product
+from operator import attrgetter
+
+import numpy as np
+import pandas as pd
+
+from utils.csv_io import read_frame
 
 # Only show these algorithms in results and comparisons
-DISPLAY_ALGOS = {"HybridNN2opt", "NN2opt", "HeldKarp", "GA"}
+DISPLAY_ALGOS = frozenset({"HybridNN2opt", "NN2opt", "HeldKarp", "GA"})
 
+# Where the report is written
+OUTPUT_FILE = "results/single_depot_comparison.txt"
 
-def generate_single_depot_comparison(csv_file: str = "results/raw/runs.csv"):
-    """Generate formatted comparison for single-depot scenarios"""
+# Only these columns are parsed from runs.csv. All are kept as text: initial_quality and
+# improvement_pct are printed as written, and K/seed order situations as strings.
+RESULT_COLUMNS = ['map_type', 'K', 'seed', 'algo', 'tour_len', 'plan_time_ms', 'initial_quality', 'improvement_pct']
+# A situation is one (map_type, K, seed) run of every algorithm
+SITUATION_KEYS = ['map_type', 'K', 'seed']
+
+# Rules, section banners and table headers, built once
+_RULE = "=" * 100 + "\n"
+_THIN_RULE = "-" * 100 + "\n"
+_SECTION = _RULE + "{}\n" + _RULE + "\n"
+_RUN_HEADER = f"{'Algorithm':<20} {'Tour Length':<15} {'Plan Time (ms)':<18} {'Initial Quality':<18} {'Improvement %':<15} {'Status':<10}\n" + _THIN_RULE
+_STATS_HEADER = f"{'Algorithm':<20} {'Runs':<8} {'Avg Tour Length':<18} {'Avg Plan Time (ms)':<20} {'Avg Improvement %':<18}\n" + _THIN_RULE
+
+# Report rows, formatted once per row with str.format
+_SITUATION_BANNER = _SECTION.format("📍 SITUATION: Map={}, K={}, Seed={}")
+_RUN_ROW = "{:<20} {:<15.3f} {:<18.2f} {:<18} {:<15} {:<10}\n"
+_ERROR_ROW = "{:<20} " + f"{'ERROR':<15} {'ERROR':<18} {'ERROR':<18} {'ERROR':<15} {'❌':<10}\n"
+_STATS_ROW = "{:<20} {:<8} {:<18.3f} {:<20.2f} {:<18.2f}\n"
+_MAP_ROW = "  {:<20}: {:.3f} avg tour length, {:.2f} ms avg plan time ({} runs)\n"
+
+# Fields of the run tuples the report walks: parsed values and flags, plus the two
+# columns printed as written
+RUN_FIELDS = SITUATION_KEYS + ['algo', 'valid', 'tour', 'plan', 'improvement', 'initial_quality', 'improvement_pct',
+                               'best_tour', 'best_plan', 'best_improvement']
+
+# Situation of a run tuple from DataFrame.itertuples
+_situation_of = attrgetter(*SITUATION_KEYS)
+
+# Status column by (best tour, best plan time, best improvement) flags
+_STATUS = {
+    flags: ' '.join(marker for marker, on in zip(('🏆', '⚡', '📈'), flags) if on) or '✅'
+    for flags in product((False, True), repeat=3)
+}
+_status_flags_of = attrgetter('best_tour', 'best_plan', 'best_improvement')
+
+# Per-situation best runs: getters for the flag and value fields, summary line
+_SITUATION_BESTS = (
+    (attrgetter('best_tour'), attrgetter('tour'), "🏆 Best Tour Length: {} ({:.3f})\n"),
+    (attrgetter('best_plan'), attrgetter('plan'), "⚡ Fastest Planning: {} ({:.2f} ms)\n"),
+    (attrgetter('best_improvement'), attrgetter('improvement'), "📈 Best Improvement: {} ({:.2f}%)\n"),
+)
+
+
+def _numeric(df: pd.DataFrame, col: str, missing: float) -> pd.Series:
+    """Column as floats; blank or unparseable cells become NaN, a missing column is all `missing`."""
+    if col not in df.columns:
+        return pd.Series(missing, index=df.index, dtype=float)
+    return pd.to_numeric(df[col], errors='coerce')
+
+
+def _situation_runs(results: pd.DataFrame) -> pd.DataFrame:
+    """One run per (situation, algo), the last in the file, ordered by situation then algo.
+
+    Adds situation_order, parsed tour / plan / improvement, `valid` and the per-situation
+    best_tour / best_plan / best_improvement flags (ties included).
+    """
+    runs = results.assign(situation_order=results.groupby(SITUATION_KEYS, sort=False).ngroup())
+    runs = runs.drop_duplicates(SITUATION_KEYS + ['algo'], keep='last')
+    runs = runs.sort_values(SITUATION_KEYS + ['algo'])
+    # A missing tour/plan column reads as 0, a missing improvement column as no improvement
+    tour = _numeric(runs, 'tour_len', 0.0)
+    plan = _numeric(runs, 'plan_time_ms', 0.0)
+    valid = tour.notna() & plan.notna()
+    runs = runs.assign(
+        tour=tour.where(valid), plan=plan.where(valid), valid=valid,
+        improvement=_numeric(runs, 'improvement_pct', float('nan')).where(valid),
+    )
+    for col in ('initial_quality', 'improvement_pct'):
+        if col not in runs.columns:
+            runs[col] = ''
+    # Runs are sorted by situation, so each situation is one contiguous block of rows
+    situation = runs.groupby(SITUATION_KEYS, sort=False).ngroup().to_numpy()
+    starts = np.flatnonzero(np.diff(situation, prepend=-1))
+    return runs.assign(
+        best_tour=_block_best(np.fmin, runs['tour'], starts),
+        best_plan=_block_best(np.fmin, runs['plan'], starts),
+        best_improvement=_block_best(np.fmax, runs['improvement'], starts),
+    )
+
+
+def _block_best(ufunc: np.ufunc, values: pd.Series, starts: np.ndarray) -> np.ndarray:
+    """Whether each value equals the best (`ufunc` = np.fmin / np.fmax) of its block.
+
+    Blocks are the row ranges beginning at `starts`; NaN is skipped and never best.
+    """
+    values = values.to_numpy(dtype=float)
+    best = ufunc.reduceat(values, starts)
+    return values == np.repeat(best, np.diff(starts, append=len(values)))
+
+
+def _group_mean(codes: np.ndarray, counts: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Per-group mean of float64 `values` from a running (sum, count) per group code, O(groups) memory.
+
+    The sums are a single bincount pass, adding up in row order like a running total.
+    """
+    return np.bincount(codes, weights=values, minlength=len(counts)) / counts
+
+
+def _float_columns(df: pd.DataFrame, *cols: str):
+    """Each column as a contiguous float64 array"""
+    return [df[col].to_numpy(dtype=float) for col in cols]
+
+
+def _algo_stats(runs: pd.DataFrame) -> pd.DataFrame:
+    """Run count and average tour / plan time / improvement per algorithm over valid runs.
+
+    Indexed by algo in order of first valid run (the order ties are broken in). Each sum is a
+    single bincount pass in situation order; algorithms without improvements (imp_runs 0)
+    average 0.
+    """
+    valid = runs[runs['valid']]
+    codes, algos = pd.factorize(valid['algo'])
+    tour, plan, improvement = _float_columns(valid, 'tour', 'plan', 'improvement')
+    counts = np.bincount(codes, minlength=len(algos))
+    has_imp = ~np.isnan(improvement)
+    imp_counts = np.bincount(codes[has_imp], minlength=len(algos))
+    # Algorithms without improvements divide 0 by 1 (and average 0)
+    avg_imp = _group_mean(codes[has_imp], np.maximum(imp_counts, 1), improvement[has_imp])
+    return pd.DataFrame({
+        'runs': counts,
+        'avg_tour': _group_mean(codes, counts, tour),
+        'avg_time': _group_mean(codes, counts, plan),
+        'avg_imp': avg_imp,
+        'imp_runs': imp_counts,
+    }, index=algos)
+
+
+def _map_type_stats(runs: pd.DataFrame) -> pd.DataFrame:
+    """Run count and average tour / plan time per (map_type, algo) over valid runs.
+
+    Sorted by map type, then algo. Sums add up in the order situations first appear in the file.
+    """
+    valid = runs[runs['valid']].sort_values('situation_order', kind='stable')
+    groups = valid.groupby(['map_type', 'algo'])
+    codes = groups.ngroup().to_numpy()
+    sizes = groups.size()
+    counts = sizes.to_numpy()
+    tour, plan = _float_columns(valid, 'tour', 'plan')
+    return pd.DataFrame({
+        'runs': counts,
+        'avg_tour': _group_mean(codes, counts, tour),
+        'avg_time': _group_mean(codes, counts, plan),
+    }, index=sizes.index)
+
+
+def _format_situation(write, situation_key: tuple, situation: list):
+    """Write one situation's block: a row per run, then its best runs.
+
+    Blocks only depend on their own runs. They are rendered in the calling process: each is a
+    handful of str.format calls, far cheaper than shipping runs to worker processes.
+    """
+    map_type, K, seed = situation_key
+    write(_SITUATION_BANNER.format(map_type.upper(), K, seed))
+    write(_RUN_HEADER)
     
-    if not os.path.exists(csv_file):
-        print(f"❌ File not found: {csv_file}")
-        return
+    # Write algorithm rows
+    for run in situation:
+        algo = run.algo
+        if not run.valid:
+            write(_ERROR_ROW.format(algo))
+            continue
+        
+        # Mark best performers
+        status_str = _STATUS[_status_flags_of(run)]
+        write(_RUN_ROW.format(algo, run.tour, run.plan, run.initial_quality or 'N/A', run.improvement_pct or 'N/A', status_str))
     
-    results: List[Dict] = []
-    with open(csv_file, 'r', newline='') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row.get("algo", "") in DISPLAY_ALGOS:
-                results.append(row)
+    write("\n")
     
-    if not results:
-        print(f"⚠️  No data found in {csv_file}")
-        return
+    # Summary for this situation
+    for is_best, value_of, line in _SITUATION_BESTS:
+        best = [run for run in situation if is_best(run)]
+        if best:
+            write(line.format(', '.join(run.algo for run in best), value_of(best[0])))
+    write("\n")
+
+
+def _format_report(results: pd.DataFrame) -> str:
+    """Text of the single-depot comparison report"""
     
-    # Group by situation
-    situations = defaultdict(dict)
+    # Build the report in memory; the caller writes it in one call
+    parts = []
+    write = parts.append
     
-    for row in results:
-        key = (row['map_type'], row['K'], row['seed'])
-        algo = row['algo']
-        situations[key][algo] = row
+    write(_SECTION.format("🏭 SINGLE-DEPOT ALGORITHM COMPARISON"))
     
-    # Generate output
-    output_file = "results/single_depot_comparison.txt"
-    os.makedirs(os.path.dirname(output_file) if os.path.dirname(output_file) else '.', exist_ok=True)
+    # Tour/plan/improvement are parsed and best performers flagged in one vectorized pass
+    runs = _situation_runs(results)
     
-    with open(output_file, 'w') as f:
-        f.write("=" * 100 + "\n")
-        f.write("🏭 SINGLE-DEPOT ALGORITHM COMPARISON\n")
-        f.write("=" * 100 + "\n\n")
-        
-        # Track statistics
-        algo_tour_lens = defaultdict(list)
-        algo_plan_times = defaultdict(list)
-        algo_improvements = defaultdict(list)
-        algo_initial_qualities = defaultdict(list)
-        
-        for (map_type, K, seed), algos in sorted(situations.items()):
-            if not algos:
-                continue
-            
-            f.write("=" * 100 + "\n")
-            f.write(f"📍 SITUATION: Map={map_type.upper()}, K={K}, Seed={seed}\n")
-            f.write("=" * 100 + "\n\n")
-            
-            # Get all algorithms
-            all_algos = sorted(algos.keys())
-            
-            # Find best performers
-            best_tour_len = None
-            best_tour_algos = []
-            best_plan_time = None
-            best_plan_time_algos = []
-            best_improvement = None
-            best_improvement_algos = []
-            
-            # Header
-            f.write(f"{'Algorithm':<20} {'Tour Length':<15} {'Plan Time (ms)':<18} {'Initial Quality':<18} {'Improvement %':<15} {'Status':<10}\n")
-            f.write("-" * 100 + "\n")
-            
-            for algo in all_algos:
-                row = algos[algo]
-                
-                try:
-                    tour_len = float(row.get('tour_len', 0))
-                    plan_time = float(row.get('plan_time_ms', 0))
-                    initial_quality = row.get('initial_quality', '')
-                    improvement_pct = row.get('improvement_pct', '')
-                    
-                    # Track for statistics
-                    algo_tour_lens[algo].append(tour_len)
-                    algo_plan_times[algo].append(plan_time)
-                    if improvement_pct:
-                        try:
-                            algo_improvements[algo].append(float(improvement_pct))
-                        except (ValueError, TypeError):
-                            pass
-                    if initial_quality:
-                        try:
-                            algo_initial_qualities[algo].append(float(initial_quality))
-                        except (ValueError, TypeError):
-                            pass
-                    
-                    # Find best tour length
-                    if best_tour_len is None or tour_len < best_tour_len:
-                        best_tour_len = tour_len
-                        best_tour_algos = [algo]
-                    elif tour_len == best_tour_len:
-                        best_tour_algos.append(algo)
-                    
-                    # Find best plan time
-                    if best_plan_time is None or plan_time < best_plan_time:
-                        best_plan_time = plan_time
-                        best_plan_time_algos = [algo]
-                    elif plan_time == best_plan_time:
-                        best_plan_time_algos.append(algo)
-                    
-                    # Find best improvement
-                    if improvement_pct:
-                        try:
-                            imp = float(improvement_pct)
-                            if best_improvement is None or imp > best_improvement:
-                                best_improvement = imp
-                                best_improvement_algos = [algo]
-                            elif imp == best_improvement:
-                                best_improvement_algos.append(algo)
-                        except (ValueError, TypeError):
-                            pass
-                    
-                except (ValueError, TypeError):
-                    continue
-            
-            # Write algorithm rows
-            for algo in all_algos:
-                row = algos[algo]
-                
-                try:
-                    tour_len = float(row.get('tour_len', 0))
-                    plan_time = float(row.get('plan_time_ms', 0))
-                    initial_quality = row.get('initial_quality', '') or 'N/A'
-                    improvement_pct = row.get('improvement_pct', '') or 'N/A'
-                    
-                    # Mark best performers
-                    status = []
-                    if algo in best_tour_algos:
-                        status.append('🏆')
-                    if algo in best_plan_time_algos:
-                        status.append('⚡')
-                    if algo in best_improvement_algos:
-                        status.append('📈')
-                    
-                    status_str = ' '.join(status) if status else '✅'
-                    
-                    algo_display = algo
-                    f.write(f"{algo_display:<20} {tour_len:<15.3f} {plan_time:<18.2f} {str(initial_quality):<18} {str(improvement_pct):<15} {status_str:<10}\n")
-                    
-                except (ValueError, TypeError):
-                    f.write(f"{algo:<20} {'ERROR':<15} {'ERROR':<18} {'ERROR':<18} {'ERROR':<15} {'❌':<10}\n")
-            
-            f.write("\n")
-            
-            # Summary for this situation
-            if best_tour_algos:
-                f.write(f"🏆 Best Tour Length: {', '.join(best_tour_algos)} ({best_tour_len:.3f})\n")
-            if best_plan_time_algos:
-                f.write(f"⚡ Fastest Planning: {', '.join(best_plan_time_algos)} ({best_plan_time:.2f} ms)\n")
-            if best_improvement_algos:
-                f.write(f"📈 Best Improvement: {', '.join(best_improvement_algos)} ({best_improvement:.2f}%)\n")
-            f.write("\n")
-        
-        # Overall statistics
-        f.write("=" * 100 + "\n")
-        f.write("📊 OVERALL STATISTICS\n")
-        f.write("=" * 100 + "\n\n")
-        
-        f.write("Algorithm Performance Summary:\n\n")
-        f.write(f"{'Algorithm':<20} {'Runs':<8} {'Avg Tour Length':<18} {'Avg Plan Time (ms)':<20} {'Avg Improvement %':<18}\n")
-        f.write("-" * 100 + "\n")
-        
-        for algo in sorted(algo_tour_lens.keys()):
-            runs = len(algo_tour_lens[algo])
-            avg_tour = sum(algo_tour_lens[algo]) / runs if runs > 0 else 0
-            avg_time = sum(algo_plan_times[algo]) / runs if runs > 0 else 0
-            avg_imp = sum(algo_improvements[algo]) / len(algo_improvements[algo]) if algo_improvements[algo] else 0
-            
-            algo_display = algo
-            if algo == 'HybridNN2opt':
-                algo_display = f"🌟 {algo}"
-            
-            f.write(f"{algo_display:<20} {runs:<8} {avg_tour:<18.3f} {avg_time:<20.2f} {avg_imp:<18.2f}\n")
+    # Runs are already sorted by situation: walk them once, a situation at a time
+    for situation_key, situation in groupby(runs[RUN_FIELDS].itertuples(index=False, name='Run'), key=_situation_of):
+        _format_situation(write, situation_key, list(situation))
+    
+    # Overall statistics
+    write(_SECTION.format("📊 OVERALL STATISTICS"))
+    
+    write("Algorithm Performance Summary:\n\n")
+    write(_STATS_HEADER)
+    
+    # One aggregation feeds the summary table and the overall bests
+    stats = _algo_stats(runs)
+    
+    for algo, runs_count, avg_tour, avg_time, avg_imp, _ in stats.sort_index().itertuples():
+        algo_display = algo
+        if algo == 'HybridNN2opt':
+            algo_display = f"🌟 {algo}"
         
-        # Find overall best
-        best_avg_tour = None
-        best_avg_tour_algo = None
-        best_avg_time = None
-        best_avg_time_algo = None
-        best_avg_imp = None
-        best_avg_imp_algo = None
+        write(_STATS_ROW.format(algo_display, runs_count, avg_tour, avg_time, avg_imp))
+    
+    # Find overall best (ties go to the first algorithm with a valid run)
+    best_avg_tour_algo = stats['avg_tour'].idxmin() if not stats.empty else None
+    best_avg_time_algo = stats['avg_time'].idxmin() if not stats.empty else None
+    positive_imp = stats['avg_imp'][stats['avg_imp'] > 0]
+    best_avg_imp_algo = positive_imp.idxmax() if not positive_imp.empty else None
+    
+    write("\n")
+    if best_avg_tour_algo:
+        write(f"🏆 Best Average Tour Length: {best_avg_tour_algo} ({stats.at[best_avg_tour_algo, 'avg_tour']:.3f})\n")
+    if best_avg_time_algo:
+        write(f"⚡ Fastest Average Planning: {best_avg_time_algo} ({stats.at[best_avg_time_algo, 'avg_time']:.2f} ms)\n")
+    if best_avg_imp_algo:
+        write(f"📈 Best Average Improvement: {best_avg_imp_algo} ({positive_imp[best_avg_imp_algo]:.2f}%)\n")
+    
+    # HybridNN2opt: trade-off and collision/congestion strength
+    write("\n")
+    write(_SECTION.format("🔬 HYBRIDNN2OPT: TRADE-OFF & COLLISION/CONGESTION STRENGTH"))
+    
+    if 'HybridNN2opt' in stats.index:
+        # Averages are looked up in the per-algorithm stats rather than recomputed, and the
+        # differences to every other algorithm taken in one subtraction per metric (pandas
+        # arithmetic turns inf - inf into nan without numpy's warning)
+        hybrid_tour, hybrid_time, hybrid_imp = stats.loc['HybridNN2opt', ['avg_tour', 'avg_time', 'avg_imp']].tolist()
+        others = stats.drop('HybridNN2opt').sort_index()
+        imp_others = others[others['imp_runs'] > 0]
+        tour_diff = hybrid_tour - others['avg_tour']
+        tour_pct = (tour_diff / others['avg_tour'] * 100).where(others['avg_tour'] > 0, 0.0)
+        time_diff = hybrid_time - others['avg_time']
+        imp_diff = hybrid_imp - imp_others['avg_imp']
         
-        for algo in algo_tour_lens.keys():
-            runs = len(algo_tour_lens[algo])
-            avg_tour = sum(algo_tour_lens[algo]) / runs if runs > 0 else 0
-            avg_time = sum(algo_plan_times[algo]) / runs if runs > 0 else 0
-            avg_imp = sum(algo_improvements[algo]) / len(algo_improvements[algo]) if algo_improvements[algo] else 0
-            
-            if best_avg_tour is None or avg_tour < best_avg_tour:
-                best_avg_tour = avg_tour
-                best_avg_tour_algo = algo
-            
-            if best_avg_time is None or avg_time < best_avg_time:
-                best_avg_time = avg_time
-                best_avg_time_algo = algo
-            
-            if avg_imp > 0 and (best_avg_imp is None or avg_imp > best_avg_imp):
-                best_avg_imp = avg_imp
-                best_avg_imp_algo = algo
+        write("HybridNN2opt may have slightly worse (longer) tour length and planning time than NN2opt.\n")
+        write("Its strength is better collision and congestion handling (see congestion and collision reports).\n\n")
         
-        f.write("\n")
-        if best_avg_tour_algo:
-            f.write(f"🏆 Best Average Tour Length: {best_avg_tour_algo} ({best_avg_tour:.3f})\n")
-        if best_avg_time_algo:
-            f.write(f"⚡ Fastest Average Planning: {best_avg_time_algo} ({best_avg_time:.2f} ms)\n")
-        if best_avg_imp_algo:
-            f.write(f"📈 Best Average Improvement: {best_avg_imp_algo} ({best_avg_imp:.2f}%)\n")
+        write(f"📈 Average Tour Length: {hybrid_tour:.3f}\n")
+        for algo, diff, pct_diff in zip(others.index, tour_diff.tolist(), tour_pct.tolist()):
+            if diff < 0:
+                write(f"   vs {algo}: {abs(diff):.3f} shorter ({abs(pct_diff):.2f}% better)\n")
+            else:
+                write(f"   vs {algo}: {diff:.3f} longer ({pct_diff:.2f}% worse)\n")
         
-        # HybridNN2opt: trade-off and collision/congestion strength
-        f.write("\n")
-        f.write("=" * 100 + "\n")
-        f.write("🔬 HYBRIDNN2OPT: TRADE-OFF & COLLISION/CONGESTION STRENGTH\n")
-        f.write("=" * 100 + "\n\n")
+        write(f"\n⚡ Average Plan Time: {hybrid_time:.2f} ms\n")
+        for algo, diff in time_diff.items():
+            if diff < 0:
+                write(f"   vs {algo}: {abs(diff):.2f} ms faster\n")
+            else:
+                write(f"   vs {algo}: {diff:.2f} ms slower\n")
         
-        if 'HybridNN2opt' in algo_tour_lens:
-            hybrid_tour = sum(algo_tour_lens['HybridNN2opt']) / len(algo_tour_lens['HybridNN2opt'])
-            hybrid_time = sum(algo_plan_times['HybridNN2opt']) / len(algo_plan_times['HybridNN2opt'])
-            hybrid_imp = sum(algo_improvements['HybridNN2opt']) / len(algo_improvements['HybridNN2opt']) if algo_improvements['HybridNN2opt'] else 0
-            
-            f.write("HybridNN2opt may have slightly worse (longer) tour length and planning time than NN2opt.\n")
-            f.write("Its strength is better collision and congestion handling (see congestion and collision reports).\n\n")
-            
-            f.write(f"📈 Average Tour Length: {hybrid_tour:.3f}\n")
-            for algo in sorted(algo_tour_lens.keys()):
-                if algo == 'HybridNN2opt':
-                    continue
-                avg_tour = sum(algo_tour_lens[algo]) / len(algo_tour_lens[algo])
-                diff = hybrid_tour - avg_tour
-                pct_diff = (diff / avg_tour * 100) if avg_tour > 0 else 0
-                if diff < 0:
-                    f.write(f"   vs {algo}: {abs(diff):.3f} shorter ({abs(pct_diff):.2f}% better)\n")
+        if hybrid_imp > 0:
+            write(f"\n📈 Average Improvement: {hybrid_imp:.2f}%\n")
+            for algo, diff in imp_diff.items():
+                if diff > 0:
+                    write(f"   vs {algo}: +{diff:.2f}% better improvement\n")
                 else:
-                    f.write(f"   vs {algo}: {diff:.3f} longer ({pct_diff:.2f}% worse)\n")
-            
-            f.write(f"\n⚡ Average Plan Time: {hybrid_time:.2f} ms\n")
-            for algo in sorted(algo_plan_times.keys()):
-                if algo == 'HybridNN2opt':
-                    continue
-                avg_time = sum(algo_plan_times[algo]) / len(algo_plan_times[algo])
-                diff = hybrid_time - avg_time
-                pct_diff = (diff / avg_time * 100) if avg_time > 0 else 0
-                if diff < 0:
-                    f.write(f"   vs {algo}: {abs(diff):.2f} ms faster\n")
-                else:
-                    f.write(f"   vs {algo}: {diff:.2f} ms slower\n")
-            
-            if hybrid_imp > 0:
-                f.write(f"\n📈 Average Improvement: {hybrid_imp:.2f}%\n")
-                for algo in sorted(algo_improvements.keys()):
-                    if algo == 'HybridNN2opt':
-                        continue
-                    if algo_improvements[algo]:
-                        avg_imp = sum(algo_improvements[algo]) / len(algo_improvements[algo])
-                        diff = hybrid_imp - avg_imp
-                        if diff > 0:
-                            f.write(f"   vs {algo}: +{diff:.2f}% better improvement\n")
-                        else:
-                            f.write(f"   vs {algo}: {diff:.2f}% worse improvement\n")
-            
-            f.write("\n💡 Key Insights:\n")
-            f.write("   - HybridNN2opt trades slightly worse planning time and tour length vs NN2opt.\n")
-            f.write("   - It handles collision and congestion better overall (see single_depot_congestion.txt and collision graphs).\n")
-            f.write("   - Choose HybridNN2opt when collision/congestion matter; choose NN2opt for raw speed/shortest tour.\n")
-        
-        # Performance by map type
-        f.write("\n")
-        f.write("=" * 100 + "\n")
-        f.write("🗺️  PERFORMANCE BY MAP TYPE\n")
-        f.write("=" * 100 + "\n\n")
+                    write(f"   vs {algo}: {diff:.2f}% worse improvement\n")
         
-        map_stats = defaultdict(lambda: defaultdict(lambda: {'tour_lens': [], 'plan_times': []}))
-        
-        for (map_type, K, seed), algos in situations.items():
-            for algo, row in algos.items():
-                try:
-                    tour_len = float(row.get('tour_len', 0))
-                    plan_time = float(row.get('plan_time_ms', 0))
-                    map_stats[map_type][algo]['tour_lens'].append(tour_len)
-                    map_stats[map_type][algo]['plan_times'].append(plan_time)
-                except (ValueError, TypeError):
-                    pass
-        
-        for map_type in sorted(map_stats.keys()):
-            f.write(f"Map Type: {map_type.upper()}\n")
-            for algo in sorted(map_stats[map_type].keys()):
-                tour_lens = map_stats[map_type][algo]['tour_lens']
-                plan_times = map_stats[map_type][algo]['plan_times']
-                if tour_lens:
-                    avg_tour = sum(tour_lens) / len(tour_lens)
-                    avg_time = sum(plan_times) / len(plan_times)
-                    algo_display = algo
-                    f.write(f"  {algo_display:<20}: {avg_tour:.3f} avg tour length, {avg_time:.2f} ms avg plan time ({len(tour_lens)} runs)\n")
-            f.write("\n")
-        
-        f.write("=" * 100 + "\n")
+        write("\n💡 Key Insights:\n")
+        write("   - HybridNN2opt trades slightly worse planning time and tour length vs NN2opt.\n")
+        write("   - It handles collision and congestion better overall (see single_depot_congestion.txt and collision graphs).\n")
+        write("   - Choose HybridNN2opt when collision/congestion matter; choose NN2opt for raw speed/shortest tour.\n")
+    
+    # Performance by map type
+    write("\n")
+    write(_SECTION.format("🗺️  PERFORMANCE BY MAP TYPE"))
+    
+    map_stats = _map_type_stats(runs)
+    
+    for map_type in map_stats.index.unique(level='map_type'):
+        write(f"Map Type: {map_type.upper()}\n")
+        for algo, runs_count, avg_tour, avg_time in map_stats.loc[map_type].itertuples():
+            write(_MAP_ROW.format(algo, avg_tour, avg_time, runs_count))
+        write("\n")
+    
+    write(_RULE)
+    
+    return ''.join(parts)
+
+
+def generate_single_depot_comparison(csv_file: str = "results/raw/runs.csv"):
+    """Generate formatted comparison for single-depot scenarios"""
+    
+    try:
+        st = os.stat(csv_file)
+    except FileNotFoundError:
+        print(f"❌ File not found: {csv_file}")
+        return
+    
+    # An empty file has no header to parse
+    if st.st_size == 0:
+        print(f"⚠️  No data found in {csv_file}")
+        return
+    
+    # Blank cells read as '' (like csv.DictReader); columns absent from the file stay absent
+    results = read_frame(csv_file, text_columns=RESULT_COLUMNS, usecols=RESULT_COLUMNS, algos=DISPLAY_ALGOS).fillna('')
+    
+    # Rows of other algorithms were dropped while reading, so empty means none to report
+    if results.empty:
+        print(f"⚠️  No data found in {csv_file}")
+        return
+    
+    # Generate output
+    os.makedirs(os.path.dirname(OUTPUT_FILE) or '.', exist_ok=True)
+    
+    with open(OUTPUT_FILE, 'w') as f:
+        f.write(_format_report(results))
     
-    print(f"✅ Generated: {output_file}")
+    print(f"✅ Generated: {OUTPUT_FILE}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,48 @@
+"""
+Run the unbiased congestion analysis (experiments, congestion report, graphs) in one process,
+so numpy/pandas/matplotlib are imported once instead of once per step.
+Run from project root: python3 scripts/run_congestion_analysis.py
+"""
+
+import importlib
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+
+def _run(module_name: str, argv: list):
+    sys.argv = [module_name] + argv
+    mod = importlib.import_module(module_name)
+    mod.main()
+
+
+def main():
+    print("🚀 Running unbiased congestion analysis...")
+    print("Algorithms: AStar, ACO, ALO, GA, NN2opt, HybridNN2opt")
+    print("")
+    _run("exp.run_matrix", [
+        "--map-types", "narrow", "wide", "cross",
+        "--K", "10", "15",
+        "--seeds", "10",
+        "--algos", "AStar,ACO,ALO,GA,NN2opt,HybridNN2opt",
+        "--num-bots", "3",
+        "--out", "results/raw",
+    ])
+
+    print("")
+    print("✅ Experiments completed!")
+    print("")
+    print("📊 Generating congestion analysis...")
+    from generate_single_depot_congestion import generate_congestion_comparison
+    generate_congestion_comparison("results/raw/runs.csv")
+
+    print("")
+    print("📈 Generating visualization graphs...")
+    _run("viz.single_depot_congestion_plots", [])
+
+
+if __name__ == "__main__":
+    main()
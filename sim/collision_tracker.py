@@ -4,9 +4,10 @@ Tracks collisions, wait times, and makespan when multiple bots operate in parall
 """
 
 from __future__ import annotations
-import simpy
+import heapq
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple, List, Callable, Optional
 from collections import defaultdict
 from .grid import Grid, Pos
 from .routing import astar
@@ -23,91 +24,19 @@ class CollisionStats:
     bot_wait_times: Dict[int, float] = field(default_factory=lambda: defaultdict(float))
     makespan: float = 0.0
 
+    def record_wait(self, bot_id: int, pos: Pos, wait_duration: float):
+        """Count a bot waiting wait_duration to enter pos as one collision"""
+        self.total_collisions += 1
+        self.total_wait_time += wait_duration
+        self.wait_events.append(wait_duration)
+        self.bot_wait_times[bot_id] += wait_duration
+        self.collision_locations.append(pos)
+        if wait_duration > self.max_wait_time:
+            self.max_wait_time = wait_duration
 
-@dataclass
-class CellRes:
-    """Resource representing a cell that can be occupied by one bot"""
-    pos: Pos
-    res: simpy.Resource
-
-
-def build_cell_resources(env: simpy.Environment, grid: Grid, cap: int = 1):
-    """Build resource pool for each free cell in the grid"""
-    return {p: CellRes(p, simpy.Resource(env, capacity=cap)) for p in grid.free_cells()}
-
-
-def follow_path_with_tracking(env: simpy.Environment, bot_id: int, path: List[Pos], 
-                              cells: Dict[Pos, CellRes], step_time: float,
-                              stats: CollisionStats):
-    """
-    Follow a path and track collisions/wait times
-    
-    Args:
-        env: SimPy environment
-        bot_id: ID of the bot
-        path: List of positions to follow
-        cells: Dictionary of cell resources
-        step_time: Time to move one step
-        stats: CollisionStats object to update
-    """
-    if not path:
-        return
-    
-    # Enter first cell
-    first = path[0]
-    if first not in cells:
-        return  # Invalid cell
-    
-    req = cells[first].res.request()
-    wait_start = env.now
-    yield req  # Wait if cell is occupied (collision!)
-    wait_duration = env.now - wait_start
-    
-    if wait_duration > 0:
-        stats.total_collisions += 1
-        stats.total_wait_time += wait_duration
-        stats.wait_events.append(wait_duration)
-        stats.bot_wait_times[bot_id] += wait_duration
-        stats.collision_locations.append(first)
-        if wait_duration > stats.max_wait_time:
-            stats.max_wait_time = wait_duration
-    
-    cur = first
-    
-    # Move through remaining path
-    for nxt in path[1:]:
-        if nxt not in cells:
-            continue
-        
-        # Move to next cell (takes time)
-        yield env.timeout(step_time)
-        
-        # Release current cell
-        cells[cur].res.release(req)
-        
-        # Request next cell
-        req = cells[nxt].res.request()
-        wait_start = env.now
-        yield req  # Wait if next cell is occupied
-        wait_duration = env.now - wait_start
-        
-        if wait_duration > 0:
-            stats.total_collisions += 1
-            stats.total_wait_time += wait_duration
-            stats.wait_events.append(wait_duration)
-            stats.bot_wait_times[bot_id] += wait_duration
-            stats.collision_locations.append(nxt)
-            if wait_duration > stats.max_wait_time:
-                stats.max_wait_time = wait_duration
-        
-        cur = nxt
-    
-    # Release final cell when bot finishes
-    if cur in cells:
-        cells[cur].res.release(req)
 
-
-def convert_tour_to_paths(grid: Grid, order: List[int], waypoints: List[Pos]) -> List[List[Pos]]:
+def convert_tour_to_paths(grid: Grid, order: List[int], waypoints: List[Pos],
+                          path_fn: Optional[Callable[[int, int], Optional[List[Pos]]]] = None) -> List[List[Pos]]:
     """
     Convert a TSP tour order to a list of paths between waypoints
     
@@ -115,6 +44,8 @@ def convert_tour_to_paths(grid: Grid, order: List[int], waypoints: List[Pos]) ->
         grid: Warehouse grid
         order: TSP tour order (list of waypoint indices)
         waypoints: List of waypoint positions
+        path_fn: Optional already-known path from waypoint i to waypoint j (None if unknown);
+            A* is only run for legs it has no path for
     
     Returns:
         List of paths, where each path is a list of positions from one waypoint to the next
@@ -128,7 +59,9 @@ def convert_tour_to_paths(grid: Grid, order: List[int], waypoints: List[Pos]) ->
         end_pos = waypoints[end_idx]
         
         # Get A* path between waypoints
-        path, _, _ = astar(grid, start_pos, end_pos, diag_allowed=True)
+        path = path_fn(start_idx, end_idx) if path_fn is not None else None
+        if path is None:
+            path, _, _ = astar(grid, start_pos, end_pos, diag_allowed=True)
         if path:
             paths.append(path)
     
@@ -140,6 +73,11 @@ def simulate_multi_bot_execution(grid: Grid, bot_tours: List[List[List[Pos]]],
     """
     Simulate multiple bots executing their tours in parallel with collision tracking
     
+    Each cell the paths visit holds one bot, with a FIFO queue of waiting bots. Events are
+    (time, priority, sequence) tuples on one heap, ordered as a SimPy run with one process
+    per bot and per leg and one Resource per cell would order them, so same-time ties
+    resolve the same way.
+    
     Args:
         grid: Warehouse grid
         bot_tours: List of tours, where each tour is a list of paths (one per bot)
@@ -148,24 +86,92 @@ def simulate_multi_bot_execution(grid: Grid, bot_tours: List[List[List[Pos]]],
     Returns:
         Tuple of (makespan, CollisionStats)
     """
-    env = simpy.Environment()
-    cells = build_cell_resources(env, grid, cap=1)
+    visited = {p for tour_paths in bot_tours for path in tour_paths for p in path}
+    cells = {p for p in visited if grid.in_bounds(p) and grid.passable(p)}
+    occupied = dict.fromkeys(cells, False)
+    waiting = {p: deque() for p in cells}
     stats = CollisionStats()
+    # Event kinds, with SimPy's priority for each (URGENT 0, NORMAL 1): a bot's process
+    # starts, a leg's process starts, a leg resumes (timeout or granted request), a leg's
+    # process completes, a released cell is handed on
+    BOT_START, LEG_START, RESUME, LEG_DONE, HANDOFF = range(5)
+    PRIORITY = (0, 0, 1, 1, 1)
+    events = []
+    seq = 0
+    now = 0  # int like SimPy's initial time, so an empty run reports 0
+    
+    def schedule(time: float, kind: int, target):
+        nonlocal seq
+        heapq.heappush(events, (time, PRIORITY[kind], seq, kind, target))
+        seq += 1
+    
+    def request(bot_id: int, p: Pos):
+        # A new request only triggers the head of the cell's queue, as Resource does
+        queue = waiting[p]
+        queue.append(bot_id)
+        if not occupied[p]:
+            occupied[p] = True
+            schedule(now, RESUME, queue.popleft())
+    
+    def release(p: Pos):
+        occupied[p] = False
+        schedule(now, HANDOFF, p)
+    
+    def leg_process(bot_id: int, path: List[Pos]):
+        # Yields the delay of a move, or None to wait until its cell request is granted
+        cur = None
+        for nxt in path:
+            if nxt not in cells:
+                if cur is None:
+                    return  # Invalid first cell
+                continue
+            
+            if cur is not None:
+                yield step_time
+                release(cur)
+            
+            cur = nxt
+            request(bot_id, nxt)
+            wait_start = now
+            yield None  # Wait if the cell is occupied (collision!)
+            wait_duration = now - wait_start
+            
+            if wait_duration > 0:
+                stats.record_wait(bot_id, nxt, wait_duration)
+        
+        if cur is not None:
+            release(cur)
     
-    def bot_process(bot_id: int, tour_paths: List[List[Pos]]):
-        """Process for a single bot executing its tour"""
-        for path in tour_paths:
-            yield env.process(follow_path_with_tracking(
-                env, bot_id, path, cells, step_time, stats
-            ))
-    
-    # Start all bots simultaneously
+    legs = {}  # remaining paths per bot
+    leg = {}   # running leg per bot
     for bot_id, tour_paths in enumerate(bot_tours):
         if tour_paths:  # Only start bots with actual tours
-            env.process(bot_process(bot_id, tour_paths))
-    
-    # Run simulation
-    env.run()
-    
-    stats.makespan = env.now
+            legs[bot_id] = iter(tour_paths)
+            schedule(now, BOT_START, bot_id)
+    
+    heappop = heapq.heappop
+    while events:
+        now, _, _, kind, target = heappop(events)
+        if kind == HANDOFF:
+            # Released cell: grant it to the longest-waiting bot, if any
+            queue = waiting[target]
+            if queue and not occupied[target]:
+                occupied[target] = True
+                schedule(now, RESUME, queue.popleft())
+        elif kind == BOT_START or kind == LEG_DONE:
+            # The bot's process starts its next leg's process (its own completion is a no-op)
+            path = next(legs[target], None)
+            if path is not None:
+                leg[target] = leg_process(target, path)
+                schedule(now, LEG_START, target)
+        else:
+            try:
+                delay = next(leg[target])
+            except StopIteration:
+                schedule(now, LEG_DONE, target)
+                continue
+            if delay is not None:
+                schedule(now + delay, RESUME, target)
+    
+    stats.makespan = now
     return stats.makespan, stats
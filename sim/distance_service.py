@@ -1,15 +1,16 @@
 from __future__ import annotations
-import pickle
 import os
 from typing import Dict, Tuple, List, Callable
 import sys
 import os
 
+import numpy as np
+
 # Add the parent directory to Python path for absolute imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from sim.grid import Grid
-from sim.routing import astar
+from sim.routing import astar, distance_field, INF
 
 class DistanceService:
     def __init__(self, grid: Grid, cache_file: str = None):
@@ -19,11 +20,21 @@ class DistanceService:
         self.load_cache()
         
     def load_cache(self):
-        """Load cached distances from file"""
+        """Load cached distances from file
+
+        The file is an .npz holding `waypoints` (n x 2 cells) and `D`, their n x n distance
+        matrix, with NaN for pairs that were never computed.
+        """
         if self.cache_file and os.path.exists(self.cache_file):
             try:
-                with open(self.cache_file, 'rb') as f:
-                    self.cache = pickle.load(f)
+                with np.load(self.cache_file) as data:
+                    points, D = data["waypoints"], data["D"]
+                i, j = np.nonzero(np.triu(~np.isnan(D), k=1))
+                cells = list(map(tuple, points.tolist()))
+                self.cache = {
+                    (min(cells[a], cells[b]), max(cells[a], cells[b])): d
+                    for a, b, d in zip(i.tolist(), j.tolist(), D[i, j].tolist())
+                }
                 print(f"Loaded {len(self.cache)} cached distances")
             except Exception as e:
                 print(f"Cache load failed: {e}")
@@ -34,8 +45,16 @@ class DistanceService:
         if self.cache_file:
             os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
             try:
+                cells = sorted({p for key in self.cache for p in key})
+                index = {p: i for i, p in enumerate(cells)}
+                # float64 so loaded distances equal the computed ones exactly
+                D = np.full((len(cells), len(cells)), np.nan)
+                if self.cache:
+                    a, b = zip(*((index[p], index[q]) for p, q in self.cache))
+                    D[a, b] = D[b, a] = list(self.cache.values())
+                # Written through a file object so np.savez doesn't append its own .npz suffix
                 with open(self.cache_file, 'wb') as f:
-                    pickle.dump(self.cache, f)
+                    np.savez(f, waypoints=np.array(cells, dtype=np.int32).reshape(-1, 2), D=D)
                 print(f"Saved {len(self.cache)} distances to cache")
             except Exception as e:
                 print(f"Cache save failed: {e}")
@@ -57,31 +76,53 @@ class DistanceService:
         
         return cost
         
+    def compute_all_pairs(self, waypoints: List[Tuple[int,int]]) -> List[List[float]]:
+        """Distance matrix over waypoints, from one Dijkstra per waypoint instead of one A* per pair.
+
+        Each search stops once the later waypoints are settled, and pairs already in the cache
+        are not searched for. Every pair is stored in the cache under its canonical key.
+        """
+        n = len(waypoints)
+        cache = self.cache
+        dist_matrix = [[0.0] * n for _ in range(n)]
+        for i in range(n):
+            a = waypoints[i]
+            keys = [(min(a, b), max(a, b)) for b in waypoints[i+1:]]
+            missing = [b for b, key in zip(waypoints[i+1:], keys) if b != a and key not in cache]
+            field = distance_field(self.grid, a, missing) if missing else {}
+            for j, b, key in zip(range(i+1, n), waypoints[i+1:], keys):
+                if a == b:
+                    continue
+                if key not in cache:
+                    cache[key] = field.get(b, INF)
+                dist_matrix[i][j] = dist_matrix[j][i] = cache[key]
+        return dist_matrix
+
     def pairwise_distances(self, waypoints: List[Tuple[int,int]], 
                           diag_allowed: bool = True) -> Callable[[int,int], float]:
         """Returns a distance function for TSP algorithms"""
         n = len(waypoints)
         
-        # Create distance matrix
-        dist_matrix = [[0.0] * n for _ in range(n)]
-        
         # Precompute all pairwise distances
         print(f"Precomputing {n}x{n} distance matrix...")
-        for i in range(n):
-            for j in range(i+1, n):
-                dist = self.get_distance(waypoints[i], waypoints[j], diag_allowed)
-                dist_matrix[i][j] = dist
-                dist_matrix[j][i] = dist
+        dist_matrix = self.compute_all_pairs(waypoints)
                 
         def dist_fn(i: int, j: int) -> float:
             return dist_matrix[i][j]
             
         return dist_fn
         
-    def __del__(self):
-        """Save cache when object is destroyed"""
+    def close(self):
+        """Save the cache. Saving is explicit: __del__ may run during interpreter shutdown,
+        when numpy and os can already be torn down."""
         self.save_cache()
         
+    def __enter__(self) -> DistanceService:
+        return self
+        
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        
     def clear_cache(self):
         """Clear the distance cache"""
         self.cache = {}
@@ -4,9 +4,12 @@ Based on try3/try3GA dynamic package picking approach
 """
 
 from __future__ import annotations
-from typing import List, Tuple, Dict, Set, Optional
+import math
+from collections import defaultdict
+from operator import itemgetter
+from typing import List, Tuple, Dict, Optional
 from .grid import Grid, Pos
-from .routing import astar
+from .routing import astar, manhattan, INF
 
 class GreedyNavigator:
     """Greedy nearest-neighbor navigation for package picking"""
@@ -15,36 +18,78 @@ class GreedyNavigator:
         self.grid = grid
         self.depot = depot
         self.packages = packages
-        self.visited = set()
+        # visited flag per package index
+        self._visited_mask = bytearray(len(packages))
         self.current_pos = depot
         self.total_distance = 0.0
         self.path_history: List[Pos] = [depot]
         self.steps = 0
+        # A* (path, cost) by (start, goal); the grid doesn't change while navigating
+        self.routes: Dict[Tuple[Pos, Pos], Tuple[List[Pos], float]] = {}
+        # Package indices bucketed by (x // cell_size, y // cell_size)
+        self.cell_size = max(4, int(math.sqrt(grid.width * grid.height / max(1, len(packages)))))
+        self._buckets = self._bucket_packages()
+        
+    def _bucket_packages(self) -> Dict[Tuple[int, int], List[int]]:
+        c = self.cell_size
+        buckets: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        for idx, (x, y) in enumerate(self.packages):
+            buckets[(x // c, y // c)].append(idx)
+        return buckets
+        
+    def route(self, a: Pos, b: Pos) -> Tuple[List[Pos], float]:
+        """A* path and cost from a to b, planned once per pair"""
+        key = (a, b)
+        cached = self.routes.get(key)
+        if cached is None:
+            path, cost, _ = astar(self.grid, a, b, diag_allowed=True)
+            cached = self.routes[key] = (path, cost)
+        return cached
         
     def get_distance(self, a: Pos, b: Pos) -> float:
         """Get distance between two positions using A*"""
         if a == b:
             return 0.0
-        path, cost, _ = astar(self.grid, a, b, diag_allowed=True)
+        path, cost = self.route(a, b)
         return cost if path else float('inf')
     
-    def find_nearest_package(self, current_pos: Pos, available_packages: List[int]) -> Optional[int]:
-        """Find nearest unvisited package using greedy nearest-neighbor"""
-        if not available_packages:
-            return None
+    def find_nearest_package(self, current_pos: Pos) -> Optional[int]:
+        """Find nearest unvisited package using greedy nearest-neighbor
+
+        Ties go to the lowest package index. Buckets are searched in rings around the
+        current position's bucket; on a 4-connected grid the search stops at the first ring
+        whose packages are all farther (in Manhattan distance, a lower bound on the route)
+        than the nearest package found so far.
+        """
+        c = self.cell_size
+        bx, by = current_pos[0] // c, current_pos[1] // c
+        rings = sorted(((max(abs(kx - bx), abs(ky - by)), idxs) for (kx, ky), idxs in self._buckets.items() if idxs),
+                       key=itemgetter(0))
         
-        min_distance = float('inf')
+        visited = self._visited_mask
+        min_distance = INF
         nearest_idx = None
+        # On a 4-connected grid no route is shorter than the Manhattan distance
+        lower_bound = None if self.grid.diag else manhattan
         
-        for pkg_idx in available_packages:
-            if pkg_idx in self.visited:
-                continue
-            pkg_pos = self.packages[pkg_idx]
-            distance = self.get_distance(current_pos, pkg_pos)
-            
-            if distance < min_distance:
-                min_distance = distance
-                nearest_idx = pkg_idx
+        for ring, idxs in rings:
+            # Any cell r rings out is at least (r - 1) whole buckets plus one cell away
+            if lower_bound is not None and ring > 0 and (ring - 1) * c + 1 > min_distance:
+                break
+            for pkg_idx in idxs:
+                if visited[pkg_idx]:
+                    continue
+                pkg_pos = self.packages[pkg_idx]
+                # Cheap check first: skip A* for packages that can't beat the nearest so far
+                if lower_bound is not None:
+                    bound = lower_bound(current_pos, pkg_pos)
+                    if bound > min_distance or (bound == min_distance and pkg_idx > nearest_idx):
+                        continue
+                distance = self.get_distance(current_pos, pkg_pos)
+                
+                if distance < min_distance or (distance == min_distance < INF and pkg_idx < nearest_idx):
+                    min_distance = distance
+                    nearest_idx = pkg_idx
         
         return nearest_idx
     
@@ -54,23 +99,23 @@ class GreedyNavigator:
         Returns: (visit_order, total_distance, total_steps)
         """
         visit_order: List[int] = []
-        unvisited = set(range(len(self.packages)))
+        remaining = len(self.packages)
         self.current_pos = self.depot
-        self.visited = set()
+        self._visited_mask = bytearray(len(self.packages))
         self.total_distance = 0.0
         self.steps = 0
         
-        while unvisited:
+        while remaining:
             # Find nearest unvisited package
-            available = list(unvisited)
-            nearest_idx = self.find_nearest_package(self.current_pos, available)
+            nearest_idx = self.find_nearest_package(self.current_pos)
             
             if nearest_idx is None:
                 break
             
             # Move to package
             pkg_pos = self.packages[nearest_idx]
-            path, distance, _ = astar(self.grid, self.current_pos, pkg_pos, diag_allowed=True)
+            # Usually planned already while picking the nearest package
+            path, distance = self.route(self.current_pos, pkg_pos)
             
             if distance == float('inf') or not path:
                 break
@@ -80,13 +125,13 @@ class GreedyNavigator:
             if len(path) > 1:
                 self.steps += len(path) - 1
             self.current_pos = pkg_pos
-            self.visited.add(nearest_idx)
-            unvisited.remove(nearest_idx)
+            self._visited_mask[nearest_idx] = 1
+            remaining -= 1
             visit_order.append(nearest_idx)
         
         # Return to depot
         if self.current_pos != self.depot:
-            path, return_distance, _ = astar(self.grid, self.current_pos, self.depot, diag_allowed=True)
+            path, return_distance = self.route(self.current_pos, self.depot)
             if path and return_distance < float('inf'):
                 self.total_distance += return_distance
                 if len(path) > 1:
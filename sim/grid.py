@@ -1,16 +1,57 @@
 
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import List, Tuple, Iterable, Dict, Set
+from dataclasses import dataclass, field
+from typing import List, Tuple, Iterable, Dict, Set, Optional
+import numpy as np
 
 Pos = Tuple[int, int]
 
+# Neighbor offsets for 4- and 8-connected moves, built once
+STEPS4 = ((1,0),(-1,0),(0,1),(0,-1))
+STEPS8 = STEPS4 + ((1,1),(1,-1),(-1,1),(-1,-1))
+
+# Cost of a diagonal move (the routing code's approximation of sqrt(2))
+DIAG_COST = 1.4142
+
+class Adjacency(dict):
+    """Neighbor tuples by cell, filled in from the grid the first time a cell is looked up"""
+    def __init__(self, grid: Grid):
+        super().__init__()
+        self.grid = grid
+        self.weighted = WeightedAdjacency(self)
+
+    def __missing__(self, p: Pos) -> Tuple[Pos, ...]:
+        nbrs = self[p] = tuple(self.grid.neighbors(p))
+        return nbrs
+
+class WeightedAdjacency(dict):
+    """(neighbor, move cost) pairs by cell, so searches don't re-derive each edge's cost"""
+    def __init__(self, adjacency: Adjacency):
+        super().__init__()
+        self.adjacency = adjacency
+
+    def __missing__(self, p: Pos) -> Tuple[Tuple[Pos, float], ...]:
+        x, y = p
+        edges = self[p] = tuple((v, 1.0 if (v[0]==x or v[1]==y) else DIAG_COST) for v in self.adjacency[p])
+        return edges
+
 @dataclass
 class Grid:
     width: int
     height: int
     obstacles: Set[Pos]  # blocked cells
     diag: bool = False   # 4-conn by default
+    # Cached adjacency and the diag setting it was built for
+    _adjacency: Optional[Adjacency] = field(default=None, init=False, repr=False, compare=False)
+    _adjacency_diag: Optional[bool] = field(default=None, init=False, repr=False, compare=False)
+    # Cached free-cell mask (also as nested lists) and free-cell list
+    _mask: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _free: Optional[Tuple[Pos, ...]] = field(default=None, init=False, repr=False, compare=False)
+    _rows: Optional[List[List[int]]] = field(default=None, init=False, repr=False, compare=False)
+
+    def frozen(self) -> Grid:
+        """Copy of this grid whose obstacles can't be edited (add_rect_obstacle or obstacles.add raise)"""
+        return Grid(self.width, self.height, frozenset(self.obstacles), self.diag)
 
     @classmethod
     def empty(cls, w: int, h: int):
@@ -24,20 +65,60 @@ class Grid:
         return p not in self.obstacles
 
     def neighbors(self, p: Pos) -> Iterable[Pos]:
+        # Bounds and free-cell tests read the cached mask (as nested lists): no tuple hashing
         x,y = p
-        steps4 = [(1,0),(-1,0),(0,1),(0,-1)]
-        steps8 = steps4 + [(1,1),(1,-1),(-1,1),(-1,-1)]
-        steps = steps8 if self.diag else steps4
+        w, h = self.width, self.height
+        free = self._free_rows()
+        steps = STEPS8 if self.diag else STEPS4
         for dx,dy in steps:
-            q = (x+dx, y+dy)
-            if self.in_bounds(q) and self.passable(q):
-                yield q
+            qx, qy = x+dx, y+dy
+            if 0 <= qx < w and 0 <= qy < h and free[qx][qy]:
+                yield (qx, qy)
+
+    def adjacency(self) -> Adjacency:
+        """Neighbors by cell, shared by every search on this grid.
+
+        Rebuilt when diag changes or after clear_caches().
+        """
+        if self._adjacency is None or self._adjacency_diag != self.diag:
+            self._adjacency = Adjacency(self)
+            self._adjacency_diag = self.diag
+        return self._adjacency
+
+    def free_mask(self) -> np.ndarray:
+        """uint8 array of shape (width, height): 1 for free cells, 0 for obstacles.
+
+        Rebuilt after clear_caches().
+        """
+        if self._mask is None:
+            mask = np.ones((self.width, self.height), dtype=np.uint8)
+            inside = [p for p in self.obstacles if self.in_bounds(p)]
+            if inside:
+                xs, ys = zip(*inside)
+                mask[xs, ys] = 0
+            self._mask = mask
+            self._free = tuple(map(tuple, np.argwhere(mask).tolist()))
+            self._rows = mask.tolist()
+        return self._mask
+
+    def _free_rows(self) -> List[List[int]]:
+        """free_mask() as nested lists, rows[x][y]: plain list indexing is faster than numpy's per element"""
+        self.free_mask()
+        return self._rows
 
     def free_cells(self) -> List[Pos]:
-        return [(x,y) for x in range(self.width) for y in range(self.height) if self.passable((x,y))]
+        # argwhere walks the (x, y) mask in x-major order, as the nested loop over x then y did
+        self.free_mask()
+        return list(self._free)
 
     def add_rect_obstacle(self, x0:int, y0:int, x1:int, y1:int):
         for x in range(x0, x1+1):
             for y in range(y0, y1+1):
                 if self.in_bounds((x,y)):
                     self.obstacles.add((x,y))
+        self.clear_caches()
+
+    def clear_caches(self):
+        """Drop the cached adjacency and free-cell mask; call after editing obstacles in place"""
+        self._adjacency = None
+        self._mask = None
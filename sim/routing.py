@@ -1,14 +1,31 @@
 from __future__ import annotations
-from typing import Tuple, Dict, List, Optional, Callable
+from typing import Tuple, Dict, List, Optional, Callable, Iterable
 import heapq, math
-from .grid import Grid, Pos
+from .grid import Grid, Pos, DIAG_COST
+
+INF = float('inf')
 
 def manhattan(a: Pos, b: Pos) -> int:
     return abs(a[0]-b[0]) + abs(a[1]-b[1])
 
 def octile(a: Pos, b: Pos) -> float:
     dx, dy = abs(a[0]-b[0]), abs(a[1]-b[1])
-    return (dx + dy) + (1.4142 - 2) * min(dx, dy)
+    return (dx + dy) + (DIAG_COST - 2) * min(dx, dy)
+
+def manhattan_to(goal: Pos) -> Callable[[Pos], int]:
+    """manhattan(p, goal) as a function of p, with the goal coordinates unpacked once"""
+    gx, gy = goal
+    def h(p: Pos) -> int:
+        return abs(p[0]-gx) + abs(p[1]-gy)
+    return h
+
+def octile_to(goal: Pos) -> Callable[[Pos], float]:
+    """octile(p, goal) as a function of p, with the goal coordinates unpacked once"""
+    gx, gy = goal
+    def h(p: Pos) -> float:
+        dx, dy = abs(p[0]-gx), abs(p[1]-gy)
+        return (dx + dy) + (DIAG_COST - 2) * min(dx, dy)
+    return h
 
 def reconstruct_path(came_from: Dict[Pos, Pos], start: Pos, goal: Pos) -> List[Pos]:
     cur = goal
@@ -24,9 +41,11 @@ def dijkstra(grid: Grid, start: Pos, goal: Pos) -> Tuple[List[Pos], float, int]:
     dist = {start: 0}
     prev = {}
     nodes_expanded = 0
+    # Hot-loop callables bound to locals; neighbors come with their move costs
+    heappop, heappush, neighbors, get_dist = heapq.heappop, heapq.heappush, grid.adjacency().weighted.__getitem__, dist.get
     
     while pq:
-        d, u = heapq.heappop(pq)
+        d, u = heappop(pq)
         nodes_expanded += 1
         
         if u == goal:
@@ -34,30 +53,68 @@ def dijkstra(grid: Grid, start: Pos, goal: Pos) -> Tuple[List[Pos], float, int]:
         if d != dist[u]:
             continue
             
-        for v in grid.neighbors(u):
-            w = 1.0 if (v[0]==u[0] or v[1]==u[1]) else 1.4142
+        for v, w in neighbors(u):
             nd = d + w
-            if nd < dist.get(v, float('inf')):
+            if nd < get_dist(v, INF):
                 dist[v] = nd
                 prev[v] = u
-                heapq.heappush(pq, (nd, v))
+                heappush(pq, (nd, v))
                 
     if goal not in dist: 
-        return [], float('inf'), nodes_expanded
+        return [], INF, nodes_expanded
     return reconstruct_path(prev, start, goal), dist[goal], nodes_expanded
 
+def distance_field(grid: Grid, source: Pos, targets: Optional[Iterable[Pos]] = None) -> Dict[Pos, float]:
+    """Shortest-path cost from source to every reachable cell, from one full Dijkstra.
+
+    Moves cost the same both ways, so this is also each cell's cost to source: searches from
+    many cells towards one goal can all read their cost from the goal's field.
+    With `targets`, the search stops once all of them are settled; other cells may then be
+    missing or hold costs that are not yet final.
+    """
+    pq = [(0, source)]
+    dist = {source: 0}
+    heappop, heappush, neighbors, get_dist = heapq.heappop, heapq.heappush, grid.adjacency().weighted.__getitem__, dist.get
+    remaining = set(targets) if targets is not None else None
+    
+    while pq:
+        d, u = heappop(pq)
+        if d != dist[u]:
+            continue
+        if remaining is not None:
+            remaining.discard(u)
+            if not remaining:
+                break
+            
+        for v, w in neighbors(u):
+            nd = d + w
+            if nd < get_dist(v, INF):
+                dist[v] = nd
+                heappush(pq, (nd, v))
+                
+    return dist
+
 def astar(grid: Grid, start: Pos, goal: Pos, heuristic=None, 
           diag_allowed: bool = True) -> Tuple[List[Pos], float, int]:
+    # Already there: the search would expand only the start
+    if start == goal:
+        return [start], 0, 1
+    
+    # Heuristic of a node to this search's fixed goal
     if heuristic is None:
-        heuristic = octile if diag_allowed else manhattan
+        h = (octile_to if diag_allowed else manhattan_to)(goal)
+    else:
+        h = lambda p: heuristic(p, goal)
         
-    pq = [(0 + heuristic(start, goal), 0, start)]
+    pq = [(0 + h(start), 0, start)]
     dist = {start: 0}
     prev = {}
     nodes_expanded = 0
+    # Hot-loop callables bound to locals; neighbors come with their move costs
+    heappop, heappush, neighbors, get_dist = heapq.heappop, heapq.heappush, grid.adjacency().weighted.__getitem__, dist.get
     
     while pq:
-        f, g, u = heapq.heappop(pq)
+        f, g, u = heappop(pq)
         nodes_expanded += 1
         
         if u == goal: 
@@ -65,14 +122,13 @@ def astar(grid: Grid, start: Pos, goal: Pos, heuristic=None,
         if g != dist[u]: 
             continue
             
-        for v in grid.neighbors(u):
-            w = 1.0 if (v[0]==u[0] or v[1]==u[1]) else 1.4142
+        for v, w in neighbors(u):
             ng = g + w
-            if ng < dist.get(v, float('inf')):
+            if ng < get_dist(v, INF):
                 dist[v] = ng
                 prev[v] = u
-                heapq.heappush(pq, (ng + heuristic(v, goal), ng, v))
+                heappush(pq, (ng + h(v), ng, v))
                 
     if goal not in dist: 
-        return [], float('inf'), nodes_expanded
+        return [], INF, nodes_expanded
     return reconstruct_path(prev, start, goal), dist[goal], nodes_expanded
\ No newline at end of file
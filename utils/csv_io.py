@@ -0,0 +1,137 @@
+"""
+CSV loading helpers shared by the result/table generators
+"""
+
+import csv
+import os
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pacsv
+except ImportError:  # pyarrow is optional; fall back to csv.DictReader / pandas.read_csv
+    pa = None
+
+# Rows per chunk when pandas parses a file that is filtered by algo
+_CHUNK_ROWS = 100_000
+
+
+def read_rows(csv_file: str, algos: Optional[Iterable[str]] = None) -> List[Dict[str, str]]:
+    """Read CSV rows as dicts of strings, optionally keeping only rows whose algo is in `algos`.
+
+    When pyarrow is installed, the file is memory-mapped and parsed with its multithreaded
+    reader, filtering on the algo column before any rows are materialized. Columns stay
+    strings so rows match csv.DictReader output exactly. Files pyarrow rejects, such as one
+    whose last row was cut short by an interrupted run, are read with csv.DictReader.
+    """
+    if pa is None:
+        return _read_rows_csv(csv_file, algos)
+
+    header = _read_header(csv_file)
+    if not header:
+        return []
+    try:
+        with pa.memory_map(csv_file) as source:
+            table = pacsv.read_csv(
+                source,
+                convert_options=pacsv.ConvertOptions(column_types={name: pa.string() for name in header}),
+            )
+    except pa.ArrowInvalid:
+        return _read_rows_csv(csv_file, algos)
+    if algos is not None:
+        if "algo" not in table.column_names:
+            return []
+        table = _filter_algos(table, algos)
+    return table.to_pylist()
+
+
+def _read_rows_csv(csv_file: str, algos: Optional[Iterable[str]]) -> List[Dict[str, str]]:
+    """read_rows without pyarrow: short rows are padded with None, as csv.DictReader does"""
+    with open(csv_file, "r", newline="") as f:
+        reader = csv.DictReader(f)
+        if algos is None:
+            return list(reader)
+        algos = frozenset(algos)
+        return [row for row in reader if row.get("algo", "") in algos]
+
+
+def _read_header(csv_file: str) -> List[str]:
+    with open(csv_file, "r", newline="") as f:
+        return next(csv.reader(f), None) or []
+
+
+def _filter_algos(table, algos: Iterable[str]):
+    """Rows of an Arrow table whose algo is in `algos`."""
+    algo = table["algo"].cast(pa.string())
+    return table.filter(pc.is_in(algo, value_set=pa.array(sorted(algos), pa.string())))
+
+
+def read_frame(csv_file: str, text_columns: Iterable[str] = (), usecols: Optional[Iterable[str]] = None,
+               algos: Optional[Iterable[str]] = None) -> "pd.DataFrame":
+    """Load a CSV into a DataFrame, parsing with pyarrow when installed.
+
+    `text_columns` are kept as strings (blank cells become NaN); other columns are type-inferred.
+    `usecols` limits parsing to those columns; any that are missing from the file are skipped.
+    `algos`, if given, keeps only rows whose algo is exactly one of them (no rows if the file
+    has no algo column); with pyarrow the filter runs before conversion to pandas, without it
+    the file is parsed in chunks that are filtered as they are read, so rows for other
+    algorithms are never all held at once. Files pyarrow rejects (e.g. a truncated last row)
+    are parsed the pandas way too.
+
+    An empty (0-byte) file reads as an empty frame with the requested columns.
+    """
+    # Imported here so read_rows (and generate_multi_depot_results) work without pandas
+    import pandas as pd
+
+    if os.stat(csv_file).st_size == 0:
+        return pd.DataFrame(columns=list(usecols if usecols is not None else text_columns))
+    text_columns = tuple(text_columns)
+    if usecols is not None:
+        usecols = tuple(usecols)
+    if pa is None:
+        return _read_frame_pandas(csv_file, text_columns, usecols, algos)
+    include = None
+    if usecols is not None:
+        header = frozenset(_read_header(csv_file))
+        include = [name for name in usecols if name in header]
+    try:
+        with pa.memory_map(csv_file) as source:
+            table = pacsv.read_csv(
+                source,
+                convert_options=pacsv.ConvertOptions(
+                    column_types={name: pa.string() for name in text_columns},
+                    strings_can_be_null=True,
+                    include_columns=include,
+                ),
+            )
+    except pa.ArrowInvalid:
+        # e.g. a last row cut short by an interrupted run; pandas pads it with NaN
+        return _read_frame_pandas(csv_file, text_columns, usecols, algos)
+    if algos is not None:
+        table = _filter_algos(table, algos) if "algo" in table.column_names else table.slice(0, 0)
+    return table.to_pandas()
+
+
+def _read_frame_pandas(csv_file: str, text_columns: tuple, usecols: Optional[tuple],
+                       algos: Optional[Iterable[str]]) -> "pd.DataFrame":
+    """read_frame with pandas.read_csv, in chunks when filtering by algo"""
+    import pandas as pd
+
+    if usecols is not None:
+        wanted = frozenset(usecols)
+        usecols = lambda name: name in wanted
+    dtype = {name: str for name in text_columns}
+    if algos is None:
+        return pd.read_csv(csv_file, usecols=usecols, dtype=dtype)
+    algos = frozenset(algos)
+    kept = []
+    with pd.read_csv(csv_file, usecols=usecols, dtype=dtype, chunksize=_CHUNK_ROWS) as chunks:
+        for chunk in chunks:
+            if "algo" not in chunk.columns:
+                return chunk.iloc[0:0]
+            kept.append(chunk[chunk["algo"].isin(algos)])
+    return pd.concat(kept)
@@ -11,6 +11,8 @@ import csv
 from typing import Dict, List
 from collections import defaultdict
 import numpy as np
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 
 ALGOS = ["GA", "HybridNN2opt", "NN2opt"]
@@ -8,6 +8,8 @@ import os
 import csv
 from typing import Dict, List
 from collections import defaultdict
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import numpy as np
 
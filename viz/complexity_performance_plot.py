@@ -9,6 +9,8 @@ import os
 import csv
 from typing import Dict, List, Tuple
 from collections import defaultdict
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import numpy as np
 
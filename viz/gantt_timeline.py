@@ -6,6 +6,8 @@ Components: Project list, duration, milestones, dependencies.
 All labels are placed to the right of each bar (nothing inside bars).
 """
 
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 from datetime import datetime
 import os
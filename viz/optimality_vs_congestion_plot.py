@@ -10,6 +10,8 @@ import csv
 from typing import Dict, List
 from collections import defaultdict
 import numpy as np
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 
 # Congestion level (%) on x-axis
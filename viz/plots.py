@@ -1,11 +1,20 @@
 
 from __future__ import annotations
 import argparse, os, pandas as pd
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 
+from utils.csv_io import read_frame
+
+def algo_summary(summary_csv: str) -> pd.DataFrame:
+    """Mean opt rate and median plan time per algo, from one groupby over the summary."""
+    df = read_frame(summary_csv, usecols=('algo', 'opt_rate_pct', 'plan_time_ms'))
+    return df.groupby('algo').agg(y=('opt_rate_pct','mean'),
+                                  x=('plan_time_ms','median'))
+
 def plot_bar(summary_csv: str, save_to: str):
-    df = pd.read_csv(summary_csv)
-    m = (df.groupby('algo')['opt_rate_pct'].mean().sort_values())
+    m = algo_summary(summary_csv)['y'].sort_values()
     plt.figure(figsize=(8,5))
     m.plot(kind='barh')
     plt.xlabel('Optimize Rate (%)')
@@ -16,9 +25,7 @@ def plot_bar(summary_csv: str, save_to: str):
 
 def plot_complexity(summary_csv: str, save_to: str):
     # minimal placeholder scatter: use plan_time_ms percentile as X
-    df = pd.read_csv(summary_csv)
-    g = df.groupby('algo').agg(y=('opt_rate_pct','mean'),
-                               x=('plan_time_ms','median'))
+    g = algo_summary(summary_csv)
     plt.figure(figsize=(6,5))
     plt.scatter(g['x'], g['y'])
     for name,(x,y) in g.iterrows():
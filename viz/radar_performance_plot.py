@@ -7,6 +7,8 @@ from __future__ import annotations
 import argparse
 import os
 import numpy as np
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 from typing import List
 
@@ -59,11 +61,12 @@ def plot_radar(
 
     fig, ax = plt.subplots(figsize=(9, 9), subplot_kw=dict(projection="polar"))
 
-    for algo in algos:
-        scores = ALGO_RADAR_SCORES.get(algo)
-        if scores is None:
-            continue
-        values = np.array(scores + [scores[0]])
+    # One row of scores per plotted algorithm, each polygon closed back to its first metric
+    algos = [a for a in algos if a in ALGO_RADAR_SCORES]
+    scores = np.array([ALGO_RADAR_SCORES[a] for a in algos], dtype=float).reshape(len(algos), n_metrics)
+    closed = np.concatenate((scores, scores[:, :1]), axis=1)
+
+    for algo, values in zip(algos, closed):
         color = ALGO_COLORS.get(algo, "#95a5a6")
         ax.plot(angles, values, "o-", linewidth=2, label=algo, color=color)
         ax.fill(angles, values, alpha=0.15, color=color)